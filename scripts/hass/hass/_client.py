@@ -14,6 +14,7 @@ import click
 from homeassistant_api import Client
 
 from hass._errors import HassError, die
+from hass._profile import span
 
 DEFAULT_LIMIT = 20
 
@@ -141,8 +142,11 @@ async def _ws_call(handler: WsHandler) -> Any:
             nonlocal msg_id
             msg_id += 1
             payload["id"] = msg_id
-            await ws.send_json(payload)
-            return await ws.receive_json()
+            with span("ws", payload.get("type", "?")) as rec:
+                await ws.send_json(payload)
+                response = await ws.receive_json()
+                rec["exit"] = "ok" if response.get("success", True) else "err"
+            return response
 
         return await handler(send)
 
@@ -5,13 +5,42 @@ from __future__ import annotations
 import click
 
 from hass._click import AutoGroup
+from hass._profile import profile_options
+
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with hass._click.manifest_for after adding commands.
+_COMMANDS = {
+    "activity": "hass.activity:cli",
+    "area": "hass.area:cli",
+    "attributes": "hass.attributes:cli",
+    "call": "hass.call:cli",
+    "config": "hass.config:cli",
+    "dashboard": "hass.dashboard:cli",
+    "device": "hass.device:cli",
+    "edit": "hass.edit:cli",
+    "energy": "hass.energy:cli",
+    "entity": "hass.entity:cli",
+    "history": "hass.history:cli",
+    "info": "hass.info:cli",
+    "integration": "hass.integration:cli",
+    "logs": "hass.logs:cli",
+    "orient": "hass.orient:cli",
+    "raw": "hass.raw:cli",
+    "repairs": "hass.repairs:cli",
+    "services": "hass.services:cli",
+    "states": "hass.states:cli",
+    "template": "hass.template:cli",
+    "trigger": "hass.trigger:cli",
+}
 
 
 @click.group(
     cls=AutoGroup,
     package="hass",
+    commands=_COMMANDS,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 @click.version_option(version=__import__("hass").__version__, prog_name="hass")
+@profile_options
 def cli():
     """Home Assistant API wrapper."""
@@ -0,0 +1,363 @@
+"""Stand-in for kubectl, talosctl and ceph that replays generated fixtures.
+
+Invoked through small shims as ``fake_cli.py <tool> <args...>``. Every call
+is appended to $BENCH_LOG and sleeps for a latency modelled on a real API
+server: a fixed round trip plus a per-item cost for list responses.
+`kubectl exec ... -- curl URL` is forwarded to the fake HTTP server at
+$BENCH_HTTP, which is how hops reaches VictoriaMetrics and VictoriaLogs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import time
+import urllib.request
+from urllib.parse import urlsplit
+
+FIXTURES = os.environ.get("BENCH_FIXTURES", "")
+LATENCY = float(os.environ.get("BENCH_LATENCY_MS", "60")) / 1000
+PER_ITEM = float(os.environ.get("BENCH_ITEM_US", "50")) / 1_000_000
+
+ALIASES = {
+    "po": "pods",
+    "pod": "pods",
+    "deploy": "deployments",
+    "deployment": "deployments",
+    "sts": "statefulsets",
+    "statefulset": "statefulsets",
+    "ds": "daemonsets",
+    "daemonset": "daemonsets",
+    "rs": "replicasets",
+    "replicaset": "replicasets",
+    "svc": "services",
+    "service": "services",
+    "ep": "endpoints",
+    "pvc": "persistentvolumeclaims",
+    "persistentvolumeclaim": "persistentvolumeclaims",
+    "ev": "events",
+    "event": "events",
+    "no": "nodes",
+    "node": "nodes",
+    "ks": "kustomizations",
+    "kustomization": "kustomizations",
+    "hr": "helmreleases",
+    "helmrelease": "helmreleases",
+    "httproute": "httproutes",
+}
+
+
+def _resource(name: str) -> str:
+    name = name.lower().split(".", 1)[0]
+    if name in ALIASES:
+        return ALIASES[name]
+    return name if name.endswith("s") else f"{name}s"
+
+
+def _load(resource: str) -> list[dict]:
+    path = os.path.join(FIXTURES, f"{resource}.json")
+    try:
+        with open(path) as fh:
+            return json.load(fh)["items"]
+    except FileNotFoundError:
+        return []
+
+
+def _lookup(obj: dict, dotted: str):
+    for part in dotted.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(part)
+    return obj
+
+
+def _label_match(labels: dict, selector: str) -> bool:
+    for term in filter(None, selector.split(",")):
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            if labels.get(key) == value:
+                return False
+        elif "=" in term:
+            key, value = term.replace("==", "=").split("=", 1)
+            if labels.get(key) != value:
+                return False
+        elif term.startswith("!"):
+            if term[1:] in labels:
+                return False
+        elif term not in labels:
+            return False
+    return True
+
+
+def _field_match(item: dict, selector: str) -> bool:
+    for term in filter(None, selector.split(",")):
+        negate = "!=" in term
+        key, value = term.replace("==", "=").split("!=" if negate else "=", 1)
+        actual = _lookup(item, key)
+        if (str(actual) == value) == negate:
+            return False
+    return True
+
+
+def _path(obj, path: str) -> list:
+    values = [obj]
+    for part in filter(None, re.split(r"\.(?![^\[]*\])", path)):
+        key, _, index = part.partition("[")
+        nxt = []
+        for value in values:
+            value = value.get(key) if key and isinstance(value, dict) else value
+            if value is None:
+                continue
+            if index and isinstance(value, list):
+                nxt.extend(value if index == "*]" else value[int(index[:-1]) :][:1])
+            elif not index:
+                nxt.append(value)
+        values = nxt
+    return values
+
+
+def _jsonpath(template: str, data) -> str:
+    """Render the subset of kubectl jsonpath hops emits (paths, range, literals)."""
+    tokens = re.findall(r"\{([^{}]*)\}|([^{}]+)", template)
+
+    def render(pos: int, current) -> tuple[str, int]:
+        out = []
+        while pos < len(tokens):
+            expr, text = tokens[pos]
+            pos += 1
+            if text:
+                out.append(text)
+            elif expr == "end":
+                return "".join(out), pos
+            elif expr.startswith("range "):
+                end = pos
+                for item in _path(current, expr[6:].strip()):
+                    body, end = render(pos, item)
+                    out.append(body)
+                pos = end if end > pos else _skip(pos)
+            elif expr.startswith('"'):
+                out.append(expr[1:-1].encode().decode("unicode_escape"))
+            else:
+                out.append(" ".join(_scalar(v) for v in _path(current, expr)))
+        return "".join(out), pos
+
+    def _skip(pos: int) -> int:
+        depth = 1
+        while depth:
+            expr = tokens[pos][0]
+            depth += expr.startswith("range ") - (expr == "end")
+            pos += 1
+        return pos
+
+    return render(0, data)[0]
+
+
+def _scalar(value) -> str:
+    if isinstance(value, bool):
+        return str(value).lower()
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def _parse(args: list[str]) -> tuple[list[str], dict[str, str]]:
+    positional, flags = [], {}
+    value_flags = {
+        "-n": "namespace",
+        "--namespace": "namespace",
+        "-l": "selector",
+        "--selector": "selector",
+        "--field-selector": "fields",
+        "-o": "output",
+        "--output": "output",
+        "-c": "container",
+        "--container": "container",
+    }
+    it = iter(args)
+    for arg in it:
+        if arg in value_flags:
+            flags[value_flags[arg]] = next(it, "")
+        elif arg.startswith("--") and "=" in arg:
+            key, value = arg[2:].split("=", 1)
+            key = {"field-selector": "fields"}.get(key, key)
+            flags[key] = value
+        elif arg in ("-A", "--all-namespaces"):
+            flags["all"] = "1"
+        elif arg.startswith("-"):
+            flags[arg.lstrip("-")] = "1"
+        else:
+            positional.append(arg)
+    return positional, flags
+
+
+def _select(resource: str, flags: dict[str, str], name: str | None) -> list[dict]:
+    items = _load(resource)
+    namespace = flags.get("namespace")
+    out = []
+    for item in items:
+        meta = item.get("metadata", {})
+        if namespace and meta.get("namespace") not in (namespace, None):
+            continue
+        if name and meta.get("name") != name:
+            continue
+        if "selector" in flags and not _label_match(
+            meta.get("labels", {}), flags["selector"]
+        ):
+            continue
+        if "fields" in flags and not _field_match(item, flags["fields"]):
+            continue
+        out.append(item)
+    return out
+
+
+def kubectl_get(args: list[str]) -> int:
+    positional, flags = _parse(args)
+    resources = [_resource(r) for r in positional[0].split(",")] if positional else []
+    name = positional[1] if len(positional) > 1 else None
+    items = [i for r in resources for i in _select(r, flags, name)]
+    time.sleep(LATENCY + PER_ITEM * len(items))
+    output = flags.get("output", "")
+    if name and len(resources) == 1:
+        if not items:
+            print(
+                f'Error from server (NotFound): {resources[0]} "{name}" not found',
+                file=sys.stderr,
+            )
+            return 1
+        if output == "name":
+            print(f"{resources[0]}/{name}")
+        else:
+            print(json.dumps(items[0]))
+        return 0
+    if output == "name":
+        for item in items:
+            print(
+                f"{item.get('kind', resources[0]).lower()}/{item['metadata']['name']}"
+            )
+        return 0
+    listing = {"apiVersion": "v1", "kind": "List", "items": items}
+    if output.startswith("jsonpath="):
+        sys.stdout.write(_jsonpath(output[9:], listing))
+        return 0
+    print(json.dumps(listing))
+    return 0
+
+
+def kubectl_top(args: list[str]) -> int:
+    positional, flags = _parse(args)
+    kind = _resource(positional[0]) if positional else "pods"
+    items = _select(kind, flags, None)
+    time.sleep(LATENCY + PER_ITEM * len(items))
+    for n, item in enumerate(items):
+        meta = item["metadata"]
+        cpu, mem = f"{5 + n % 300}m", f"{64 + n % 900}Mi"
+        if kind == "nodes":
+            print(f"{meta['name']} {cpu} 10% {mem} 20%")
+        elif flags.get("all"):
+            print(f"{meta['namespace']} {meta['name']} {cpu} {mem}")
+        else:
+            print(f"{meta['name']} {cpu} {mem}")
+    return 0
+
+
+def kubectl_logs(args: list[str]) -> int:
+    _, flags = _parse(args)
+    time.sleep(LATENCY)
+    if "envoy" in flags.get("selector", ""):
+        routes = _load("httproutes")
+        for n in range(5000):
+            host = routes[n % len(routes)]["spec"]["hostnames"][0] if routes else "x"
+            print(
+                json.dumps(
+                    {
+                        "start_time": f"2026-01-15T11:{n % 60:02d}:{n % 59:02d}.123Z",
+                        ":authority": host,
+                        "method": "GET",
+                        "x-envoy-origin-path": f"/api/items/{n % 40}?page={n % 3}",
+                        "response_code": 200 if n % 11 else 503,
+                        "bytes_sent": 512 + n % 7,
+                        "user-agent": "Mozilla/5.0" if n % 4 else "curl/8.5",
+                    }
+                )
+            )
+        return 0
+    for n in range(200):
+        level = "error" if n % 25 == 0 else "info"
+        print(f'2026-01-15T11:{n % 60:02d}:00Z level={level} msg="request {n} handled"')
+    return 0
+
+
+def curl(args: list[str]) -> int:
+    method, data, url = "GET", None, ""
+    it = iter(args)
+    for arg in it:
+        if arg == "-X":
+            method = next(it, "GET")
+        elif arg == "--data":
+            data = next(it, "")
+        elif arg == "--connect-timeout":
+            next(it, None)
+        elif not arg.startswith("-"):
+            url = arg
+    parts = urlsplit(url)
+    target = f"http://{os.environ['BENCH_HTTP']}{parts.path}"
+    if parts.query:
+        target += f"?{parts.query}"
+    request = urllib.request.Request(
+        target,
+        data=data.encode() if data is not None else None,
+        method=method,
+        headers={"X-Bench-Host": parts.netloc},
+    )
+    with urllib.request.urlopen(request, timeout=30) as resp:
+        sys.stdout.write(resp.read().decode())
+    return 0
+
+
+def ceph(args: list[str]) -> int:
+    time.sleep(LATENCY)
+    print(json.dumps({"health": {"status": "HEALTH_OK", "checks": {}}}))
+    return 0
+
+
+def talosctl(args: list[str]) -> int:
+    time.sleep(LATENCY)
+    for node in _load("nodes"):
+        print(
+            json.dumps({"node": node["metadata"]["name"], "metadata": {}, "spec": {}})
+        )
+    return 0
+
+
+def kubectl(args: list[str]) -> int:
+    verb = args[0] if args else ""
+    if verb == "get":
+        return kubectl_get(args[1:])
+    if verb == "top":
+        return kubectl_top(args[1:])
+    if verb == "logs":
+        return kubectl_logs(args[1:])
+    if verb == "exec":
+        command = args[args.index("--") + 1 :] if "--" in args else []
+        time.sleep(LATENCY)
+        if command[:1] == ["curl"]:
+            return curl(command[1:])
+        if command[:1] == ["ceph"]:
+            return ceph(command[1:])
+        return 0
+    time.sleep(LATENCY)
+    return 0
+
+
+def main() -> int:
+    tool, args = sys.argv[1], sys.argv[2:]
+    log = os.environ.get("BENCH_LOG")
+    if log:
+        with open(log, "a") as fh:
+            fh.write(" ".join([tool, *args[:2]]) + "\n")
+    handler = {"kubectl": kubectl, "ceph": ceph, "talosctl": talosctl}[tool]
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
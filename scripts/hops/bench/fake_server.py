@@ -0,0 +1,235 @@
+"""Fake VictoriaMetrics / vmalert / VictoriaLogs HTTP server.
+
+Responses are synthesized deterministically from the request, shaped like
+the real APIs hops reads. Each request sleeps for a fixed latency and is
+counted per endpoint so the harness can report HTTP calls per command.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+import time
+from collections import Counter
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from urllib.parse import parse_qs, urlsplit
+
+from fixtures import NAMESPACES, NOW
+
+_NOW = NOW.timestamp()
+
+
+def _seconds(value: str | None, default: float) -> float:
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return default
+
+
+def _step(value: str | None) -> float:
+    if not value:
+        return 60.0
+    units = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+    if value[-1] in units:
+        return float(value[:-1]) * units[value[-1]]
+    return float(value)
+
+
+def _series(n: int) -> dict:
+    ns = NAMESPACES[n % len(NAMESPACES)]
+    return {"namespace": ns, "pod": f"app-{n:03d}-0", "container": "app"}
+
+
+def _vm(path: str, params: dict[str, str]) -> dict:
+    if path.endswith("/query_range"):
+        end = _seconds(params.get("end"), _NOW)
+        start = _seconds(params.get("start"), end - 3600)
+        step = max(_step(params.get("step")), (end - start) / 1000 or 1)
+        points = int((end - start) // step) + 1
+        result = [
+            {
+                "metric": _series(s),
+                "values": [
+                    [start + i * step, f"{abs(math.sin(i / 7 + s)) * 0.5:.6f}"]
+                    for i in range(points)
+                ],
+            }
+            for s in range(3)
+        ]
+        return {"status": "success", "data": {"resultType": "matrix", "result": result}}
+    if path.endswith("/query"):
+        result = [
+            {"metric": _series(s), "value": [_NOW, f"{0.1 + s / 100:.4f}"]}
+            for s in range(20)
+        ]
+        return {"status": "success", "data": {"resultType": "vector", "result": result}}
+    if path.endswith("/rules"):
+        groups = [
+            {
+                "name": f"group-{g}",
+                "file": "vmrules",
+                "interval": 30,
+                "rules": [
+                    {
+                        "name": f"Alert{g}x{r}",
+                        "type": "alerting",
+                        "query": "up == 0",
+                        "state": "firing" if (g + r) % 13 == 0 else "inactive",
+                        "health": "ok",
+                        "labels": {"severity": "warning"},
+                        "alerts": [],
+                    }
+                    for r in range(10)
+                ],
+            }
+            for g in range(20)
+        ]
+        return {"status": "success", "data": {"groups": groups}}
+    if path.endswith("/alerts"):
+        alerts = [
+            {
+                "labels": {
+                    "alertname": f"Alert{n}",
+                    "severity": "warning",
+                    **_series(n),
+                },
+                "annotations": {"summary": f"alert {n}"},
+                "state": "firing",
+                "activeAt": "2026-01-15T10:00:00Z",
+                "value": "1",
+            }
+            for n in range(15)
+        ]
+        return {"status": "success", "data": {"alerts": alerts}}
+    if path.endswith("/labels") or "/label/" in path:
+        return {"status": "success", "data": [f"label_{n}" for n in range(200)]}
+    if path.endswith("/series"):
+        return {"status": "success", "data": [_series(n) for n in range(200)]}
+    if path.endswith("/status/tsdb"):
+        top = [{"name": f"metric_{n}", "value": 10_000 - n * 37} for n in range(10)]
+        return {
+            "status": "success",
+            "data": {"totalSeries": 250_000, "seriesCountByMetricName": top},
+        }
+    if path.endswith("/targets"):
+        active = [
+            {
+                "labels": {"job": f"job-{n % 40}", **_series(n)},
+                "scrapePool": f"pool-{n % 40}",
+                "health": "up" if n % 29 else "down",
+                "lastError": "" if n % 29 else "connection refused",
+            }
+            for n in range(400)
+        ]
+        return {"status": "success", "data": {"activeTargets": active}}
+    return {"status": "success", "data": {"resultType": "vector", "result": []}}
+
+
+def _vl(path: str, params: dict[str, str]) -> str:
+    if path.endswith("/query"):
+        limit = int(params.get("limit") or 1000)
+        return "".join(
+            json.dumps(
+                {
+                    "_time": f"2026-01-15T11:{n % 60:02d}:{n % 59:02d}Z",
+                    "_msg": f"request {n} handled",
+                    "_stream": '{app="app-001"}',
+                    "level": "error" if n % 25 == 0 else "info",
+                    "kubernetes.pod_namespace": NAMESPACES[n % len(NAMESPACES)],
+                }
+            )
+            + "\n"
+            for n in range(min(limit, 2000))
+        )
+    if path.endswith("/hits"):
+        ts = [f"2026-01-15T{h:02d}:00:00Z" for h in range(12)]
+        hits = [
+            {
+                "fields": {"app": f"app-{f:03d}"},
+                "timestamps": ts,
+                "values": [f * h for h in range(12)],
+            }
+            for f in range(10)
+        ]
+        return json.dumps({"hits": hits})
+    if path.endswith(("/field_names", "/stream_field_names")):
+        names = ["_msg", "_time", "_stream", "level", "kubernetes.pod_namespace", "app"]
+        return json.dumps({"values": [{"value": n, "hits": 1000} for n in names]})
+    if path.endswith(("/field_values", "/stream_field_values")):
+        return json.dumps(
+            {"values": [{"value": f"v{n}", "hits": 100 - n} for n in range(20)]}
+        )
+    return json.dumps(_vm("/query", params))
+
+
+class FakeServer:
+    """Threaded HTTP server counting requests per endpoint."""
+
+    def __init__(self, latency_ms: float = 20):
+        self.latency = latency_ms / 1000
+        self.counts: Counter[str] = Counter()
+        self._lock = Lock()
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = Thread(target=self._httpd.serve_forever, daemon=True)
+
+    @property
+    def address(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"{host}:{port}"
+
+    def start(self) -> FakeServer:
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+
+    def reset(self) -> Counter[str]:
+        with self._lock:
+            counts, self.counts = self.counts, Counter()
+        return counts
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _respond(self, body: str) -> None:
+                data = body.encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def _serve(self, raw_query: str) -> None:
+                parts = urlsplit(self.path)
+                params = {
+                    k: v[-1] for k, v in parse_qs(f"{parts.query}&{raw_query}").items()
+                }
+                with server._lock:
+                    server.counts[parts.path] += 1
+                time.sleep(server.latency)
+                if parts.path.startswith("/select/logsql"):
+                    self._respond(_vl(parts.path, params))
+                else:
+                    self._respond(json.dumps(_vm(parts.path, params)))
+
+            def do_GET(self) -> None:
+                self._serve("")
+
+            def do_POST(self) -> None:
+                length = int(self.headers.get("Content-Length") or 0)
+                self._serve(self.rfile.read(length).decode())
+
+            def log_message(self, *_args) -> None:
+                pass
+
+        return Handler
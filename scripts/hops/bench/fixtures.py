@@ -0,0 +1,304 @@
+"""Synthetic cluster fixtures at realistic sizes.
+
+Everything is derived from a seeded RNG, so the same sizes always produce
+byte-identical fixtures and results stay comparable across commits. Each
+resource kind is written as one `kubectl get -A -o json` style list.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+NOW = datetime(2026, 1, 15, 12, 0, tzinfo=UTC)
+NAMESPACES = [
+    "default",
+    "media",
+    "home",
+    "network",
+    "observability",
+    "storage",
+    "security",
+    "database",
+    "downloads",
+    "ai",
+]
+NODES = [f"node-{i}" for i in range(1, 7)]
+
+
+def _ts(delta: timedelta) -> str:
+    return (NOW - delta).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _meta(name: str, namespace: str | None, labels: dict | None = None, **extra):
+    meta = {
+        "name": name,
+        "uid": f"uid-{namespace}-{name}",
+        "creationTimestamp": _ts(timedelta(days=30)),
+        "labels": labels or {},
+        **extra,
+    }
+    if namespace:
+        meta["namespace"] = namespace
+    return meta
+
+
+def _owner(kind: str, name: str, namespace: str) -> dict:
+    return {"kind": kind, "name": name, "uid": f"uid-{namespace}-{name}"}
+
+
+def _container(name: str, image: str) -> dict:
+    return {
+        "name": name,
+        "image": image,
+        "ports": [{"name": "http", "containerPort": 8080}],
+        "resources": {
+            "requests": {"cpu": "50m", "memory": "128Mi"},
+            "limits": {"memory": "512Mi"},
+        },
+    }
+
+
+def generate(out: Path, pods: int = 2000, workloads: int = 200, seed: int = 1):
+    """Write fixture lists for every resource kind hops reads into ``out``."""
+    rng = random.Random(seed)
+    out.mkdir(parents=True, exist_ok=True)
+    lists: dict[str, list[dict]] = {}
+
+    def add(resource: str, item: dict):
+        lists.setdefault(resource, []).append(item)
+
+    per_workload = max(1, pods // workloads)
+    for n in range(workloads):
+        app = f"app-{n:03d}"
+        ns = NAMESPACES[n % len(NAMESPACES)]
+        labels = {"app.kubernetes.io/name": app, "app.kubernetes.io/instance": app}
+        kind = (
+            "Deployment" if n % 10 < 8 else "StatefulSet" if n % 10 < 9 else "DaemonSet"
+        )
+        resource = {"Deployment": "deployments", "StatefulSet": "statefulsets"}.get(
+            kind, "daemonsets"
+        )
+        replicas = per_workload
+        ready = replicas if n % 17 else replicas - 1
+        template = {
+            "metadata": {"labels": labels},
+            "spec": {"containers": [_container("app", f"ghcr.io/home/{app}:1.{n}")]},
+        }
+        add(
+            resource,
+            {
+                "apiVersion": "apps/v1",
+                "kind": kind,
+                "metadata": _meta(app, ns, labels, generation=3),
+                "spec": {
+                    "replicas": replicas,
+                    "selector": {"matchLabels": labels},
+                    "template": template,
+                },
+                "status": {
+                    "replicas": replicas,
+                    "readyReplicas": ready,
+                    "availableReplicas": ready,
+                    "updatedReplicas": replicas,
+                    "observedGeneration": 3,
+                    "numberReady": ready,
+                    "desiredNumberScheduled": replicas,
+                },
+            },
+        )
+        owner = _owner(kind, app, ns)
+        if kind == "Deployment":
+            rs = f"{app}-{rng.randrange(16**8):08x}"
+            add(
+                "replicasets",
+                {
+                    "kind": "ReplicaSet",
+                    "metadata": _meta(rs, ns, labels, ownerReferences=[owner]),
+                    "spec": {"replicas": replicas, "template": template},
+                    "status": {"replicas": replicas, "readyReplicas": ready},
+                },
+            )
+            owner = _owner("ReplicaSet", rs, ns)
+
+        for i in range(replicas):
+            pod = (
+                f"{app}-{i}"
+                if kind == "StatefulSet"
+                else f"{app}-{rng.randrange(16**10):010x}"
+            )
+            healthy = i < ready
+            restarts = 0 if healthy else rng.randrange(3, 40)
+            add(
+                "pods",
+                {
+                    "kind": "Pod",
+                    "metadata": _meta(pod, ns, labels, ownerReferences=[owner]),
+                    "spec": {
+                        "nodeName": NODES[(n + i) % len(NODES)],
+                        "containers": template["spec"]["containers"],
+                        "volumes": [
+                            {
+                                "name": "config",
+                                "persistentVolumeClaim": {"claimName": f"{app}-config"},
+                            }
+                        ]
+                        if kind == "StatefulSet"
+                        else [],
+                    },
+                    "status": {
+                        "phase": "Pending" if not healthy and n % 2 else "Running",
+                        "podIP": f"10.42.{n % 250}.{i + 10}",
+                        "startTime": _ts(timedelta(days=2)),
+                        "conditions": [{"type": "Ready", "status": str(healthy)}],
+                        "containerStatuses": [
+                            {
+                                "name": "app",
+                                "ready": healthy,
+                                "restartCount": restarts,
+                                "image": f"ghcr.io/home/{app}:1.{n}",
+                                "state": {
+                                    "running": {"startedAt": _ts(timedelta(hours=5))}
+                                }
+                                if healthy
+                                else {"waiting": {"reason": "CrashLoopBackOff"}},
+                                "lastState": {}
+                                if healthy
+                                else {"terminated": {"reason": "Error", "exitCode": 1}},
+                            }
+                        ],
+                    },
+                },
+            )
+            if not healthy:
+                for reason in ("BackOff", "Unhealthy"):
+                    add(
+                        "events",
+                        {
+                            "kind": "Event",
+                            "metadata": _meta(f"{pod}.{reason.lower()}", ns),
+                            "involvedObject": {
+                                "kind": "Pod",
+                                "name": pod,
+                                "namespace": ns,
+                            },
+                            "type": "Warning",
+                            "reason": reason,
+                            "message": f"{reason} restarting failed container app in pod {pod}",
+                            "count": restarts,
+                            "lastTimestamp": _ts(
+                                timedelta(minutes=rng.randrange(1, 90))
+                            ),
+                        },
+                    )
+
+        add(
+            "services",
+            {
+                "kind": "Service",
+                "metadata": _meta(app, ns, labels),
+                "spec": {
+                    "selector": labels,
+                    "ports": [{"name": "http", "port": 80, "targetPort": "http"}],
+                    "clusterIP": f"10.43.{n % 250}.{n % 200 + 1}",
+                },
+            },
+        )
+        add(
+            "endpoints",
+            {
+                "kind": "Endpoints",
+                "metadata": _meta(app, ns, labels),
+                "subsets": [
+                    {
+                        "addresses": [
+                            {"ip": f"10.42.{n % 250}.{i + 10}"} for i in range(ready)
+                        ],
+                        "ports": [{"name": "http", "port": 8080}],
+                    }
+                ],
+            },
+        )
+        if kind == "StatefulSet":
+            add(
+                "persistentvolumeclaims",
+                {
+                    "kind": "PersistentVolumeClaim",
+                    "metadata": _meta(f"{app}-config", ns, labels),
+                    "spec": {
+                        "storageClassName": "ceph-block",
+                        "resources": {"requests": {"storage": "5Gi"}},
+                    },
+                    "status": {"phase": "Bound", "capacity": {"storage": "5Gi"}},
+                },
+            )
+        add(
+            "httproutes",
+            {
+                "kind": "HTTPRoute",
+                "metadata": _meta(app, ns, labels),
+                "spec": {
+                    "hostnames": [f"{app}.example.com"],
+                    "parentRefs": [{"name": "envoy-external", "namespace": "network"}],
+                    "rules": [{"backendRefs": [{"name": app, "port": 80}]}],
+                },
+            },
+        )
+        ready_cond = {
+            "type": "Ready",
+            "status": "True" if n % 23 else "False",
+            "message": "Applied revision: main@sha1:abc"
+            if n % 23
+            else "install retries exhausted",
+        }
+        add(
+            "kustomizations",
+            {
+                "kind": "Kustomization",
+                "metadata": _meta(app, ns, {}),
+                "spec": {
+                    "path": f"./kubernetes/apps/{ns}/{app}/app",
+                    "targetNamespace": ns,
+                    "sourceRef": {"kind": "GitRepository", "name": "flux-system"},
+                },
+                "status": {
+                    "conditions": [ready_cond],
+                    "lastAppliedRevision": "main@sha1:abc",
+                },
+            },
+        )
+        add(
+            "helmreleases",
+            {
+                "kind": "HelmRelease",
+                "metadata": _meta(app, ns, {}),
+                "spec": {"chartRef": {"kind": "OCIRepository", "name": "app-template"}},
+                "status": {"conditions": [ready_cond], "lastAppliedRevision": "4.2.0"},
+            },
+        )
+
+    for node in NODES:
+        add(
+            "nodes",
+            {
+                "kind": "Node",
+                "metadata": _meta(node, None, {"kubernetes.io/hostname": node}),
+                "status": {
+                    "conditions": [{"type": "Ready", "status": "True"}],
+                    "capacity": {"cpu": "16", "memory": "64Gi"},
+                    "allocatable": {"cpu": "15", "memory": "62Gi"},
+                    "nodeInfo": {"kubeletVersion": "v1.34.1"},
+                },
+            },
+        )
+
+    for resource, items in lists.items():
+        (out / f"{resource}.json").write_text(
+            json.dumps({"apiVersion": "v1", "kind": "List", "items": items})
+        )
+    (out / "manifest.json").write_text(
+        json.dumps({k: len(v) for k, v in sorted(lists.items())}, indent=2)
+    )
+    return {k: len(v) for k, v in lists.items()}
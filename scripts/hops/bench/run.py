@@ -0,0 +1,251 @@
+"""Benchmark hops commands against fake cluster backends.
+
+Usage (from scripts/hops):
+
+    python3 bench/run.py                      # all benchmarks, table output
+    python3 bench/run.py -b diagnose -r 10    # one benchmark, 10 runs
+    python3 bench/run.py --json out.json      # save results for later
+    python3 bench/run.py --compare out.json   # show deltas against a saved run
+
+Each benchmark runs hops in a subprocess with PATH pointing at fake
+kubectl/talosctl/ceph shims (fake_cli.py) and VictoriaMetrics/VictoriaLogs
+requests answered by an in-process fake server (fake_server.py). Fixtures
+are generated from a fixed seed, so results from different commits are
+comparable as long as sizes and latencies match.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+import click
+
+BENCH_DIR = Path(__file__).resolve().parent
+HOPS_DIR = BENCH_DIR.parent
+sys.path.insert(0, str(BENCH_DIR))
+
+from fake_server import FakeServer
+from fixtures import generate
+
+# name -> python arguments; apps and namespaces refer to generated fixtures
+BENCHMARKS: dict[str, list[str]] = {
+    "find_workloads": [
+        "-c",
+        "from hops.core.workload import find_workloads; find_workloads('app-042')",
+    ],
+    "diagnose": ["-m", "hops", "app", "diagnose", "app-042"],
+    "diagnose-all": ["-m", "hops", "app", "diagnose", "-n", "media", "--all"],
+    "app-list": ["-m", "hops", "app", "list"],
+    "query-cpu": ["-m", "hops", "query", "cpu", "ai", "app-009.*", "app"],
+    "query-summary": [
+        "-m",
+        "hops",
+        "query",
+        "query",
+        "up",
+        "--from",
+        "6h",
+        "--summary",
+    ],
+    "flux-status": ["-m", "hops", "flux", "status"],
+    "app-requests": ["-m", "hops", "app", "requests", "app-042"],
+}
+
+TOOLS = ("kubectl", "talosctl", "ceph")
+
+
+def _write_shims(bin_dir: Path) -> None:
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    for tool in TOOLS:
+        shim = bin_dir / tool
+        shim.write_text(
+            f'#!/bin/sh\nexec "{sys.executable}" "{BENCH_DIR / "fake_cli.py"}" '
+            f'{tool} "$@"\n'
+        )
+        shim.chmod(0o755)
+
+
+def _commit() -> str:
+    result = subprocess.run(
+        ["git", "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        cwd=HOPS_DIR,
+        check=False,
+    )
+    return result.stdout.strip() or "unknown"
+
+
+def _run_once(
+    args: list[str], env: dict[str, str], log: Path
+) -> tuple[float, Counter, int, str]:
+    log.write_text("")
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=HOPS_DIR,
+        env=env,
+        check=False,
+    )
+    wall = time.perf_counter() - start
+    calls: Counter[str] = Counter()
+    for line in log.read_text().splitlines():
+        parts = line.split()
+        calls[" ".join(parts[:2])] += 1
+    error = (result.stderr or "").strip().splitlines()
+    return wall, calls, result.returncode, error[-1] if error else ""
+
+
+def _bench(name: str, runs: int, env: dict[str, str], log: Path, server: FakeServer):
+    walls = []
+    calls: Counter[str] = Counter()
+    http: Counter[str] = Counter()
+    exit_code, error = 0, ""
+    for _ in range(runs):
+        server.reset()
+        wall, calls, exit_code, error = _run_once(BENCHMARKS[name], env, log)
+        http = server.reset()
+        walls.append(wall)
+    subprocesses = {
+        tool: sum(n for k, n in calls.items() if k.split()[0] == tool) for tool in TOOLS
+    }
+    return {
+        "wall_median": round(statistics.median(walls), 4),
+        "wall_min": round(min(walls), 4),
+        "runs": runs,
+        "subprocesses": {k: v for k, v in subprocesses.items() if v},
+        "calls": dict(sorted(calls.items())),
+        "http_requests": sum(http.values()),
+        "exit": exit_code,
+        "error": error if exit_code else "",
+    }
+
+
+def _print_table(results: dict[str, dict], baseline: dict[str, dict] | None) -> None:
+    header = f"{'BENCHMARK':<16} {'MEDIAN':>8} {'MIN':>8} {'SUBPROC':>8} {'HTTP':>5}"
+    if baseline:
+        header += f" {'BASE':>8} {'DELTA':>7} {'SUBPROC':>8}"
+    click.echo(header)
+    for name, res in results.items():
+        subproc = sum(res["subprocesses"].values())
+        line = (
+            f"{name:<16} {res['wall_median']:>8.3f} {res['wall_min']:>8.3f} "
+            f"{subproc:>8} {res['http_requests']:>5}"
+        )
+        base = (baseline or {}).get(name)
+        if base:
+            delta = (
+                (res["wall_median"] - base["wall_median"]) / base["wall_median"] * 100
+            )
+            base_sub = sum(base["subprocesses"].values())
+            line += f" {base['wall_median']:>8.3f} {delta:>+6.0f}% {base_sub:>8}"
+        if res["exit"]:
+            line += f"  exit {res['exit']}: {res['error'][:60]}"
+        click.echo(line)
+
+
+@click.command()
+@click.option(
+    "-b",
+    "--bench",
+    "names",
+    multiple=True,
+    type=click.Choice(list(BENCHMARKS)),
+    help="Benchmark to run (repeatable; default all)",
+)
+@click.option(
+    "-r",
+    "--runs",
+    default=5,
+    type=click.IntRange(min=1),
+    help="Runs per benchmark (default: 5)",
+)
+@click.option(
+    "--pods",
+    default=2000,
+    type=click.IntRange(min=1),
+    help="Generated pods (default: 2000)",
+)
+@click.option(
+    "--workloads",
+    default=200,
+    type=click.IntRange(min=1),
+    help="Generated workloads (default: 200)",
+)
+@click.option(
+    "--latency", default=60.0, help="Fake kubectl round trip in ms (default: 60)"
+)
+@click.option(
+    "--http-latency", default=20.0, help="Fake HTTP server latency in ms (default: 20)"
+)
+@click.option(
+    "--json",
+    "json_path",
+    default=None,
+    type=click.Path(dir_okay=False),
+    help="Write results as JSON",
+)
+@click.option(
+    "--compare",
+    default=None,
+    type=click.Path(exists=True, dir_okay=False),
+    help="Baseline JSON to compare against",
+)
+def main(names, runs, pods, workloads, latency, http_latency, json_path, compare):
+    """Benchmark hops commands against fake cluster backends."""
+    baseline = None
+    config = {
+        "pods": pods,
+        "workloads": workloads,
+        "latency_ms": latency,
+        "http_latency_ms": http_latency,
+    }
+    if compare:
+        saved = json.loads(Path(compare).read_text())
+        baseline = saved["results"]
+        if saved.get("config") != config:
+            click.echo(
+                f"warning: baseline config differs: {saved.get('config')}", err=True
+            )
+
+    with tempfile.TemporaryDirectory(prefix="hops-bench-") as tmp:
+        root = Path(tmp)
+        generate(root / "fixtures", pods=pods, workloads=workloads)
+        _write_shims(root / "bin")
+        server = FakeServer(http_latency).start()
+        log = root / "calls.log"
+        env = {
+            **os.environ,
+            "PATH": f"{root / 'bin'}{os.pathsep}{os.environ.get('PATH', '')}",
+            "BENCH_FIXTURES": str(root / "fixtures"),
+            "BENCH_LOG": str(log),
+            "BENCH_HTTP": server.address,
+            "BENCH_LATENCY_MS": str(latency),
+            "XDG_CACHE_HOME": str(root / "cache"),
+        }
+        try:
+            results = {
+                name: _bench(name, runs, env, log, server)
+                for name in (names or BENCHMARKS)
+            }
+        finally:
+            server.stop()
+
+    _print_table(results, baseline)
+    if json_path:
+        payload = {"commit": _commit(), "config": config, "results": results}
+        Path(json_path).write_text(json.dumps(payload, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""Opt-in profiling: a waterfall of subprocess, HTTP and import timings.
+
+Enabled per invocation with the root ``--profile`` flag (waterfall on
+stderr) or ``--profile-json PATH`` (machine-readable, for trend tracking),
+or through the ``<PKG>_PROFILE`` / ``<PKG>_PROFILE_JSON`` environment
+variables. When disabled, ``span`` costs one global lookup.
+
+Recorded calls come from the package's choke points: the subprocess runner,
+``requests`` and ``httpx`` sends, and command-module imports in AutoGroup.
+Startup is reported as the CPU time the process had used when profiling
+began, which covers interpreter boot and the root imports.
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+import click
+
+_PREFIX = __name__.split(".")[0].upper()
+_BAR_WIDTH = 30
+_LABEL_WIDTH = 70
+
+
+class _Session:
+    __slots__ = ("calls", "json_path", "lock", "start", "startup")
+
+    def __init__(self, json_path: str | None):
+        self.json_path = json_path
+        self.calls: list[dict[str, Any]] = []
+        self.lock = threading.Lock()
+        self.start = time.perf_counter()
+        self.startup = time.process_time()
+
+
+_session: _Session | None = None
+
+
+@contextmanager
+def span(
+    kind: str, label: str, argv: list[str] | None = None
+) -> Iterator[dict[str, Any]]:
+    """Time a block; callers may set ``bytes`` and ``exit`` on the yielded dict."""
+    session = _session
+    if session is None:
+        yield {}
+        return
+    record: dict[str, Any] = {
+        "kind": kind,
+        "label": label,
+        "start": time.perf_counter() - session.start,
+        "bytes": None,
+        "exit": None,
+    }
+    if argv is not None:
+        record["argv"] = argv
+    try:
+        yield record
+    finally:
+        record["duration"] = time.perf_counter() - session.start - record["start"]
+        with session.lock:
+            session.calls.append(record)
+
+
+def _enable(ctx: click.Context, json_path: str | None) -> None:
+    global _session
+    if _session is None:
+        _session = _Session(json_path)
+        _instrument_http()
+        ctx.call_on_close(_report)
+    elif json_path:
+        _session.json_path = json_path
+
+
+def _on_profile(ctx: click.Context, _param: click.Parameter, value: bool) -> None:
+    if value:
+        _enable(ctx, None)
+
+
+def _on_profile_json(
+    ctx: click.Context, _param: click.Parameter, value: str | None
+) -> None:
+    if value:
+        _enable(ctx, value)
+
+
+def profile_options(f):
+    """Add ``--profile`` and ``--profile-json`` to a root Click group."""
+    f = click.option(
+        "--profile-json",
+        metavar="PATH",
+        envvar=f"{_PREFIX}_PROFILE_JSON",
+        expose_value=False,
+        is_eager=True,
+        callback=_on_profile_json,
+        help="Write call timings as JSON to PATH ('-' for stderr).",
+    )(f)
+    return click.option(
+        "--profile",
+        is_flag=True,
+        envvar=f"{_PREFIX}_PROFILE",
+        expose_value=False,
+        is_eager=True,
+        callback=_on_profile,
+        help="Print a timing waterfall of external calls to stderr.",
+    )(f)
+
+
+def _instrument_http() -> None:
+    """Wrap requests and httpx sends, where installed, in spans."""
+    try:
+        import requests
+    except ImportError:
+        pass
+    else:
+        send = requests.Session.send
+
+        def requests_send(self, request, **kwargs):
+            with span("http", f"{request.method} {request.url}") as rec:
+                response = send(self, request, **kwargs)
+                rec["exit"] = response.status_code
+                rec["bytes"] = int(response.headers.get("content-length") or 0)
+                return response
+
+        requests.Session.send = requests_send
+
+    try:
+        import httpx
+    except ImportError:
+        pass
+    else:
+        async_send = httpx.AsyncClient.send
+
+        async def httpx_send(self, request, **kwargs):
+            with span("http", f"{request.method} {request.url}") as rec:
+                response = await async_send(self, request, **kwargs)
+                rec["exit"] = response.status_code
+                rec["bytes"] = int(response.headers.get("content-length") or 0)
+                return response
+
+        httpx.AsyncClient.send = httpx_send
+
+
+def _report() -> None:
+    session = _session
+    if session is None:
+        return
+    wall = time.perf_counter() - session.start
+    calls = sorted(session.calls, key=lambda c: c["start"])
+    if session.json_path:
+        payload = {
+            "argv": sys.argv[1:],
+            "wall": round(wall, 6),
+            "startup": round(session.startup, 6),
+            "calls": calls,
+        }
+        text = json.dumps(payload, indent=2)
+        if session.json_path == "-":
+            click.echo(text, err=True)
+        else:
+            with open(session.json_path, "w") as fh:
+                fh.write(text + "\n")
+        return
+    _waterfall(calls, wall, session.startup)
+
+
+def _echo(line: str) -> None:
+    click.echo(line, err=True)
+
+
+def _waterfall(calls: list[dict[str, Any]], wall: float, startup: float) -> None:
+    busy: dict[str, float] = {}
+    for call in calls:
+        busy[call["kind"]] = busy.get(call["kind"], 0.0) + call["duration"]
+    totals = "  ".join(f"{k} {v:.3f}s" for k, v in sorted(busy.items()))
+    _echo("")
+    _echo(f"profile: {len(calls)} calls  wall {wall:.3f}s  startup {startup:.3f}s")
+    if totals:
+        _echo(f"  {totals}")
+    if not calls:
+        return
+    scale = _BAR_WIDTH / wall if wall > 0 else 0
+    _echo(
+        f"  {'START':>7} {'DUR':>7} {'EXIT':>4} {'BYTES':>8}  {'KIND':<6} "
+        f"{'TIMELINE':<{_BAR_WIDTH}} CALL"
+    )
+    for call in calls:
+        offset = int(call["start"] * scale)
+        length = max(1, int(call["duration"] * scale))
+        bar = (" " * offset + "#" * length)[:_BAR_WIDTH].ljust(_BAR_WIDTH)
+        exit_code = "-" if call["exit"] is None else str(call["exit"])
+        size = "-" if call["bytes"] is None else str(call["bytes"])
+        label = call["label"]
+        if len(label) > _LABEL_WIDTH:
+            label = label[: _LABEL_WIDTH - 3] + "..."
+        _echo(
+            f"  {call['start']:7.3f} {call['duration']:7.3f} {exit_code:>4} "
+            f"{size:>8}  {call['kind']:<6} {bar} {label}"
+        )
@@ -6,7 +6,26 @@ import click
 
 from hops._click import AutoGroup
 
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with hops._click.manifest_for after adding commands.
+_COMMANDS = {
+    "addr": "hops.app.endpoints:addr",
+    "cat": "hops.app.commands:cat_file",
+    "diagnose": "hops.app.commands:diagnose",
+    "du": "hops.app.commands:du_path",
+    "events": "hops.app.health:events",
+    "list": "hops.app.cluster:list_apps",
+    "logs": "hops.app.commands:logs",
+    "ls": "hops.app.commands:ls_path",
+    "pod": "hops.app.commands:pod_detail",
+    "requests": "hops.app.requests:requests",
+    "resources": "hops.app.cluster:resources",
+    "secrets": "hops.app.cluster:secrets",
+    "types": "hops.app.cluster:types",
+    "unhealthy": "hops.app.health:unhealthy",
+}
 
-@click.group(cls=AutoGroup, package="hops.app")
+
+@click.group(cls=AutoGroup, package="hops.app", commands=_COMMANDS)
 def cli():
     """Application listing, logs, and diagnostics."""
@@ -0,0 +1,257 @@
+"""Multi-app diagnose: one fetch per resource type, ranked findings.
+
+`app diagnose` with several names, --all or --selector lands here instead of
+running the single-app workflow once per app. Workloads, pods, warning
+events and the Flux inventory are fetched once for the whole scope and
+indexed; each app is then scored from those indexes, and details are
+printed only for apps that need attention.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from hops.app.cluster import SYSTEM_NS
+from hops.app.events import compact_event_message
+from hops.core.events import EventIndex, EventInfo, fetch_events
+from hops.core.flux import (
+    HELMRELEASE,
+    KUSTOMIZATION,
+    FluxInventory,
+    inventory,
+    ready_condition,
+)
+from hops.core.format import info, section, table, truncate
+from hops.core.model import PodInfo, WorkloadInfo
+from hops.core.runner import gather
+from hops.core.workload import (
+    list_pods,
+    list_workloads,
+    match_workloads,
+    pods_for_workloads,
+)
+
+# Batch scope skips Jobs: finished Job pods are history, not app health
+_KINDS = ("deployments", "statefulsets", "daemonsets", "cronjobs")
+
+# Pod states that are not findings
+_OK_REASONS = ("Running", "Succeeded", "Completed")
+
+# Score weights: Flux failures outrank missing replicas, which outrank
+# individual pod problems, restarts and warning events.
+_FLUX_WEIGHT = 100
+_UNAVAILABLE_WEIGHT = 50
+_POD_WEIGHT = 20
+_MAX_RESTART_SCORE = 50
+_MAX_EVENT_SCORE = 10
+
+
+@dataclass
+class AppReport:
+    """Findings for one app, most severe first."""
+
+    name: str
+    namespace: str
+    workloads: list[WorkloadInfo]
+    pods: list[PodInfo] = field(default_factory=list)
+    events: list[EventInfo] = field(default_factory=list)
+    # None when the Flux inventory could not be fetched
+    flux: list[str] | None = field(default_factory=list)
+    findings: list[str] = field(default_factory=list)
+    score: int = 0
+
+    @property
+    def ready(self) -> str:
+        ready = sum(wl.ready for wl in self.workloads)
+        desired = sum(wl.desired for wl in self.workloads)
+        return f"{ready}/{desired}"
+
+    @property
+    def restarts(self) -> int:
+        return sum(pod.restarts for pod in self.pods)
+
+
+def diagnose_batch(
+    names: tuple[str, ...],
+    namespace: str | None,
+    all_apps: bool,
+    selector: str | None,
+) -> None:
+    """Diagnose many apps from one shared fetch and print a ranked summary."""
+    wl_args = ("-l", selector) if selector else ()
+    workloads, pods, events, inv = gather(
+        lambda: list_workloads(namespace, *wl_args, kinds=_KINDS),
+        lambda: list_pods(namespace),
+        lambda: fetch_events(namespace, exclude=SYSTEM_NS),
+        _flux_inventory,
+    )
+    if not namespace:
+        workloads = [wl for wl in workloads if wl.namespace not in SYSTEM_NS]
+
+    reports, missing = _group_apps(names, workloads, all_apps or bool(selector))
+    if not reports:
+        for name in missing:
+            info(f"not found: {name}")
+        info("error: no apps matched")
+        raise SystemExit(1)
+
+    pods_by_wl = pods_for_workloads(
+        [wl for report in reports for wl in report.workloads], pods
+    )
+    index = EventIndex(events)
+
+    for report in reports:
+        report.pods = [p for wl in report.workloads for p in pods_by_wl[wl]]
+        report.events = index.for_app(
+            report.name, report.namespace, report.workloads, report.pods
+        )
+        report.flux = (
+            _flux_problems(inv, report.name, report.namespace) if inv else None
+        )
+        _score(report)
+
+    _print(reports, missing, namespace)
+
+
+def _group_apps(
+    names: tuple[str, ...], workloads: list[WorkloadInfo], all_apps: bool
+) -> tuple[list[AppReport], list[str]]:
+    """Group workloads into apps by Helm instance label, or by requested name."""
+    reports: dict[tuple[str, str], AppReport] = {}
+    missing: list[str] = []
+    if all_apps:
+        for wl in workloads:
+            app = wl.labels.get("app.kubernetes.io/instance") or wl.name
+            key = (wl.namespace, app)
+            reports.setdefault(key, AppReport(app, wl.namespace, [])).workloads.append(
+                wl
+            )
+    for name in names:
+        matched = match_workloads(name, workloads)
+        if not matched:
+            missing.append(name)
+            continue
+        ns = matched[0].namespace
+        key = (ns, name)
+        report = reports.setdefault(key, AppReport(name, ns, []))
+        report.workloads.extend(
+            wl for wl in matched if wl.namespace == ns and wl not in report.workloads
+        )
+    return list(reports.values()), missing
+
+
+def _flux_inventory() -> FluxInventory | None:
+    """The Flux inventory, or None when it cannot be read.
+
+    Flux CRDs missing or not readable should not cost the workload, pod and
+    event findings, so the fetch is quiet and its failure is reported per app.
+    """
+    try:
+        return inventory(quiet=True)
+    except SystemExit:
+        return None
+
+
+def _flux_problems(inv: FluxInventory, app: str, namespace: str) -> list[str]:
+    problems = []
+    for kind, namespaces in (
+        (KUSTOMIZATION, (namespace, "flux-system")),
+        (HELMRELEASE, (namespace,)),
+    ):
+        item = inv.get(kind, app, *namespaces)
+        if item is None:
+            continue
+        cond = ready_condition(item)
+        if cond is None:
+            problems.append(f"{kind} {app}: no Ready condition")
+        elif cond.get("status") != "True":
+            msg = compact_event_message(cond.get("message", "Not Ready"))
+            problems.append(f"{kind} {app}: {truncate(msg, 100)}")
+    return problems
+
+
+def _score(report: AppReport) -> None:
+    findings: list[tuple[int, str]] = []
+    for problem in report.flux or []:
+        findings.append((_FLUX_WEIGHT, f"flux: {problem}"))
+    for wl in report.workloads:
+        if wl.desired and wl.ready < wl.desired:
+            missing = wl.desired - wl.ready
+            findings.append(
+                (
+                    _UNAVAILABLE_WEIGHT + 5 * missing,
+                    f"{wl.name}: {wl.ready}/{wl.desired} ready",
+                )
+            )
+    for pod in report.pods:
+        reason = pod.status_reason()
+        if reason not in _OK_REASONS:
+            findings.append((_POD_WEIGHT, f"pod {pod.name}: {reason}"))
+    restarts = report.restarts
+    if restarts:
+        findings.append(
+            (min(restarts, _MAX_RESTART_SCORE), f"{restarts} container restarts")
+        )
+    warnings = sum(e.count for e in report.events)
+    if warnings:
+        findings.append((min(warnings, _MAX_EVENT_SCORE), f"{warnings} warning events"))
+
+    findings.sort(key=lambda f: -f[0])
+    report.score = sum(score for score, _ in findings)
+    report.findings = [text for _, text in findings]
+
+
+def _print(reports: list[AppReport], missing: list[str], namespace: str | None):
+    reports.sort(key=lambda r: (-r.score, r.namespace, r.name))
+    attention = [r for r in reports if r.score]
+    healthy = [r for r in reports if not r.score]
+    scope = namespace or "all namespaces"
+    section(f"SUMMARY ({scope}: {len(reports)} apps, {len(attention)} need attention)")
+    if attention:
+        table(
+            ["RANK", "APP", "NAMESPACE", "READY", "RESTARTS", "SCORE", "TOP FINDING"],
+            [
+                [
+                    str(rank),
+                    r.name,
+                    r.namespace,
+                    r.ready,
+                    str(r.restarts),
+                    str(r.score),
+                    truncate(r.findings[0], 80),
+                ]
+                for rank, r in enumerate(attention, 1)
+            ],
+        )
+    if healthy:
+        names = ", ".join(r.name for r in healthy)
+        info(f"healthy ({len(healthy)}): {truncate(names, 400)}")
+    if any(r.flux is None for r in reports):
+        info("flux: (unavailable, Flux status not checked)")
+    for name in missing:
+        info(f"not found: {name} (try 'hops app diagnose {name}')")
+
+    for r in attention:
+        section(f"{r.name} ({r.namespace})")
+        for finding in r.findings:
+            info(f"  {finding}")
+        if r.flux is None:
+            info("  flux: (unavailable)")
+        bad = [p for p in r.pods if p.status_reason() not in _OK_REASONS or p.restarts]
+        if bad:
+            info("")
+            table(
+                ["POD", "NODE", "STATUS", "RESTARTS", "AGE"],
+                [
+                    [p.name, p.node or "?", p.status_reason(), str(p.restarts), p.age()]
+                    for p in bad
+                ],
+            )
+        if r.events:
+            info("")
+            # Already deduped oldest first; show the most recent few
+            for e in r.events[-5:]:
+                msg = compact_event_message(e.message)
+                count = f"x{e.count} " if e.count > 1 else ""
+                info(f"  {count}{e.reason} {e.object}: {truncate(msg, 100)}")
+        info(f"  next: hops app diagnose {r.name} -n {r.namespace}")
@@ -1,4 +1,4 @@
-"""Cluster-wide app commands: listing, health, events, and secrets."""
+"""Cluster-wide app commands: listing, secrets, resources and types."""
 
 from __future__ import annotations
 
@@ -10,7 +10,7 @@ from hops.core.runner import kubectl_json, run, run_json
 from hops.core.workload import resolve_app, suggest_near_matches
 
 # Namespaces to skip in list/events when no namespace is specified
-_SYSTEM_NS = frozenset(
+SYSTEM_NS = frozenset(
     {
         "kube-system",
         "kube-node-lease",
@@ -37,7 +37,7 @@ def list_apps(namespace: str | None):
         for item in data.get("items", []):
             meta = item.get("metadata", {})
             ns = meta.get("namespace", "")
-            if not namespace and ns in _SYSTEM_NS:
+            if not namespace and ns in SYSTEM_NS:
                 continue
             name = meta.get("name", "")
             status = item.get("status", {})
@@ -62,96 +62,6 @@ def list_apps(namespace: str | None):
     table(["NAMESPACE", "NAME", "KIND", "READY", "AGE"], rows)
 
 
-@cli.command()
-@click.argument("namespace", required=False)
-def unhealthy(namespace: str | None):
-    """Pods not Running/Succeeded cluster-wide (or in a namespace).
-
-    Quick cluster health check: shows pods stuck in Pending,
-    ContainerCreating, CrashLoopBackOff, Error, etc. Excludes system
-    namespaces unless a namespace is specified. Returns a one-liner when
-    all pods are healthy.
-    """
-    data = kubectl_json("pods", namespace=namespace)
-    rows = []
-    for item in data.get("items", []):
-        meta = item.get("metadata", {})
-        ns = meta.get("namespace", "")
-        if not namespace and ns in _SYSTEM_NS:
-            continue
-        status = item.get("status", {})
-        phase = status.get("phase", "Unknown")
-        if phase in ("Running", "Succeeded"):
-            continue
-        name = meta.get("name", "")
-        # Derive status reason from container statuses (more specific than phase)
-        reason = phase
-        for cs in status.get("containerStatuses", []) + status.get(
-            "initContainerStatuses", []
-        ):
-            state = cs.get("state", {})
-            if "waiting" in state:
-                reason = state["waiting"].get("reason", reason)
-                break
-            if "terminated" in state:
-                reason = state["terminated"].get("reason", reason)
-                break
-        age_val = age_str(meta.get("creationTimestamp"))
-        rows.append([ns, name, reason, age_val])
-    if not rows:
-        scope = f"in {namespace}" if namespace else "cluster-wide"
-        info(f"All pods healthy {scope}.")
-        return
-    rows.sort(key=lambda r: (r[0], r[1]))
-    table(["NAMESPACE", "POD", "STATUS", "AGE"], rows)
-
-
-@cli.command()
-@click.argument("namespace", required=False)
-@click.option("--all", "show_all", is_flag=True, help="Include Normal events")
-@click.option("--limit", default=50, help="Max events to show")
-def events(namespace: str | None, show_all: bool, limit: int):
-    """Kubernetes events (non-Normal by default)."""
-    args = ["kubectl", "get", "events", "--sort-by=.lastTimestamp", "-o", "json"]
-    if namespace:
-        args.extend(["-n", namespace])
-    else:
-        args.append("--all-namespaces")
-    data = run_json(args, timeout=30)
-    items = data.get("items", [])
-
-    if not show_all:
-        items = [e for e in items if e.get("type", "Normal") != "Normal"]
-    if not namespace:
-        items = [
-            e
-            for e in items
-            if e.get("metadata", {}).get("namespace", "") not in _SYSTEM_NS
-        ]
-
-    items = items[-limit:]
-
-    if not items:
-        info("No events found." if show_all else "No non-Normal events found.")
-        return
-
-    rows = []
-    for e in items:
-        meta = e.get("metadata", {})
-        ns = meta.get("namespace", "")
-        etype = e.get("type", "?")
-        reason = e.get("reason", "?")
-        obj_ref = e.get("involvedObject", {})
-        obj = f"{obj_ref.get('kind', '?')}/{obj_ref.get('name', '?')}"
-        msg = truncate(e.get("message", ""), 120)
-        last_seen = age_str(e.get("lastTimestamp"))
-        count = e.get("count", 1)
-        count_str = f"x{count}" if count > 1 else ""
-        rows.append([last_seen, ns, etype, reason, obj, count_str, msg])
-
-    table(["AGE", "NS", "TYPE", "REASON", "OBJECT", "#", "MESSAGE"], rows)
-
-
 @cli.command()
 @click.argument("namespace", required=False)
 def secrets(namespace: str | None):
@@ -311,7 +221,7 @@ def types():
         items = [
             i
             for i in items
-            if i.get("metadata", {}).get("namespace", "") not in _SYSTEM_NS
+            if i.get("metadata", {}).get("namespace", "") not in SYSTEM_NS
         ]
         sample = items[0]["metadata"]["name"] if items else "(none)"
         ns = items[0]["metadata"]["namespace"] if items else ""
@@ -7,6 +7,7 @@ from typing import Never
 import click
 
 from hops.app import cli
+from hops.app.batch import diagnose_batch
 from hops.app.events import diagnose_events as _diagnose_events
 from hops.app.gather import (
     diagnose_externalsecrets as _diagnose_externalsecrets,
@@ -26,10 +27,10 @@ from hops.app.gather import (
 from hops.app.log_history import previous_container_logs
 from hops.app.pod_detail import diagnose_pod as _diagnose_pod
 from hops.core.format import info, section
+from hops.core.model import PodInfo, WorkloadInfo
 from hops.core.resolve import TargetKind, resolve
 from hops.core.runner import run
 from hops.core.workload import (
-    Workload,
     find_running_pod,
     resolve_pods,
     select_pods_for_logs,
@@ -37,7 +38,7 @@ from hops.core.workload import (
 )
 
 
-def _resolve(app_name: str, namespace: str | None) -> Workload:
+def _resolve(app_name: str, namespace: str | None) -> WorkloadInfo:
     """Resolve app name to a workload or exit with error.
 
     Used by exec-based commands that require a live parent controller
@@ -62,7 +63,7 @@ def _not_found(name: str, namespace: str | None) -> Never:
     raise SystemExit(1)
 
 
-def _find_running_pod(wl: Workload) -> str:
+def _find_running_pod(wl: WorkloadInfo) -> str:
     """Find a Running pod for a workload (for exec). Exits if none."""
     pod = find_running_pod(wl)
     if not pod:
@@ -148,10 +149,9 @@ def logs(
 
     if previous and not container:
         for chosen in chosen_pods:
-            pod = chosen["metadata"]["name"]
             output = previous_container_logs(chosen, ns, lines)
             if output is None:
-                info(f"No previous container instances found for {pod}")
+                info(f"No previous container instances found for {chosen.name}")
                 continue
             if grep:
                 output = _grep_logs(output, grep, after_context, lines)
@@ -165,7 +165,7 @@ def logs(
 
 
 def _show_pod_logs(
-    chosen: dict,
+    chosen: PodInfo,
     namespace: str,
     container: str | None,
     since: str,
@@ -175,9 +175,8 @@ def _show_pod_logs(
     after_context: int,
 ) -> None:
     """Fetch and display logs for one resolved pod."""
-    pod = chosen["metadata"]["name"]
-    phase = chosen.get("status", {}).get("phase", "?")
-    terminated = phase in ("Succeeded", "Failed")
+    pod = chosen.name
+    terminated = chosen.phase in ("Succeeded", "Failed")
     args = ["kubectl", "logs", pod, "-n", namespace]
     if not grep:
         args.append(f"--tail={lines}")
@@ -199,14 +198,14 @@ def _show_pod_logs(
     if not output:
         window = "in this container" if terminated else f"in the last {since}"
         extra = f" matching {grep!r}" if grep else ""
-        info(f"No logs from {pod} [{phase}] {window}{extra}")
+        info(f"No logs from {pod} [{chosen.phase}] {window}{extra}")
         return
 
     info("note: prefer 'hops query logs' for apps with Vector support")
     container_hint = f", container={container}" if container else ""
     scope = "since boot" if terminated else f"since {since}"
     grep_hint = f", grep={grep!r}" if grep else ""
-    info(f"--- {pod} [{phase}] ({scope}{container_hint}{grep_hint}) ---")
+    info(f"--- {pod} [{chosen.phase}] ({scope}{container_hint}{grep_hint}) ---")
     click.echo(output)
 
 
@@ -267,18 +266,42 @@ def pod_detail(app: str, namespace: str | None, pod_name: str | None, events: bo
 
 
 @cli.command()
-@click.argument("app")
+@click.argument("apps", nargs=-1)
 @click.option(
     "-n", "--namespace", default=None, help="Namespace (auto-detected if omitted)"
 )
-@click.option("--explain", is_flag=True, help="Show resolver trace")
-def diagnose(app: str, namespace: str | None, explain: bool):
+@click.option(
+    "--all", "all_apps", is_flag=True, help="Every app in the namespace (or cluster)"
+)
+@click.option(
+    "-l", "--selector", default=None, help="Apps whose workloads match a label selector"
+)
+@click.option("--explain", is_flag=True, help="Show resolver trace (single app only)")
+def diagnose(
+    apps: tuple[str, ...],
+    namespace: str | None,
+    all_apps: bool,
+    selector: str | None,
+    explain: bool,
+):
     """Composite diagnostic: Flux status, pods, events, logs, restarts.
 
     Works for workload apps (Deployments, etc.), gateway-only apps
     (external services proxied via Backend/Service + HTTPRoute), and
     operator-managed pods (CNPG Clusters, etc.) without parent workloads.
+
+    Several APPS, --all or --selector switch to batch mode: each resource
+    type is fetched once for the scope and apps are ranked by severity,
+    with details only for apps that need attention.
     """
+    if not apps and not all_apps and not selector:
+        raise click.UsageError("give an APP, several APPS, --all or --selector")
+    if len(apps) != 1 or all_apps or selector:
+        if explain:
+            raise click.UsageError("--explain works with a single APP only")
+        diagnose_batch(apps, namespace, all_apps, selector)
+        return
+    app = apps[0]
     target = resolve(app, namespace, explain=explain)
 
     if explain and target.explain:
@@ -290,7 +313,7 @@ def diagnose(app: str, namespace: str | None, explain: bool):
 
     if target.kind == TargetKind.POD or is_batch_workload:
         _diagnose_workload(target.name, target.namespace)
-        _diagnose_events(target.name, target.namespace)
+        _diagnose_events(target.name, target.namespace, target.workload, target.pods)
         return
 
     section("FLUX")
@@ -303,7 +326,7 @@ def diagnose(app: str, namespace: str | None, explain: bool):
     else:
         _diagnose_gateway(app, target.namespace)
 
-    _diagnose_events(app, target.namespace)
+    _diagnose_events(app, target.namespace, target.workload, target.pods)
 
 
 @cli.command("ls")
@@ -2,62 +2,29 @@
 
 from __future__ import annotations
 
-from hops.core.format import age_str, info, section, table
-from hops.core.runner import run_json
-
-
-def diagnose_events(app: str, ns: str):
-    """Show non-Normal events filtered to an app name."""
+from hops.core.events import EventIndex, fetch_events
+from hops.core.format import info, section, table
+from hops.core.model import PodInfo, WorkloadInfo
+
+
+def diagnose_events(
+    app: str,
+    ns: str,
+    workload: WorkloadInfo | None = None,
+    pods: list[PodInfo] | None = None,
+):
+    """Show non-Normal events for an app, its workload and the workload's pods."""
     section(f"EVENTS (non-Normal, {ns})")
-    events_args = [
-        "kubectl",
-        "get",
-        "events",
-        "-n",
-        ns,
-        "--sort-by=.lastTimestamp",
-        "-o",
-        "json",
-    ]
-    events_data = run_json(events_args, timeout=30)
-    event_items = events_data.get("items", [])
-    app_events = []
-    for e in event_items:
-        if e.get("type", "Normal") == "Normal":
-            continue
-        obj = e.get("involvedObject", {})
-        obj_name = obj.get("name", "")
-        if app.lower() in obj_name.lower():
-            app_events.append(e)
-
-    # Deduplicate events with identical messages, keeping the most recent.
-    # Strip trailing "Last Helm logs:" blocks before comparing (timestamps vary).
-    def _dedup_key(msg: str) -> str:
-        idx = msg.find("\n\nLast Helm logs:")
-        return msg[:idx] if idx != -1 else msg
-
-    seen_keys: dict[str, int] = {}
-    deduped: list[dict] = []
-    for e in reversed(app_events):
-        key = _dedup_key(e.get("message", ""))
-        if key not in seen_keys:
-            seen_keys[key] = 0
-            deduped.append(e)
-        seen_keys[key] += 1
-    deduped.reverse()
-    deduped = deduped[-20:]
+    index = EventIndex(fetch_events(ns))
+    workloads = [workload] if workload else []
+    deduped = index.for_app(app, ns, workloads, pods or [])[-20:]
 
     if deduped:
         event_rows = []
         for e in deduped:
-            reason = e.get("reason", "?")
-            obj = e.get("involvedObject", {})
-            obj_str = f"{obj.get('kind', '?')}/{obj.get('name', '?')}"
-            msg = compact_event_message(e.get("message", ""))
-            last_seen = age_str(e.get("lastTimestamp"))
-            count = seen_keys.get(_dedup_key(e.get("message", "")), 1)
-            count_str = f"x{count}" if count > 1 else ""
-            event_rows.append([last_seen, reason, obj_str, count_str, msg])
+            msg = compact_event_message(e.message)
+            count_str = f"x{e.count}" if e.count > 1 else ""
+            event_rows.append([e.age(), e.reason or "?", e.object, count_str, msg])
         table(["AGE", "REASON", "OBJECT", "#", "MESSAGE"], event_rows)
     else:
         info("(none)")
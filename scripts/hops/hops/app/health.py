@@ -0,0 +1,144 @@
+"""Cluster-wide health commands: unhealthy pods and warning events."""
+
+from __future__ import annotations
+
+import click
+
+from hops.app import cli
+from hops.app.cluster import SYSTEM_NS
+from hops.core.events import EventIndex, EventInfo, dedupe, fetch_events
+from hops.core.format import age_str, info, table, truncate
+from hops.core.model import PodInfo
+from hops.core.runner import exclude_namespaces, gather, kubectl_rows
+from hops.core.watch import watch_table
+from hops.core.workload import (
+    app_namespace,
+    list_pods,
+    list_workloads,
+    match_workloads,
+)
+
+# Pod projection for unhealthy: the last column lists each container's
+# waiting/terminated reason (empty while running), init containers last.
+_UNHEALTHY_COLUMNS = [
+    "{.metadata.namespace}",
+    "{.metadata.name}",
+    "{.status.phase}",
+    "{.metadata.creationTimestamp}",
+    (
+        "{range .status.containerStatuses[*]}"
+        '{.state.waiting.reason}{.state.terminated.reason}{","}{end}'
+        "{range .status.initContainerStatuses[*]}"
+        '{.state.waiting.reason}{.state.terminated.reason}{","}{end}'
+    ),
+]
+
+
+@cli.command()
+@click.argument("namespace", required=False)
+@click.option(
+    "--watch", is_flag=True, help="Keep running and print rows as they change"
+)
+def unhealthy(namespace: str | None, watch: bool):
+    """Pods not Running/Succeeded cluster-wide (or in a namespace).
+
+    Quick cluster health check: shows pods stuck in Pending,
+    ContainerCreating, CrashLoopBackOff, Error, etc. Excludes system
+    namespaces unless a namespace is specified. Returns a one-liner when
+    all pods are healthy. --watch follows a pod watch stream instead of
+    re-listing, printing only pods that turn unhealthy, change or recover.
+    """
+    selector = "status.phase!=Running,status.phase!=Succeeded"
+    if not namespace:
+        selector += "," + exclude_namespaces(SYSTEM_NS)
+    if watch:
+        scope = f"in {namespace}" if namespace else "cluster-wide"
+        watch_table(
+            {"Pod": "pods"},
+            ["NAMESPACE", "POD", "STATUS"],
+            _unhealthy_row,
+            namespace=namespace,
+            field_selector=selector,
+            empty=f"All pods healthy {scope}.",
+        )
+        return
+    found = kubectl_rows(
+        "pods",
+        _UNHEALTHY_COLUMNS,
+        "--field-selector",
+        selector,
+        namespace=namespace,
+    )
+    rows = []
+    for ns, name, phase, created, reasons in found:
+        # First waiting/terminated container reason is more specific than phase
+        reason = next((r for r in reasons.split(",") if r), phase or "Unknown")
+        rows.append([ns, name, reason, age_str(created or None)])
+    if not rows:
+        scope = f"in {namespace}" if namespace else "cluster-wide"
+        info(f"All pods healthy {scope}.")
+        return
+    rows.sort(key=lambda r: (r[0], r[1]))
+    table(["NAMESPACE", "POD", "STATUS", "AGE"], rows)
+
+
+def _unhealthy_row(_kind: str, item: dict) -> list[str] | None:
+    pod = PodInfo(item)
+    if pod.phase in ("Running", "Succeeded"):
+        return None
+    return [pod.namespace, pod.name, pod.status_reason()]
+
+
+@cli.command()
+@click.argument("namespace", required=False)
+@click.option("--all", "show_all", is_flag=True, help="Include Normal events")
+@click.option("--limit", default=50, help="Max events to show")
+@click.option(
+    "--app",
+    "app",
+    default=None,
+    help="Only events for this app's workloads, their pods and named objects",
+)
+def events(namespace: str | None, show_all: bool, limit: int, app: str | None):
+    """Kubernetes events (non-Normal by default), repeats folded."""
+    if app:
+        items = _app_events(app, namespace, warnings_only=not show_all)
+    else:
+        items = dedupe(
+            fetch_events(namespace, warnings_only=not show_all, exclude=SYSTEM_NS)
+        )
+    items = items[-limit:]
+
+    if not items:
+        info("No events found." if show_all else "No non-Normal events found.")
+        return
+
+    rows = [
+        [
+            e.age(),
+            e.namespace,
+            e.type or "?",
+            e.reason or "?",
+            e.object,
+            f"x{e.count}" if e.count > 1 else "",
+            truncate(e.message, 120),
+        ]
+        for e in items
+    ]
+    table(["AGE", "NS", "TYPE", "REASON", "OBJECT", "#", "MESSAGE"], rows)
+
+
+def _app_events(
+    app: str, namespace: str | None, *, warnings_only: bool
+) -> list[EventInfo]:
+    """Events for one app, fetched only from the namespace it lives in."""
+    ns = namespace or app_namespace(app)
+    if not ns:
+        click.echo(f"error: no workload matching '{app}' (pass a namespace)", err=True)
+        raise SystemExit(1)
+    workloads, pods, found = gather(
+        lambda: list_workloads(ns),
+        lambda: list_pods(ns),
+        lambda: fetch_events(ns, warnings_only=warnings_only),
+    )
+    return EventIndex(found).for_app(app, ns, match_workloads(app, workloads), pods)
@@ -3,21 +3,13 @@
 from __future__ import annotations
 
 from hops.core.format import truncate
+from hops.core.model import PodInfo
 from hops.core.runner import run
 
 
-def previous_container_logs(pod: dict, namespace: str, lines: int) -> str | None:
+def previous_container_logs(pod: PodInfo, namespace: str, lines: int) -> str | None:
     """Return previous logs only for containers with a terminated prior instance."""
-    status = pod.get("status", {})
-    containers = [
-        *status.get("containerStatuses", []),
-        *status.get("initContainerStatuses", []),
-    ]
-    restarted = [
-        container["name"]
-        for container in containers
-        if container.get("lastState", {}).get("terminated")
-    ]
+    restarted = [c.name for c in pod.containers if c.last_terminated]
     if not restarted:
         return None
 
@@ -27,7 +19,7 @@ def previous_container_logs(pod: dict, namespace: str, lines: int) -> str | None
             [
                 "kubectl",
                 "logs",
-                pod["metadata"]["name"],
+                pod.name,
                 "-n",
                 namespace,
                 "-c",
@@ -61,53 +61,51 @@ def diagnose_pod(
     pods = target.pods
 
     if pod_name:
-        pods = [p for p in pods if p["metadata"]["name"] == pod_name]
+        pods = [p for p in pods if p.name == pod_name]
     if not pods:
         target = pod_name or app
         info(f"error: no pods matching {target!r} in {ns}")
         raise SystemExit(1)
     pod = pods[0]
-    meta = pod["metadata"]
-    spec = pod.get("spec", {})
-    status = pod.get("status", {})
-    name = meta["name"]
+    name = pod.name
 
     # Summary
     section("POD")
     pairs = [
         ("name", name),
         ("namespace", ns),
-        ("node", spec.get("nodeName", "?")),
-        ("ip", status.get("podIP", "?")),
-        ("phase", status.get("phase", "?")),
-        ("age", age_str(meta.get("creationTimestamp"))),
+        ("node", pod.node or "?"),
+        ("ip", pod.ip or "?"),
+        ("phase", pod.phase),
+        ("age", pod.age()),
     ]
     kv(pairs)
 
     # Containers (init + regular)
-    init_statuses = status.get("initContainerStatuses", [])
-    container_statuses = status.get("containerStatuses", [])
-    all_statuses = [("init", cs) for cs in init_statuses] + [
-        ("app", cs) for cs in container_statuses
+    all_statuses = [c for c in pod.containers if c.init] + [
+        c for c in pod.containers if not c.init
     ]
     if all_statuses:
         section("CONTAINERS")
         rows = []
-        for kind, cs in all_statuses:
-            cname = cs.get("name", "?")
-            image = short_image(cs.get("image", "?"))
-            restarts = cs.get("restartCount", 0)
-            state = cs.get("state", {})
-            state_str, detail = format_container_state(state)
-            rows.append([kind, cname, image, str(restarts), state_str, detail])
+        for cs in all_statuses:
+            state_str, detail = format_container_state(cs.state)
+            rows.append(
+                [
+                    "init" if cs.init else "app",
+                    cs.name,
+                    short_image(cs.image),
+                    str(cs.restarts),
+                    state_str,
+                    detail,
+                ]
+            )
         table(["KIND", "CONTAINER", "IMAGE", "RESTARTS", "STATE", "DETAIL"], rows)
 
         # Previous termination details (for containers that restarted).
         # Auto-fetch --previous logs for each so the caller sees crash output
         # inline, not after a second command.
-        restarted = [
-            cs for _, cs in all_statuses if cs.get("lastState", {}).get("terminated")
-        ]
+        restarted = [cs for cs in all_statuses if cs.last_terminated]
         if restarted:
             info("")
             info("Previous terminations:")
@@ -115,17 +113,17 @@ def diagnose_pod(
                 ["CONTAINER", "EXIT", "REASON", "FINISHED"],
                 [
                     [
-                        cs.get("name", "?"),
-                        str(cs["lastState"]["terminated"].get("exitCode", "?")),
-                        cs["lastState"]["terminated"].get("reason", "?"),
-                        age_str(cs["lastState"]["terminated"].get("finishedAt")),
+                        cs.name,
+                        str(cs.last_terminated.get("exitCode", "?")),
+                        cs.last_terminated.get("reason", "?"),
+                        age_str(cs.last_terminated.get("finishedAt")),
                     ]
                     for cs in restarted
                 ],
             )
             section("PREVIOUS LOGS")
             for cs in restarted:
-                cname = cs.get("name", "?")
+                cname = cs.name
                 prev = run(
                     [
                         "kubectl",
@@ -155,14 +153,14 @@ def diagnose_pod(
         # Current logs contain the failure output; no --previous needed.
         failed_no_restart = [
             cs
-            for _, cs in all_statuses
-            if cs.get("restartCount", 0) == 0
-            and cs.get("state", {}).get("terminated", {}).get("exitCode", 0) != 0
+            for cs in all_statuses
+            if cs.restarts == 0
+            and cs.state.get("terminated", {}).get("exitCode", 0) != 0
         ]
         if failed_no_restart:
             section("FAILURE LOGS")
             for cs in failed_no_restart:
-                cname = cs.get("name", "?")
+                cname = cs.name
                 result = run(
                     ["kubectl", "logs", name, "-n", ns, "-c", cname, "--tail=30"],
                     timeout=15,
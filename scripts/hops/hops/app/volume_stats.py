@@ -5,13 +5,14 @@ from __future__ import annotations
 import json
 
 from hops.core.format import human_bytes, info, section, table, truncate
+from hops.core.model import PodInfo
 from hops.core.runner import run
 
 
-def _node_summaries(pods: list[dict]) -> tuple[dict, dict]:
+def _node_summaries(pods: list[PodInfo]) -> tuple[dict, dict]:
     summaries = {}
     errors = {}
-    nodes = {pod.get("spec", {}).get("nodeName") for pod in pods}
+    nodes = {pod.node for pod in pods}
     for node in sorted(node for node in nodes if node):
         result = run(
             [
@@ -33,29 +34,13 @@ def _node_summaries(pods: list[dict]) -> tuple[dict, dict]:
     return summaries, errors
 
 
-def _mounted_pvcs(pod: dict) -> list[str]:
-    spec = pod.get("spec", {})
-    containers = [*spec.get("containers", []), *spec.get("initContainers", [])]
-    mounted = {
-        mount.get("name")
-        for container in containers
-        for mount in container.get("volumeMounts", [])
-    }
-    return [
-        volume["persistentVolumeClaim"].get("claimName", "?")
-        for volume in spec.get("volumes", [])
-        if volume.get("name") in mounted and volume.get("persistentVolumeClaim")
-    ]
-
-
-def _pod_stats(summary: dict, pod: dict) -> dict[str, dict]:
-    meta = pod.get("metadata", {})
+def _pod_stats(summary: dict, pod: PodInfo) -> dict[str, dict]:
     item = next(
         (
             item
             for item in summary.get("pods", [])
-            if item.get("podRef", {}).get("name") == meta.get("name")
-            and item.get("podRef", {}).get("namespace") == meta.get("namespace")
+            if item.get("podRef", {}).get("name") == pod.name
+            and item.get("podRef", {}).get("namespace") == pod.namespace
         ),
         {},
     )
@@ -66,10 +51,9 @@ def _pod_stats(summary: dict, pod: dict) -> dict[str, dict]:
     }
 
 
-def diagnose_volumes(pods: list[dict]) -> None:
+def diagnose_volumes(pods: list[PodInfo]) -> None:
     """Show filesystem capacity for PVCs mounted by the selected pods."""
-    pod_volumes = [(pod, _mounted_pvcs(pod)) for pod in pods]
-    pod_volumes = [(pod, pvcs) for pod, pvcs in pod_volumes if pvcs]
+    pod_volumes = [(pod, pod.pvcs) for pod in pods if pod.pvcs]
     if not pod_volumes:
         return
 
@@ -77,10 +61,8 @@ def diagnose_volumes(pods: list[dict]) -> None:
 
     rows = []
     for pod, pvcs in pod_volumes:
-        meta = pod.get("metadata", {})
-        pod_name = meta.get("name", "?")
-        node = pod.get("spec", {}).get("nodeName")
-        stats_by_pvc = _pod_stats(summaries.get(node, {}), pod)
+        pod_name = pod.name
+        stats_by_pvc = _pod_stats(summaries.get(pod.node, {}), pod)
         for pvc in pvcs:
             stats = stats_by_pvc.get(pvc, {})
             capacity = stats.get("capacityBytes")
@@ -0,0 +1,19 @@
+"""Backup domain: Volsync + CNPG backup freshness, Kopia repository management."""
+
+from __future__ import annotations
+
+import click
+
+from hops._click import AutoGroup
+
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with hops._click.manifest_for after adding commands.
+_COMMANDS = {
+    "kopia": "hops.backup.commands:kopia",
+    "status": "hops.backup.commands:status",
+}
+
+
+@click.group(cls=AutoGroup, package="hops.backup", commands=_COMMANDS)
+def cli():
+    """Backup operations: status overview, Kopia repository management."""
@@ -0,0 +1,179 @@
+"""Backup Click commands: freshness status and Kopia passthrough."""
+
+from __future__ import annotations
+
+import json
+from datetime import timedelta
+
+import click
+
+from hops.backup import cli
+from hops.backup.freshness import (
+    NEVER,
+    Evaluation,
+    FleetReport,
+    cnpg_sources,
+    evaluate_fleet,
+    volsync_sources,
+)
+from hops.core.format import age, age_str, info, kv, section, table
+from hops.core.runner import gather, kubectl_json, run
+from hops.core.time import duration_seconds
+
+
+def _duration(ctx, param, value: str | None) -> timedelta | None:
+    if value is None:
+        return None
+    try:
+        return timedelta(seconds=duration_seconds(value))
+    except ValueError as exc:
+        raise click.BadParameter(str(exc)) from None
+
+
+def _rpo_str(seconds: int | None) -> str:
+    return age(seconds) if seconds is not None else "-"
+
+
+def _worst_str(worst: Evaluation) -> str:
+    return "never backed up" if worst.status == NEVER else _rpo_str(worst.rpo_seconds)
+
+
+def _rows(evaluations: list[Evaluation]) -> list[list[str]]:
+    rows = []
+    for ev in evaluations:
+        src = ev.source
+        last = (
+            f"{age_str(src.last_success.isoformat())} ago"
+            if src.last_success
+            else "never"
+        )
+        status = ev.status
+        if ev.missed:
+            status += f" x{ev.missed}"
+        row = [src.namespace, src.name, src.schedule or "-", last, status]
+        if src.kind == "cnpg":
+            row.insert(4, src.last_phase or "none")
+        row.append(ev.detail)
+        rows.append(row)
+    return rows
+
+
+def _table(headers: list[str], evaluations: list[Evaluation]) -> None:
+    """Table with a DETAIL column only when some row has something to say."""
+    rows = _rows(evaluations)
+    if any(row[-1] for row in rows):
+        headers = [*headers, "DETAIL"]
+    table(headers, rows)
+
+
+@cli.command()
+@click.option(
+    "--grace",
+    default="1h",
+    callback=_duration,
+    help="Time a scheduled run may take before it counts as missed (default: 1h)",
+)
+@click.option(
+    "--max-rpo",
+    default=None,
+    callback=_duration,
+    help="Also flag sources whose last success is older than this (e.g. 26h)",
+)
+@click.option("--json", "json_mode", is_flag=True, help="Output the report as JSON")
+def status(grace: timedelta, max_rpo: timedelta | None, json_mode: bool):
+    """Backup freshness: Volsync and CNPG runs checked against their schedules.
+
+    Each source's last success is compared with the most recent run its cron
+    schedule owed (older than --grace). Missed runs and the worst-case RPO
+    across the fleet are reported; exits 1 when any source is in violation,
+    so the command doubles as a cron health check.
+    """
+    vs_data, sb_data, bk_data = gather(
+        lambda: kubectl_json("replicationsources"),
+        lambda: kubectl_json("scheduledbackups"),
+        lambda: kubectl_json("backups.postgresql.cnpg.io"),
+    )
+    sources = volsync_sources(vs_data.get("items", [])) + cnpg_sources(
+        sb_data.get("items", []), bk_data.get("items", [])
+    )
+    report = evaluate_fleet(sources, grace, max_rpo)
+
+    if json_mode:
+        click.echo(json.dumps(report.to_dict(), indent=2))
+    else:
+        _render(report)
+
+    if report.violations:
+        raise SystemExit(1)
+
+
+def _render(report: FleetReport) -> None:
+    volsync = [e for e in report.evaluations if e.source.kind == "volsync"]
+    cnpg = [e for e in report.evaluations if e.source.kind == "cnpg"]
+
+    section("Volsync")
+    if volsync:
+        _table(["NAMESPACE", "NAME", "SCHEDULE", "LAST SYNC", "STATUS"], volsync)
+    else:
+        info("No ReplicationSources found.")
+
+    section("CNPG Backups")
+    if cnpg:
+        table(
+            [
+                "NAMESPACE",
+                "CLUSTER",
+                "SCHEDULE",
+                "LAST BACKUP",
+                "LAST STATUS",
+                "STATUS",
+            ],
+            _rows(cnpg),
+        )
+    else:
+        info("No ScheduledBackups found.")
+
+    if not report.evaluations:
+        return
+    worst = report.worst
+    info("")
+    kv(
+        [
+            ("Sources", str(len(report.evaluations))),
+            ("Violations", str(len(report.violations))),
+            (
+                "Worst RPO",
+                f"{_worst_str(worst)} "
+                f"({worst.source.kind} {worst.source.namespace}/{worst.source.name})"
+                if worst
+                else "-",
+            ),
+            ("Never backed up", str(len(report.never))),
+        ]
+    )
+
+
+@cli.command()
+@click.argument("args", nargs=-1)
+def kopia(args: tuple[str, ...]):
+    """Run kopia commands via the kopia pod in storage namespace.
+
+    Pass any kopia subcommand and arguments after --.
+    Example: hops backup kopia snapshot list
+    """
+    cmd = [
+        "kubectl",
+        "exec",
+        "-n",
+        "storage",
+        "deploy/kopia",
+        "--",
+        "kopia",
+    ] + list(args)
+    result = run(cmd, timeout=60, check=False)
+    if result.stdout:
+        click.echo(result.stdout.rstrip())
+    if result.stderr:
+        click.echo(result.stderr.rstrip())
+    if result.returncode != 0:
+        raise SystemExit(result.returncode)
@@ -0,0 +1,272 @@
+"""Backup freshness evaluation against each source's own schedule.
+
+A last-sync age means nothing without the schedule it should be compared to:
+six hours is healthy for a daily backup and a failure for an hourly one. The
+engine derives the fire time each source most recently owed from its cron
+schedule, compares it with the last successful run, and reports missed runs
+and the recovery point objective (RPO) the fleet is exposed to right now.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+
+from hops.core.cron import CronSchedule
+from hops.core.index import group_by_owner
+
+OK = "OK"
+MISSED = "MISSED"
+NEVER = "NEVER"
+RPO_EXCEEDED = "RPO"
+SUSPENDED = "SUSPENDED"
+UNSCHEDULED = "UNSCHEDULED"
+UNPARSEABLE = "BADCRON"
+
+VIOLATIONS = frozenset({MISSED, NEVER, RPO_EXCEEDED})
+
+# More missed runs than this is reported as "at least"; the count stops
+# mattering long before it stops being cheap to compute.
+_MISSED_CAP = 100
+
+
+@dataclass
+class BackupSource:
+    """One scheduled backup producer and its most recent success."""
+
+    kind: str  # "volsync" or "cnpg"
+    namespace: str
+    name: str
+    schedule: str | None
+    last_success: datetime | None
+    created: datetime | None = None
+    suspended: bool = False
+    last_phase: str | None = None
+
+
+@dataclass
+class Evaluation:
+    """Freshness verdict for one source."""
+
+    source: BackupSource
+    status: str
+    due: datetime | None = None
+    missed: int = 0
+    rpo_seconds: int | None = None
+    detail: str = ""
+
+    @property
+    def violation(self) -> bool:
+        return self.status in VIOLATIONS
+
+    def to_dict(self) -> dict:
+        src = self.source
+        return {
+            "kind": src.kind,
+            "namespace": src.namespace,
+            "name": src.name,
+            "schedule": src.schedule,
+            "lastSuccess": _iso(src.last_success),
+            "lastPhase": src.last_phase,
+            "due": _iso(self.due),
+            "status": self.status,
+            "violation": self.violation,
+            "missed": self.missed,
+            "rpoSeconds": self.rpo_seconds,
+            "detail": self.detail,
+        }
+
+
+@dataclass
+class FleetReport:
+    """Every evaluation plus the fleet-wide worst case."""
+
+    evaluations: list[Evaluation] = field(default_factory=list)
+    generated: datetime = field(default_factory=lambda: datetime.now(UTC))
+
+    @property
+    def violations(self) -> list[Evaluation]:
+        return [e for e in self.evaluations if e.violation]
+
+    @property
+    def never(self) -> list[Evaluation]:
+        return [e for e in self.evaluations if e.status == NEVER]
+
+    @property
+    def worst(self) -> Evaluation | None:
+        """Largest RPO, where a source owed a backup it never made counts as
+        unbounded and outranks every source that has one (most runs missed
+        first)."""
+        scored = [
+            e
+            for e in self.evaluations
+            if e.rpo_seconds is not None or e.status == NEVER
+        ]
+        return max(
+            scored,
+            key=lambda e: (
+                (True, e.missed) if e.status == NEVER else (False, e.rpo_seconds or 0)
+            ),
+            default=None,
+        )
+
+    def to_dict(self) -> dict:
+        worst = self.worst
+        return {
+            "generatedAt": _iso(self.generated),
+            "sources": len(self.evaluations),
+            "violations": len(self.violations),
+            "neverSucceeded": len(self.never),
+            "worstRpo": (
+                {
+                    "kind": worst.source.kind,
+                    "namespace": worst.source.namespace,
+                    "name": worst.source.name,
+                    "status": worst.status,
+                    # None with status NEVER: no backup at all, unbounded RPO
+                    "rpoSeconds": worst.rpo_seconds,
+                }
+                if worst
+                else None
+            ),
+            "evaluations": [e.to_dict() for e in self.evaluations],
+        }
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.strftime("%Y-%m-%dT%H:%M:%SZ") if value else None
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).astimezone(UTC)
+    except ValueError:
+        return None
+
+
+def volsync_sources(items: list[dict]) -> list[BackupSource]:
+    """ReplicationSources, scheduled via spec.trigger.schedule."""
+    sources = []
+    for item in items:
+        meta = item.get("metadata", {})
+        spec = item.get("spec", {})
+        sources.append(
+            BackupSource(
+                kind="volsync",
+                namespace=meta.get("namespace", ""),
+                name=meta.get("name", ""),
+                schedule=spec.get("trigger", {}).get("schedule"),
+                last_success=_parse_time(item.get("status", {}).get("lastSyncTime")),
+                created=_parse_time(meta.get("creationTimestamp")),
+                suspended=bool(spec.get("paused")),
+            )
+        )
+    return sources
+
+
+def cnpg_sources(scheduled: list[dict], backups: list[dict]) -> list[BackupSource]:
+    """ScheduledBackups, credited with their cluster's newest completed Backup."""
+    by_cluster = group_by_owner(
+        backups, lambda b: b.get("spec", {}).get("cluster", {}).get("name", "")
+    )
+    sources = []
+    for item in scheduled:
+        meta = item.get("metadata", {})
+        spec = item.get("spec", {})
+        cluster = spec.get("cluster", {}).get("name", "")
+        attempts = sorted(
+            by_cluster.get(f"{meta.get('namespace', '')}/{cluster}", []),
+            key=lambda b: b.get("status", {}).get("startedAt", ""),
+        )
+        completed = [
+            b for b in attempts if b.get("status", {}).get("phase") == "completed"
+        ]
+        last_ok = completed[-1].get("status", {}) if completed else {}
+        sources.append(
+            BackupSource(
+                kind="cnpg",
+                namespace=meta.get("namespace", ""),
+                name=cluster or meta.get("name", ""),
+                schedule=spec.get("schedule"),
+                last_success=_parse_time(
+                    last_ok.get("stoppedAt") or last_ok.get("startedAt")
+                ),
+                created=_parse_time(meta.get("creationTimestamp")),
+                suspended=bool(spec.get("suspend")),
+                last_phase=(
+                    attempts[-1].get("status", {}).get("phase") if attempts else None
+                ),
+            )
+        )
+    return sources
+
+
+def evaluate(
+    source: BackupSource,
+    now: datetime,
+    grace: timedelta,
+    max_rpo: timedelta | None = None,
+) -> Evaluation:
+    """Judge one source: did its last success cover the run it most recently owed?
+
+    The run owed is the latest fire time at least ``grace`` before now, so a
+    backup that is merely still running is not reported as missed.
+    """
+    rpo = (
+        int((now - source.last_success).total_seconds())
+        if source.last_success
+        else None
+    )
+    if source.suspended:
+        return Evaluation(source, SUSPENDED, rpo_seconds=rpo)
+    if not source.schedule:
+        return Evaluation(source, UNSCHEDULED, rpo_seconds=rpo, detail="manual trigger")
+    try:
+        cron = CronSchedule(source.schedule)
+    except ValueError as exc:
+        return Evaluation(source, UNPARSEABLE, rpo_seconds=rpo, detail=str(exc))
+
+    cutoff = now - grace
+    due = cron.previous(cutoff)
+    if due is None or (source.created and due < source.created):
+        # Nothing has been owed since the source was created.
+        return Evaluation(source, OK, due=due, rpo_seconds=rpo, detail="not yet due")
+
+    if source.last_success is None:
+        since = source.created or due - timedelta(days=1)
+        missed = len(cron.fires_between(since, cutoff, _MISSED_CAP))
+        return Evaluation(source, NEVER, due=due, missed=missed)
+
+    if source.last_success < due:
+        missed = len(cron.fires_between(source.last_success, cutoff, _MISSED_CAP))
+        detail = f"{missed}+ runs missed" if missed >= _MISSED_CAP else ""
+        return Evaluation(
+            source, MISSED, due=due, missed=missed, rpo_seconds=rpo, detail=detail
+        )
+
+    if max_rpo is not None and rpo is not None and rpo > max_rpo.total_seconds():
+        return Evaluation(
+            source,
+            RPO_EXCEEDED,
+            due=due,
+            rpo_seconds=rpo,
+            detail=f"RPO exceeds {int(max_rpo.total_seconds())}s",
+        )
+    return Evaluation(source, OK, due=due, rpo_seconds=rpo)
+
+
+def evaluate_fleet(
+    sources: list[BackupSource],
+    grace: timedelta,
+    max_rpo: timedelta | None = None,
+    now: datetime | None = None,
+) -> FleetReport:
+    """Evaluate every source against one shared notion of now."""
+    report = FleetReport() if now is None else FleetReport(generated=now)
+    report.evaluations = [
+        evaluate(source, report.generated, grace, max_rpo)
+        for source in sorted(sources, key=lambda s: (s.kind, s.namespace, s.name))
+    ]
+    return report
@@ -5,13 +5,32 @@ from __future__ import annotations
 import click
 
 from hops._click import AutoGroup
+from hops._profile import profile_options
+
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with hops._click.manifest_for after adding commands.
+_COMMANDS = {
+    "app": "hops.app:cli",
+    "backup": "hops.backup:cli",
+    "db": "hops.db:cli",
+    "debug": "hops.debug:cli",
+    "dns": "hops.dns:cli",
+    "flux": "hops.flux:cli",
+    "incident": "hops.incident:cli",
+    "node": "hops.node:cli",
+    "query": "hops.query:cli",
+    "storage": "hops.storage:cli",
+    "validate": "hops.validate:cli",
+}
 
 
 @click.group(
     cls=AutoGroup,
     package="hops",
+    commands=_COMMANDS,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 @click.version_option(version=__import__("hops").__version__, prog_name="hops")
+@profile_options
 def cli():
     """LLM-optimized cluster operations CLI."""
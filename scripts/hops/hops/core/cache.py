@@ -0,0 +1,49 @@
+"""On-disk cache under $XDG_CACHE_HOME/hops.
+
+Entries are JSON files addressed by a content key, so a key only ever maps
+to one value and nothing needs expiring. The cache is best effort: a missing
+or unwritable directory degrades to a cache miss, never an error.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any
+
+
+def cache_dir(*parts: str) -> Path:
+    """Return the hops cache directory, or a subdirectory of it."""
+    root = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    return root.joinpath("hops", *parts)
+
+
+def content_key(*parts: str) -> str:
+    """Stable hex digest identifying a set of key parts."""
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()
+
+
+def load(bucket: str, key: str) -> Any | None:
+    """Read a cached entry, returning None on miss or corruption."""
+    path = cache_dir(bucket) / f"{key}.json"
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def store(bucket: str, key: str, data: Any) -> None:
+    """Write a cached entry atomically; failures are ignored."""
+    directory = cache_dir(bucket)
+    path = directory / f"{key}.json"
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(data))
+        tmp.replace(path)
+    except OSError:
+        with contextlib.suppress(OSError):
+            tmp.unlink(missing_ok=True)
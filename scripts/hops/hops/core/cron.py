@@ -0,0 +1,149 @@
+"""Cron schedule parsing for evaluating when a scheduled job last should have run.
+
+Volsync triggers use classic five-field cron; CNPG ScheduledBackups use the
+six-field form with a leading seconds field. Both, plus the common @macros,
+parse into one CronSchedule evaluated in UTC (the zone both controllers use).
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+_MACROS = {
+    "@yearly": "0 0 1 1 *",
+    "@annually": "0 0 1 1 *",
+    "@monthly": "0 0 1 * *",
+    "@weekly": "0 0 * * 0",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@hourly": "0 * * * *",
+}
+_MONTHS = {
+    name: i
+    for i, name in enumerate(
+        (
+            "jan",
+            "feb",
+            "mar",
+            "apr",
+            "may",
+            "jun",
+            "jul",
+            "aug",
+            "sep",
+            "oct",
+            "nov",
+            "dec",
+        ),
+        start=1,
+    )
+}
+_WEEKDAYS = {
+    name: i for i, name in enumerate(("sun", "mon", "tue", "wed", "thu", "fri", "sat"))
+}
+
+# Far enough back to find Feb 29 schedules; anything older is "never".
+_MAX_LOOKBACK_DAYS = 366 * 4 + 1
+
+
+def _parse_field(
+    field: str, low: int, high: int, names: dict[str, int] | None = None
+) -> frozenset[int]:
+    values: set[int] = set()
+    for part in field.lower().split(","):
+        expr, _, step_str = part.partition("/")
+        step = int(step_str) if step_str else 1
+        if step < 1:
+            raise ValueError(f"invalid step in {field!r}")
+        if expr in ("*", "?"):
+            start, end = low, high
+        else:
+            first, _, last = expr.partition("-")
+            start = _parse_value(first, names)
+            end = _parse_value(last, names) if last else (high if step_str else start)
+        if start < low or end > high or start > end:
+            raise ValueError(f"value out of range in {field!r}")
+        values.update(range(start, end + 1, step))
+    return frozenset(values)
+
+
+def _parse_value(token: str, names: dict[str, int] | None) -> int:
+    if names and token in names:
+        return names[token]
+    return int(token)
+
+
+class CronSchedule:
+    """A parsed cron expression answering "when did this last fire?"."""
+
+    __slots__ = (
+        "days",
+        "dom_restricted",
+        "dow_restricted",
+        "expr",
+        "hours",
+        "minutes",
+        "months",
+        "seconds",
+        "weekdays",
+    )
+
+    def __init__(self, expr: str):
+        self.expr = expr
+        text = _MACROS.get(expr.strip().lower(), expr)
+        fields = text.split()
+        if len(fields) == 5:
+            fields = ["0", *fields]
+        if len(fields) != 6:
+            raise ValueError(f"unsupported cron expression {expr!r}")
+        sec, minute, hour, dom, month, dow = fields
+        self.seconds = _parse_field(sec, 0, 59)
+        self.minutes = _parse_field(minute, 0, 59)
+        self.hours = _parse_field(hour, 0, 23)
+        self.days = _parse_field(dom, 1, 31)
+        self.months = _parse_field(month, 1, 12, _MONTHS)
+        # 7 is an accepted alias for Sunday
+        weekdays = _parse_field(dow, 0, 7, _WEEKDAYS)
+        self.weekdays = frozenset(d % 7 for d in weekdays)
+        # Vixie cron: a field starting with "*" (including "*/N") leaves the
+        # day unrestricted, so it never triggers the dom-or-dow rule.
+        self.dom_restricted = not dom.startswith(("*", "?"))
+        self.dow_restricted = not dow.startswith(("*", "?"))
+
+    def _day_matches(self, day: datetime) -> bool:
+        if day.month not in self.months:
+            return False
+        dom_ok = day.day in self.days
+        dow_ok = (day.isoweekday() % 7) in self.weekdays
+        # Standard cron: when both fields are restricted either may match.
+        if self.dom_restricted and self.dow_restricted:
+            return dom_ok or dow_ok
+        return dom_ok and dow_ok
+
+    def previous(self, at: datetime) -> datetime | None:
+        """Latest fire time at or before ``at`` (UTC), or None if none is near."""
+        at = at.astimezone(UTC).replace(microsecond=0)
+        day = at.replace(hour=0, minute=0, second=0)
+        for _ in range(_MAX_LOOKBACK_DAYS):
+            if self._day_matches(day):
+                for hour in sorted(self.hours, reverse=True):
+                    if day.date() == at.date() and hour > at.hour:
+                        continue
+                    for minute in sorted(self.minutes, reverse=True):
+                        for second in sorted(self.seconds, reverse=True):
+                            fire = day.replace(hour=hour, minute=minute, second=second)
+                            if fire <= at:
+                                return fire
+            day -= timedelta(days=1)
+        return None
+
+    def fires_between(
+        self, after: datetime, until: datetime, limit: int = 100
+    ) -> list[datetime]:
+        """Fire times in (after, until], newest first, capped at ``limit``."""
+        fires: list[datetime] = []
+        cursor = self.previous(until)
+        while cursor is not None and cursor > after and len(fires) < limit:
+            fires.append(cursor)
+            cursor = self.previous(cursor - timedelta(seconds=1))
+        return fires
@@ -0,0 +1,264 @@
+"""Events engine: one fetch, indexed by object and owner chain.
+
+Events name the object they are about, not the app. Pod events name a pod,
+rollout events a ReplicaSet, Helm failures a HelmRelease. ``EventIndex``
+groups a single projected fetch by involved object and maps pods,
+ReplicaSets and Jobs back to their owning workload, so "events for workload
+X including its pods" is a lookup rather than another kubectl call or a
+substring scan. Repeats are folded using ``count`` and ``series``.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable
+from copy import copy
+
+from hops.core.model import PodInfo, WorkloadInfo, age_since, epoch
+from hops.core.runner import exclude_namespaces, kubectl_rows
+
+_COLUMNS = [
+    "{.metadata.namespace}",
+    "{.involvedObject.kind}",
+    "{.involvedObject.name}",
+    "{.type}",
+    "{.reason}",
+    "{.count}",
+    "{.series.count}",
+    "{.lastTimestamp}",
+    "{.series.lastObservedTime}",
+    "{.eventTime}",
+    "{.message}",
+]
+
+# Workload kind (plural resource) -> Kind named in involvedObject
+WORKLOAD_KINDS = {
+    "deployments": "Deployment",
+    "statefulsets": "StatefulSet",
+    "daemonsets": "DaemonSet",
+    "cronjobs": "CronJob",
+    "jobs": "Job",
+}
+
+# Intermediate owners named "<owner>-<suffix>" by their controller
+_CHILD_KINDS = {"Deployment": "ReplicaSet", "CronJob": "Job"}
+
+# Intermediate owner kind -> (workload kind, generated name suffix): a
+# ReplicaSet adds the pod-template hash, a CronJob's Job its schedule time
+_GENERATED = {
+    "ReplicaSet": ("Deployment", re.compile(r"[bcdfghjklmnpqrstvwxz2456789]{6,10}")),
+    "Job": ("CronJob", re.compile(r"\d{8,}")),
+}
+
+
+class EventInfo:
+    """One event, or several folded repeats of it."""
+
+    __slots__ = (
+        "count",
+        "kind",
+        "last",
+        "message",
+        "name",
+        "namespace",
+        "reason",
+        "type",
+    )
+
+    def __init__(self, row: list[str]):
+        (
+            self.namespace,
+            self.kind,
+            self.name,
+            self.type,
+            self.reason,
+            count,
+            series_count,
+            last,
+            series_last,
+            event_time,
+            self.message,
+        ) = row
+        self.count = int(series_count or count or 1)
+        self.last = epoch(series_last or last or event_time)
+
+    @property
+    def object(self) -> str:
+        return f"{self.kind or '?'}/{self.name or '?'}"
+
+    def age(self) -> str:
+        return age_since(self.last)
+
+
+def dedup_key(event: EventInfo) -> tuple[str, str, str, str]:
+    """Identity for folding repeats; Helm log tails carry varying timestamps."""
+    msg = event.message
+    idx = msg.find("\n\nLast Helm logs:")
+    if idx != -1:
+        msg = msg[:idx]
+    return (event.namespace, event.object, event.reason, msg)
+
+
+def dedupe(events: Iterable[EventInfo]) -> list[EventInfo]:
+    """Fold identical events into copies of the latest, oldest first.
+
+    Counts are summed. The inputs are left untouched, so events shared by
+    several lookups on one index are not counted twice.
+    """
+    folded: dict[tuple[str, str, str, str], tuple[EventInfo, int]] = {}
+    seen: set[int] = set()
+    for event in events:
+        if id(event) in seen:
+            continue
+        seen.add(id(event))
+        key = dedup_key(event)
+        prev = folded.get(key)
+        if prev is None:
+            folded[key] = (event, event.count)
+            continue
+        latest = event if event.last >= prev[0].last else prev[0]
+        folded[key] = (latest, prev[1] + event.count)
+    result = []
+    for event, total in folded.values():
+        event = copy(event)
+        event.count = total
+        result.append(event)
+    result.sort(key=lambda e: e.last)
+    return result
+
+
+def fetch_events(
+    namespace: str | None = None,
+    *,
+    warnings_only: bool = True,
+    exclude: Iterable[str] = (),
+) -> list[EventInfo]:
+    """Fetch events once as a projection, oldest first."""
+    terms = ["type!=Normal"] if warnings_only else []
+    if not namespace and exclude:
+        terms.append(exclude_namespaces(exclude))
+    args = ["--field-selector", ",".join(terms)] if terms else []
+    rows = kubectl_rows("events", _COLUMNS, *args, namespace=namespace)
+    events = [EventInfo(row) for row in rows]
+    events.sort(key=lambda e: e.last)
+    return events
+
+
+class EventIndex:
+    """Events grouped by involved object and by owning controller.
+
+    Built once per fetch: pod events are keyed by the controller their name
+    encodes (ReplicaSet, StatefulSet, DaemonSet or Job), and ReplicaSet and
+    Job names seen in events are mapped to their Deployment or CronJob, so a
+    workload lookup touches only its own chain.
+    """
+
+    __slots__ = ("_by_namespace", "_by_object", "_by_pod_owner", "_children", "events")
+
+    def __init__(self, events: list[EventInfo]):
+        self.events = events
+        self._by_object: dict[tuple[str, str, str], list[EventInfo]] = {}
+        self._by_namespace: dict[str, list[EventInfo]] = {}
+        # (namespace, controller name) -> events of the pods it created
+        self._by_pod_owner: dict[tuple[str, str], list[EventInfo]] = {}
+        # (namespace, Deployment/CronJob, name) -> ReplicaSet/Job names
+        self._children: dict[tuple[str, str, str], set[str]] = {}
+        for event in events:
+            key = (event.kind, event.namespace, event.name)
+            self._by_object.setdefault(key, []).append(event)
+            self._by_namespace.setdefault(event.namespace, []).append(event)
+            if event.kind == "Pod":
+                owner = _owner_name(event.name)
+                self._by_pod_owner.setdefault((event.namespace, owner), []).append(
+                    event
+                )
+                self._add_child(event.namespace, "Pod", owner)
+            else:
+                self._add_child(event.namespace, event.kind, event.name)
+
+    def _add_child(self, namespace: str, kind: str, name: str) -> None:
+        """Record a ReplicaSet or Job under the workload its name encodes.
+
+        For a pod, ``name`` is its controller's name, which is only a
+        ReplicaSet or Job when it carries a generated suffix.
+        """
+        for child_kind, (parent, suffix) in _GENERATED.items():
+            if kind not in (child_kind, "Pod"):
+                continue
+            base, _, tail = name.rpartition("-")
+            if base and suffix.fullmatch(tail):
+                self._children.setdefault((namespace, parent, base), set()).add(name)
+
+    def for_object(self, kind: str, namespace: str, name: str) -> list[EventInfo]:
+        return self._by_object.get((kind, namespace, name), [])
+
+    def for_workload(
+        self, wl: WorkloadInfo, pods: Iterable[PodInfo] = ()
+    ) -> list[EventInfo]:
+        """Events on a workload, its ReplicaSets/Jobs and its pods, deduped."""
+        return dedupe(self._workload_events(wl, list(pods)))
+
+    def _workload_events(
+        self, wl: WorkloadInfo, pods: list[PodInfo]
+    ) -> list[EventInfo]:
+        """Raw events along the owner chain.
+
+        ``pods`` may be any superset of the workload's pods. Their owner
+        references add ReplicaSets or Jobs that have no events of their own;
+        events for pods that were already replaced are found through the
+        controller name their pod name encodes.
+        """
+        kind = WORKLOAD_KINDS.get(wl.kind, "")
+        child = _CHILD_KINDS.get(kind)
+        ns = wl.namespace
+        found: list[EventInfo] = list(self.for_object(kind, ns, wl.name))
+        if child:
+            controllers = set(self._children.get((ns, kind, wl.name), ()))
+        else:
+            # StatefulSets, DaemonSets and Jobs create their pods directly
+            controllers = {wl.name}
+        listed: list[PodInfo] = []
+        for pod in pods:
+            if pod.namespace != ns or not wl.matches_pod(pod):
+                continue
+            listed.append(pod)
+            if child and pod.owner and pod.owner[0] == child:
+                controllers.add(pod.owner[1])
+        for name in controllers:
+            if child:
+                found.extend(self.for_object(child, ns, name))
+            found.extend(self._by_pod_owner.get((ns, name), []))
+        for pod in listed:
+            if _owner_name(pod.name) not in controllers:
+                found.extend(self.for_object("Pod", ns, pod.name))
+        return found
+
+    def matching(self, namespace: str, needle: str) -> list[EventInfo]:
+        """Events in a namespace whose object name contains ``needle``."""
+        needle = needle.lower()
+        return [
+            e for e in self._by_namespace.get(namespace, []) if needle in e.name.lower()
+        ]
+
+    def for_app(
+        self,
+        app: str,
+        namespace: str,
+        workloads: Iterable[WorkloadInfo] = (),
+        pods: Iterable[PodInfo] = (),
+    ) -> list[EventInfo]:
+        """Workload-chain events plus objects named after the app, deduped.
+
+        The name match picks up HelmReleases, Kustomizations and PVCs, which
+        are not owned by the workload.
+        """
+        pods = list(pods)
+        found = self.matching(namespace, app)
+        for wl in workloads:
+            found.extend(self._workload_events(wl, pods))
+        return dedupe(found)
+
+
+def _owner_name(name: str) -> str:
+    """Strip the controller-generated suffix: "app-7d9f8-x2k4q" -> "app-7d9f8"."""
+    return name.rsplit("-", 1)[0]
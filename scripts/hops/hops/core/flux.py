@@ -0,0 +1,108 @@
+"""Flux inventory: every Kustomization and HelmRelease from one fetch.
+
+Flux lookups used to be scattered: status, hr and ks each listed their kind,
+suspend/resume listed again to find a namespace, and diagnose probed three
+names one `kubectl get` at a time. All of them now read one snapshot, fetched
+concurrently once per process and indexed by name.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+
+from hops.core.runner import gather, kubectl_json
+
+KUSTOMIZATION = "Kustomization"
+HELMRELEASE = "HelmRelease"
+
+RESOURCES = {
+    KUSTOMIZATION: "kustomizations.kustomize.toolkit.fluxcd.io",
+    HELMRELEASE: "helmreleases.helm.toolkit.fluxcd.io",
+}
+
+
+class FluxInventory:
+    """Snapshot of Flux objects indexed by kind and name."""
+
+    __slots__ = ("_by_name", "_items")
+
+    def __init__(self, items: dict[str, list[dict]]):
+        self._items = items
+        self._by_name: dict[tuple[str, str], list[dict]] = {}
+        for kind, kind_items in items.items():
+            for item in kind_items:
+                name = item["metadata"]["name"]
+                self._by_name.setdefault((kind, name), []).append(item)
+
+    def items(self, kind: str, namespace: str | None = None) -> list[dict]:
+        """All objects of a kind, optionally limited to one namespace."""
+        found = self._items.get(kind, [])
+        if namespace:
+            return [i for i in found if i["metadata"]["namespace"] == namespace]
+        return found
+
+    def resources(self) -> Iterator[tuple[str, dict]]:
+        """Every object paired with its kind label."""
+        for kind, kind_items in self._items.items():
+            for item in kind_items:
+                yield kind, item
+
+    def total(self, kind: str) -> int:
+        return len(self._items.get(kind, []))
+
+    def get(self, kind: str, name: str, *namespaces: str | None) -> dict | None:
+        """Object by exact name, preferring the given namespaces in order.
+
+        With no namespaces (or only None) the first object of that name in
+        any namespace is returned.
+        """
+        candidates = self._by_name.get((kind, name), [])
+        wanted = [ns for ns in namespaces if ns]
+        if not wanted:
+            return candidates[0] if candidates else None
+        for ns in wanted:
+            for item in candidates:
+                if item["metadata"]["namespace"] == ns:
+                    return item
+        return None
+
+    def find(
+        self, kind: str, name: str | None, namespace: str | None = None
+    ) -> list[dict]:
+        """Exact name matches, else substring matches, else everything."""
+        items = self.items(kind, namespace)
+        if not name:
+            return items
+        exact = [i for i in items if i["metadata"]["name"] == name]
+        if exact:
+            return exact
+        return [i for i in items if name in i["metadata"]["name"]]
+
+
+_cache: FluxInventory | None = None
+
+
+def inventory(quiet: bool = False) -> FluxInventory:
+    """Return the Flux inventory, fetched concurrently on first use.
+
+    Exits like ``run_json`` when a fetch fails; ``quiet`` suppresses the
+    error line for callers that treat Flux as optional.
+    """
+    global _cache
+    if _cache is None:
+        kinds = list(RESOURCES)
+        results = gather(
+            *(lambda r=RESOURCES[k]: kubectl_json(r, quiet=quiet) for k in kinds),
+        )
+        _cache = FluxInventory(
+            {kind: data.get("items", []) for kind, data in zip(kinds, results)}
+        )
+    return _cache
+
+
+def ready_condition(item: dict) -> dict | None:
+    """The Ready condition of a Flux object, if it reports one."""
+    for cond in item.get("status", {}).get("conditions", []):
+        if cond.get("type") == "Ready":
+            return cond
+    return None
@@ -1,36 +1,54 @@
 """Helm chart resolution and YAML value helpers.
 
-Extracted from flux.py. Used by flux values/defaults commands.
+Extracted from flux.py. Used by flux values/defaults commands. Chart default
+values are cached on disk per chart version (see chart_values), so repeated
+lookups skip the chart pull and work offline.
 """
 
 from __future__ import annotations
 
+import re
+from dataclasses import dataclass
+
 import click
 
+from hops.core import cache
+from hops.core.flux import HELMRELEASE, inventory
 from hops.core.format import info
-from hops.core.runner import run_json
+from hops.core.runner import run, run_json
+from hops.core.yamlpath import (
+    KeyIndex,
+    build_index,
+    enclosing_path,
+    lookup,
+    search_blocks,
+)
+
+# Bump when the cached entry layout or key index format changes
+_CACHE_FORMAT = "4"
+_EXACT_VERSION = re.compile(r"v?\d+(\.\d+)*([-+][\w.+-]*)?")
+
+
+@dataclass
+class ChartSource:
+    """Arguments for 'helm show values' and the identity of the chart version."""
+
+    args: list[str]
+    identity: tuple[str, ...] = ()  # Empty when the version is not pinned
 
 
 def resolve_hr(name: str, namespace: str | None) -> dict:
     """Resolve a HelmRelease by name, returning the resource dict."""
-    if namespace:
-        return run_json(
-            ["kubectl", "get", "helmrelease", name, "-n", namespace, "-o", "json"],
-            timeout=15,
-        )
-    all_data = run_json(
-        ["kubectl", "get", "helmreleases", "--all-namespaces", "-o", "json"],
-        timeout=15,
-    )
-    matches = [i for i in all_data.get("items", []) if i["metadata"]["name"] == name]
-    if not matches:
-        info(f"error: HelmRelease {name!r} not found")
+    hr = inventory().get(HELMRELEASE, name, namespace)
+    if hr is None:
+        where = f" in {namespace}" if namespace else ""
+        info(f"error: HelmRelease {name!r} not found{where}")
         raise SystemExit(1)
-    return matches[0]
+    return hr
 
 
-def helm_chart_args(hr: dict) -> list[str]:
-    """Build args for 'helm show values' from a HelmRelease's chart source."""
+def chart_source(hr: dict) -> ChartSource:
+    """Resolve a HelmRelease's chart source for 'helm show values'."""
     meta = hr.get("metadata", {})
     hr_name = meta.get("name", "")
     hr_ns = meta.get("namespace", "")
@@ -63,7 +81,10 @@ def helm_chart_args(hr: dict) -> list[str]:
             url = oci_data.get("spec", {}).get("url", "")
             tag = oci_data.get("spec", {}).get("ref", {}).get("tag", "")
             if url and tag:
-                return [f"{url}:{tag}"]
+                artifact = oci_data.get("status", {}).get("artifact", {})
+                digest = artifact.get("digest", "")
+                identity = ("oci", url, tag, digest) if digest else ()
+                return ChartSource([f"{url}:{tag}"], identity)
 
     if chart_spec:
         chart = chart_spec.get("chart", "")
@@ -88,121 +109,90 @@ def helm_chart_args(hr: dict) -> list[str]:
                 timeout=10,
             )
             repo_url = repo_data.get("spec", {}).get("url", "")
+            # A version range resolves to whatever the release last applied;
+            # fetch that exact version so the values match the cache key
+            pinned = version if _EXACT_VERSION.fullmatch(version) else last_revision
+            identity = ("repo", repo_url, chart, pinned) if pinned else ()
+            fetch_version = pinned or version
 
             if repo_url.startswith("oci://"):
                 ref = f"{repo_url}/{chart}"
-                if version:
-                    ref += f":{version}"
-                elif last_revision:
-                    ref += f":{last_revision}"
-                return [ref]
+                if fetch_version:
+                    ref += f":{fetch_version}"
+                return ChartSource([ref], identity)
             else:
                 args = [chart, "--repo", repo_url]
-                if version:
-                    args.extend(["--version", version])
-                return args
+                if fetch_version:
+                    args.extend(["--version", fetch_version])
+                return ChartSource(args, identity)
 
     info(f"error: could not resolve chart source for {hr_name}")
     raise SystemExit(1)
 
 
-def print_yaml_key(yaml_text: str, key_path: str):
-    """Extract a YAML subtree by dotted key path using yq."""
-    import subprocess
-
-    yq_expr = "." + ".".join(key_path.split("."))
-
-    proc = subprocess.run(
-        ["yq", yq_expr],
-        input=yaml_text,
-        capture_output=True,
-        text=True,
-        timeout=10,
+def chart_values(hr: dict, refresh: bool = False) -> tuple[str, KeyIndex]:
+    """Chart default values for a HelmRelease and their key index.
+
+    Values are cached by chart identity (reference, version and OCI digest
+    when known), so only the first lookup of a chart version pulls the chart.
+    Charts without a pinned version are fetched every time.
+    """
+    source = chart_source(hr)
+    key = None
+    if source.identity:
+        key = cache.content_key(_CACHE_FORMAT, *source.identity)
+    if key and not refresh:
+        entry = cache.load("charts", key)
+        if entry:
+            index = {path: (span[0], span[1]) for path, span in entry["index"].items()}
+            return entry["values"], index
+
+    result = run(
+        ["helm", "show", "values", *source.args],
+        timeout=30,
         check=False,
     )
+    if result.returncode != 0:
+        msg = (result.stderr or "").strip().split("\n")[0]
+        info(f"error: {msg}")
+        raise SystemExit(1)
 
-    if proc.returncode != 0:
-        _print_yaml_key_naive(yaml_text, key_path)
-        return
-
-    output = (proc.stdout or "").strip()
-    if output and output != "null":
-        click.echo(output)
-    else:
-        info(f"(key {key_path!r} not found in defaults)")
+    output = (result.stdout or "").strip()
+    index = build_index(output)
+    if key:
+        entry = {"chart": " ".join(source.args), "values": output, "index": index}
+        cache.store("charts", key, entry)
+    return output, index
 
 
-def _print_yaml_key_naive(yaml_text: str, key_path: str):
-    """Extract a YAML subtree without yq (indent-based heuristic)."""
-    parts = key_path.split(".")
-    lines = yaml_text.split("\n")
-    depth = 0
-    capturing = False
-    capture_indent = -1
-    result_lines: list[str] = []
-
-    for line in lines:
-        stripped = line.lstrip()
-        if not stripped or stripped.startswith("#"):
-            if capturing:
-                result_lines.append(line)
-            continue
-
-        indent = len(line) - len(stripped)
-
-        if capturing:
-            if indent > capture_indent:
-                result_lines.append(line)
-            else:
-                break
-        else:
-            expected_key = parts[depth] + ":"
-            if stripped.startswith(expected_key) and indent == depth * 2:
-                depth += 1
-                if depth == len(parts):
-                    after_key = stripped[len(expected_key) :].strip()
-                    if after_key and not after_key.startswith("#"):
-                        info(f"{key_path}: {after_key}")
-                        return
-                    capturing = True
-                    capture_indent = indent
-
-    if result_lines:
-        min_indent = min(
-            len(ln) - len(ln.lstrip()) for ln in result_lines if ln.strip()
-        )
-        for line in result_lines:
-            click.echo(line[min_indent:] if line.strip() else "")
+def print_yaml_key(yaml_text: str, key_path: str, index: KeyIndex | None = None):
+    """Extract a YAML subtree by key path (e.g. controller.extraArgs[0])."""
+    value = lookup(yaml_text, key_path.lstrip("."), index)
+    if value:
+        click.echo(value)
     else:
         info(f"(key {key_path!r} not found in defaults)")
 
 
-def print_search_results(yaml_text: str, term: str):
-    """Search YAML text for a term, showing matching lines with context."""
-    lines = yaml_text.split("\n")
-    term_lower = term.lower()
-    matches = []
+def print_search_results(yaml_text: str, term: str, index: KeyIndex | None = None):
+    """Search YAML text for a term, showing matching lines with context.
 
-    for i, line in enumerate(lines):
-        if term_lower in line.lower():
-            start = max(0, i - 2)
-            end = min(len(lines), i + 3)
-            matches.append((start, end))
+    Each block is headed by the key path its first match sits under.
+    """
+    lines = yaml_text.split("\n")
+    if index is None:
+        index = build_index(yaml_text)
 
-    if not matches:
-        info(f"(no matches for {term!r} in defaults)")
-        return
-
-    # Merge overlapping ranges
-    merged = [matches[0]]
-    for start, end in matches[1:]:
-        if start <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(end, merged[-1][1]))
-        else:
-            merged.append((start, end))
-
-    for i, (start, end) in enumerate(merged):
-        if i > 0:
+    found = False
+    for start, end, hit in search_blocks(lines, term):
+        if found:
             info("---")
+        found = True
+        path = enclosing_path(index, hit)
+        if path:
+            info(f"# {path}")
         for j in range(start, end):
             click.echo(f"{j + 1}: {lines[j]}")
+
+    if not found:
+        info(f"(no matches for {term!r} in defaults)")
@@ -0,0 +1,60 @@
+"""In-memory indexes over fetched Kubernetes resource lists."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping, Sequence
+
+from hops.core.model import PodInfo
+
+
+def group_by_owner(
+    items: Iterable[dict], owner: str | Callable[[dict], str]
+) -> dict[str, list[dict]]:
+    """Group namespaced resources under ``namespace/owner``.
+
+    ``owner`` is a label key (``cnpg.io/cluster``) or a callable for
+    resources that name their owner in the spec instead of a label. The
+    namespace prefix keeps same-named owners in different namespaces apart,
+    which is the mistake a bare name index makes.
+    """
+    groups: dict[str, list[dict]] = {}
+    for item in items:
+        meta = item.get("metadata", {})
+        if isinstance(owner, str):
+            name = meta.get("labels", {}).get(owner, "")
+        else:
+            name = owner(item)
+        groups.setdefault(f"{meta.get('namespace', '')}/{name}", []).append(item)
+    return groups
+
+
+class LabelIndex:
+    """Inverted index from (label key, value) to pods, built once per list.
+
+    Selector matching becomes an intersection of posting sets instead of a
+    scan of every pod per workload. Results keep the input order, so a
+    newest-first pod list stays newest-first.
+    """
+
+    __slots__ = ("_postings", "pods")
+
+    def __init__(self, pods: Sequence[PodInfo]):
+        self.pods = pods
+        self._postings: dict[tuple[str, str], set[int]] = {}
+        for i, pod in enumerate(pods):
+            for pair in pod.labels.items():
+                self._postings.setdefault(pair, set()).add(i)
+
+    def select(self, selector: Mapping[str, str]) -> list[PodInfo]:
+        """Pods whose labels include every ``selector`` pair."""
+        if not selector:
+            return list(self.pods)
+        postings = sorted(
+            (self._postings.get(pair, set()) for pair in selector.items()), key=len
+        )
+        matched = set(postings[0])
+        for posting in postings[1:]:
+            matched &= posting
+            if not matched:
+                break
+        return [self.pods[i] for i in sorted(matched)]
@@ -0,0 +1,77 @@
+"""LogSQL planning: stream-filter pushdown and default time bounds.
+
+VictoriaLogs prunes data in two steps. The time range selects partitions,
+and a ``{...}`` stream selector selects streams within them before any
+block is read. A field that is not a stream label inside ``{...}`` matches
+no stream, and a query with no time range scans every partition. The
+planner keeps the stream selector to real stream fields, turns everything
+else into field filters, and always bounds the time range.
+"""
+
+from __future__ import annotations
+
+import time
+
+from hops.core import cache
+from hops.core.time import TimeRange
+from hops.core.vlogs import VL_URL, VictoriaLogsClient
+
+# Window applied when a command is given no --from
+DEFAULT_WINDOW = "1h"
+
+_BUCKET = "vlogs"
+_TTL = 6 * 3600
+# Lookback used to discover which fields are stream labels
+_DISCOVERY_WINDOW = "1d"
+
+
+def stream_fields(client: VictoriaLogsClient) -> frozenset[str]:
+    """Stream label names, from the local cache when fresh."""
+    key = cache.content_key(VL_URL, "stream_field_names")
+    entry = cache.load(_BUCKET, key)
+    if entry and time.time() - entry["fetched"] < _TTL:
+        return frozenset(entry["fields"])
+    fields = sorted(
+        v["value"]
+        for v in client.query_stream_field_names("*", start=_DISCOVERY_WINDOW)
+        if v.get("value")
+    )
+    cache.store(_BUCKET, key, {"fetched": time.time(), "fields": fields})
+    return frozenset(fields)
+
+
+def plan_query(
+    filters: dict[str, str], search: str | None, stream: frozenset[str]
+) -> str:
+    """LogSQL for exact-match ``filters`` plus a free ``search`` term.
+
+    Stream fields go in the ``{...}`` selector; the rest become exact
+    field filters (``field:="value"``) evaluated on the selected streams.
+    """
+    selector = [f'{k}="{v}"' for k, v in filters.items() if k in stream]
+    terms = [f'{quote_field(k)}:="{v}"' for k, v in filters.items() if k not in stream]
+    parts = ["{" + ",".join(selector) + "}"] if selector else []
+    parts += terms
+    if search:
+        parts.append(search)
+    return " AND ".join(parts) if parts else "*"
+
+
+def quote_field(name: str) -> str:
+    """Field name as LogSQL accepts it, quoted unless it is a bare word."""
+    # Dotted names such as kubernetes.pod_name are valid bare field names
+    return name if name.replace(".", "").replace("_", "").isalnum() else f'"{name}"'
+
+
+def bounded(time_from: str | None, time_to: str | None = None) -> tuple[str, bool]:
+    """The start to query and whether the default window was applied.
+
+    The default window ends at ``time_to`` when one is given, so an old
+    ``--to`` alone does not produce a range that ends before it starts.
+    """
+    if time_from:
+        return time_from, False
+    if not time_to:
+        return DEFAULT_WINDOW, True
+    start = TimeRange(DEFAULT_WINDOW, time_to).bounds()[0]
+    return start.strftime("%Y-%m-%dT%H:%M:%SZ"), True
@@ -0,0 +1,189 @@
+"""Projected pod and workload models.
+
+kubectl returns full objects: specs, managedFields and status histories
+that hops never reads. ``PodInfo`` and ``WorkloadInfo`` keep only the
+fields commands use, extracted once when a list is fetched, so helpers read
+attributes instead of walking ``.get("metadata", {})`` chains and a
+cluster-wide pod list does not keep every object's JSON alive.
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import datetime
+
+from hops.core.format import age
+
+
+def epoch(timestamp: str | None) -> float:
+    """Convert an ISO timestamp to epoch seconds (0.0 when missing)."""
+    if not timestamp:
+        return 0.0
+    try:
+        return datetime.fromisoformat(timestamp).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def age_since(seconds: float) -> str:
+    """Human-readable age of an epoch timestamp ("?" when unknown)."""
+    return age(time.time() - seconds) if seconds else "?"
+
+
+class ContainerInfo:
+    """One containerStatuses/initContainerStatuses entry."""
+
+    __slots__ = ("image", "init", "last_terminated", "name", "restarts", "state")
+
+    def __init__(self, status: dict, init: bool = False):
+        self.name: str = status.get("name", "?")
+        self.image: str = status.get("image", "?")
+        self.init = init
+        self.restarts: int = status.get("restartCount", 0) or 0
+        self.state: dict = status.get("state") or {}
+        self.last_terminated: dict = (status.get("lastState") or {}).get(
+            "terminated"
+        ) or {}
+
+    @property
+    def reason(self) -> str:
+        """Waiting or terminated reason; empty while running."""
+        detail = self.state.get("waiting") or self.state.get("terminated") or {}
+        return detail.get("reason", "")
+
+
+class PodInfo:
+    """The parts of a Pod that hops reads."""
+
+    __slots__ = (
+        "containers",
+        "created",
+        "ip",
+        "labels",
+        "name",
+        "namespace",
+        "node",
+        "owner",
+        "phase",
+        "pvcs",
+    )
+
+    def __init__(self, item: dict):
+        meta = item.get("metadata", {})
+        spec = item.get("spec", {})
+        status = item.get("status", {})
+        self.name: str = meta.get("name", "")
+        self.namespace: str = meta.get("namespace", "")
+        self.labels: dict[str, str] = meta.get("labels") or {}
+        self.created = epoch(meta.get("creationTimestamp"))
+        # Controlling owner as (kind, name), e.g. ("ReplicaSet", "app-7d9f8")
+        self.owner: tuple[str, str] | None = next(
+            (
+                (ref.get("kind", ""), ref.get("name", ""))
+                for ref in meta.get("ownerReferences") or []
+                if ref.get("controller")
+            ),
+            None,
+        )
+        self.node: str = spec.get("nodeName", "")
+        self.phase: str = status.get("phase", "Unknown")
+        self.ip: str = status.get("podIP", "")
+        # App containers first, init containers last
+        self.containers = tuple(
+            [ContainerInfo(cs) for cs in status.get("containerStatuses", [])]
+            + [
+                ContainerInfo(cs, init=True)
+                for cs in status.get("initContainerStatuses", [])
+            ]
+        )
+        self.pvcs = _mounted_pvcs(spec)
+
+    @property
+    def restarts(self) -> int:
+        return sum(c.restarts for c in self.containers if not c.init)
+
+    def status_reason(self) -> str:
+        """First container waiting/terminated reason, else the phase."""
+        for container in self.containers:
+            if container.state.get("waiting") or container.state.get("terminated"):
+                return container.reason or self.phase
+        return self.phase
+
+    def age(self) -> str:
+        return age_since(self.created)
+
+
+def _mounted_pvcs(spec: dict) -> tuple[str, ...]:
+    containers = [*spec.get("containers", []), *spec.get("initContainers", [])]
+    mounted = {
+        mount.get("name")
+        for container in containers
+        for mount in container.get("volumeMounts", [])
+    }
+    return tuple(
+        volume["persistentVolumeClaim"].get("claimName", "?")
+        for volume in spec.get("volumes", [])
+        if volume.get("name") in mounted and volume.get("persistentVolumeClaim")
+    )
+
+
+def project_pods(data: dict) -> list[PodInfo]:
+    """Project a ``kubectl get pods -o json`` list, newest first."""
+    pods = [PodInfo(item) for item in data.get("items", [])]
+    pods.sort(key=lambda p: p.created, reverse=True)
+    return pods
+
+
+class WorkloadInfo:
+    """Workload identity, selector and pod template summary."""
+
+    __slots__ = (
+        "app",
+        "containers",
+        "desired",
+        "kind",
+        "labels",
+        "name",
+        "namespace",
+        "ready",
+        "selector",
+    )
+
+    def __init__(self, kind: str, item: dict):
+        meta = item.get("metadata", {})
+        spec = item.get("spec", {})
+        self.kind = kind
+        self.name: str = meta.get("name", "")
+        self.namespace: str = meta.get("namespace", "")
+        self.selector: dict[str, str] = (spec.get("selector") or {}).get(
+            "matchLabels"
+        ) or {}
+        status = item.get("status", {})
+        if kind == "daemonsets":
+            self.ready: int = status.get("numberReady", 0) or 0
+            self.desired: int = status.get("desiredNumberScheduled", 0) or 0
+        else:
+            self.ready = status.get("readyReplicas", 0) or 0
+            self.desired = status.get("replicas", spec.get("replicas", 0)) or 0
+        if kind == "cronjobs":
+            spec = spec.get("jobTemplate", {}).get("spec", {})
+        template = spec.get("template", {})
+        pod_spec = template.get("spec", {})
+        # Pod template labels and container names (init included)
+        self.labels: dict[str, str] = template.get("metadata", {}).get("labels") or {}
+        self.containers = tuple(
+            c.get("name", "")
+            for c in (
+                *pod_spec.get("containers", []),
+                *pod_spec.get("initContainers", []),
+            )
+        )
+        self.app: str = self.labels.get(
+            "app.kubernetes.io/name", self.labels.get("app", "")
+        )
+
+    def matches_pod(self, pod: PodInfo) -> bool:
+        """Return whether a pod belongs to this workload."""
+        if self.selector:
+            return self.selector.items() <= pod.labels.items()
+        return pod.name.startswith(self.name)
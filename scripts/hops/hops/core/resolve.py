@@ -18,8 +18,14 @@ from typing import Protocol
 
 import click
 
+from hops.core.model import PodInfo, WorkloadInfo
 from hops.core.runner import run_json
-from hops.core.workload import Workload, resolve_app, resolve_pods, suggest_near_matches
+from hops.core.workload import (
+    pods_for_workloads,
+    resolve_app,
+    resolve_pods,
+    suggest_near_matches,
+)
 
 
 class TargetKind:
@@ -37,8 +43,10 @@ class ResolvedTarget:
     kind: str  # TargetKind value
     name: str  # The matched name
     namespace: str
-    workload: Workload | None = None  # Set when kind == WORKLOAD
-    pods: list[dict] = field(default_factory=list)  # Set when kind in (WORKLOAD, POD)
+    workload: WorkloadInfo | None = None  # Set when kind == WORKLOAD
+    pods: list[PodInfo] = field(
+        default_factory=list
+    )  # Set when kind in (WORKLOAD, POD)
     explain: list[str] = field(default_factory=list)  # Resolution trace for --explain
 
 
@@ -60,14 +68,7 @@ class WorkloadResolver:
         if not wl:
             return None
 
-        from hops.core.runner import kubectl_json
-
-        data = kubectl_json("pods", namespace=wl.namespace)
-        pods = [p for p in data.get("items", []) if wl.matches_pod(p)]
-        pods.sort(
-            key=lambda p: p["metadata"].get("creationTimestamp", ""),
-            reverse=True,
-        )
+        pods = pods_for_workloads([wl])[wl]
 
         trace = (
             [f"matched workload {wl.kind}/{wl.name} in {wl.namespace}"]
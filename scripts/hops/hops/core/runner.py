@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import json
+import shlex
 import subprocess
 import sys
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import click
 
+from hops._profile import span
+
 
 def run(
     args: list[str],
@@ -22,14 +27,29 @@ def run(
     Never raises on a non-zero exit; callers inspect ``returncode``/``stderr``
     themselves. Missing binaries and timeouts print a one-line error and exit.
     """
+    return _run(args, timeout=timeout, capture=capture)
+
+
+def _run(
+    args: list[str],
+    *,
+    timeout: int,
+    capture: bool = True,
+    kind: str = "exec",
+    label: str | None = None,
+) -> subprocess.CompletedProcess[str]:
     try:
-        return subprocess.run(
-            args,
-            capture_output=capture,
-            text=True,
-            timeout=timeout,
-            check=False,
-        )
+        with span(kind, label or shlex.join(args), args) as rec:
+            result = subprocess.run(
+                args,
+                capture_output=capture,
+                text=True,
+                timeout=timeout,
+                check=False,
+            )
+            rec["exit"] = result.returncode
+            rec["bytes"] = len(result.stdout or "")
+            return result
     except FileNotFoundError:
         click.echo(f"error: {args[0]} not found in PATH", err=True)
         sys.exit(1)
@@ -100,6 +120,7 @@ def kubectl_json(
     *extra_args: str,
     namespace: str | None = None,
     timeout: int = 30,
+    quiet: bool = False,
 ) -> Any:
     """Run kubectl get with JSON output and return parsed data."""
     args = ["kubectl", "get", resource, "-o", "json"]
@@ -108,7 +129,64 @@ def kubectl_json(
     else:
         args.append("--all-namespaces")
     args.extend(extra_args)
-    return run_json(args, timeout=timeout)
+    return run_json(args, timeout=timeout, quiet=quiet)
+
+
+# ASCII unit/record separators: free-text fields (event messages) routinely
+# contain tabs and newlines, so those cannot delimit projected rows.
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+
+
+def kubectl_rows(
+    resource: str,
+    columns: list[str],
+    *extra_args: str,
+    namespace: str | None = None,
+    timeout: int = 30,
+) -> list[list[str]]:
+    """Run kubectl get with a jsonpath projection, one row of strings per item.
+
+    Each column is a jsonpath template fragment such as ``{.metadata.name}``
+    (nested ``{range}`` blocks are allowed); missing fields render empty.
+    Only the projected fields are serialized and parsed, instead of full
+    object JSON, which matters for cluster-wide pod lists.
+    """
+    template = "{range .items[*]}" + '{"\\x1f"}'.join(columns) + '{"\\x1e"}{end}'
+    args = ["kubectl", "get", resource, "-o", f"jsonpath={template}"]
+    if namespace:
+        args.extend(["-n", namespace])
+    else:
+        args.append("--all-namespaces")
+    args.extend(extra_args)
+    result = run(args, timeout=timeout)
+    if result.returncode != 0:
+        msg = (result.stderr or result.stdout or "").strip().split("\n")[0]
+        click.echo(f"error: kubectl failed: {msg}", err=True)
+        sys.exit(1)
+    records = result.stdout.split(_RECORD_SEP)
+    return [r.split(_FIELD_SEP) for r in records if r.strip()]
+
+
+def exclude_namespaces(namespaces: Iterable[str]) -> str:
+    """Field-selector terms dropping ``namespaces`` server-side."""
+    return ",".join(f"metadata.namespace!={ns}" for ns in sorted(namespaces))
+
+
+def gather(*calls: Callable[[], Any], limit: int | None = None) -> list[Any]:
+    """Run independent fetches concurrently, returning results in call order.
+
+    Every fetch here is a subprocess, so threads overlap the waiting and the
+    command costs its slowest call rather than the sum. A fetch that exits
+    (run_json on kubectl failure) re-raises that SystemExit in the caller.
+    ``limit`` caps how many run at once, for callers with many calls.
+    """
+    if len(calls) < 2 or limit == 1:
+        return [call() for call in calls]
+    workers = min(len(calls), limit) if limit else len(calls)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(call) for call in calls]
+        return [future.result() for future in futures]
 
 
 def kubectl_exec(
@@ -154,7 +232,7 @@ def tools_curl(
     if data is not None:
         cmd.extend(["--data", data])
     cmd.append(url)
-    result = run(cmd, timeout=timeout, check=False)
+    result = _run(cmd, timeout=timeout, kind="curl", label=f"{method} {url}")
     if result.returncode != 0:
         stderr = (result.stderr or "").strip()
         stdout = (result.stdout or "").strip()
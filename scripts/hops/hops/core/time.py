@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import UTC, datetime, timedelta, timezone
 
 import click
 
@@ -84,6 +84,18 @@ class TimeRange:
             return f"{self.to_duration()} ending {self.end}"
         return f"last {self.to_duration()}"
 
+    def bounds(self) -> tuple[datetime, datetime]:
+        """Absolute (start, end) in UTC, resolving durations against now.
+
+        Naive timestamps are UTC, as ``from_options`` writes them for --at.
+        """
+        start, end = self._parse_start_time(), self._parse_end_time()
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=UTC)
+        if end.tzinfo is None:
+            end = end.replace(tzinfo=UTC)
+        return start, end
+
     def to_range_params(self, step: str = "auto") -> dict[str, str]:
         params: dict[str, str] = {"step": self.auto_step() if step == "auto" else step}
         if self.start:
@@ -153,3 +165,14 @@ def time_options(default_from=None, support_at=False):
         return f
 
     return decorator
+
+
+def duration_seconds(value: str) -> int:
+    """Seconds in a duration such as 90s, 15m, 6h, 7d or 2w.
+
+    Raises ValueError for anything else so option callbacks can turn it into
+    a usage error instead of silently treating a typo as zero.
+    """
+    if not TimeRange._is_duration(value):
+        raise ValueError(f"invalid duration {value!r} (expected e.g. 30m, 6h, 7d)")
+    return TimeRange._duration_to_seconds(value)
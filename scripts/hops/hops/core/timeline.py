@@ -0,0 +1,114 @@
+"""Alert timelines: firing intervals from ALERTS range samples.
+
+``ALERTS{alertstate="firing"}`` only has samples while an alert fires, so a
+range result is a presence signal: consecutive samples one step apart are
+one firing interval and a missing step ends it. ``runs`` run-length encodes
+sample timestamps into intervals, ``merge`` unions intervals across
+instances, and ``fleet_timelines`` fetches one pre-aggregated series per
+alert so fleet-wide stats never pull the per-instance matrix.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from hops.core.time import TimeRange, duration_seconds
+from hops.core.vm import is_ignored_alert, query_vm
+
+Interval = tuple[float, float]
+
+# A sample more than this many steps after the previous one starts a new run
+_GAP_STEPS = 1.5
+
+
+def runs(timestamps: list[float], step: float) -> list[Interval]:
+    """Run-length encode presence samples into [start, end) intervals.
+
+    Each sample covers one step, so a run ends one step after its last
+    sample.
+    """
+    intervals: list[Interval] = []
+    start = prev = None
+    for ts in timestamps:
+        if prev is not None and ts - prev > step * _GAP_STEPS:
+            intervals.append((start, prev + step))
+            start = None
+        if start is None:
+            start = ts
+        prev = ts
+    if start is not None:
+        intervals.append((start, prev + step))
+    return intervals
+
+
+def merge(*interval_lists: list[Interval]) -> list[Interval]:
+    """Union of intervals, e.g. "any instance firing" across instances."""
+    merged: list[Interval] = []
+    for start, end in sorted(i for intervals in interval_lists for i in intervals):
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+        else:
+            merged.append((start, end))
+    return merged
+
+
+@dataclass
+class Timeline:
+    """Firing intervals for one alert (or instance) and derived stats."""
+
+    alertname: str
+    severity: str
+    intervals: list[Interval]
+
+    @property
+    def firing(self) -> float:
+        return sum(end - start for start, end in self.intervals)
+
+    @property
+    def flaps(self) -> int:
+        """Times the alert started firing."""
+        return len(self.intervals)
+
+    @property
+    def mttr(self) -> float:
+        """Mean firing interval length: how long it takes to resolve."""
+        return self.firing / self.flaps if self.flaps else 0.0
+
+    @property
+    def longest(self) -> float:
+        return max((end - start for start, end in self.intervals), default=0.0)
+
+    @property
+    def last_end(self) -> float:
+        return self.intervals[-1][1] if self.intervals else 0.0
+
+
+def fleet_timelines(time_range: TimeRange) -> tuple[list[Timeline], float]:
+    """One timeline per alert over the range, plus the window length.
+
+    The server collapses instances (``max by``) and ``max_over_time`` over
+    one step keeps firings shorter than the step visible, so the response
+    is one sparse series per alert rather than the per-instance matrix.
+    """
+    params = time_range.to_range_params()
+    step = params["step"]
+    params["query"] = (
+        "max by (alertname, severity) "
+        f'(max_over_time(ALERTS{{alertstate="firing"}}[{step}]))'
+    )
+    data = query_vm("/api/v1/query_range", params)
+    seconds = float(duration_seconds(step))
+    timelines = []
+    for result in data.get("data", {}).get("result", []):
+        metric = result.get("metric", {})
+        name = metric.get("alertname", "")
+        if is_ignored_alert(name):
+            continue
+        # Each sample summarizes the step before it
+        stamps = [float(ts) - seconds for ts, _ in result.get("values", [])]
+        timelines.append(
+            Timeline(name, metric.get("severity", "none"), runs(stamps, seconds))
+        )
+    window = float(duration_seconds(time_range.to_duration()))
+    return timelines, window
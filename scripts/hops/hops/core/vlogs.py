@@ -142,3 +142,17 @@ class VictoriaLogsClient:
             params["end"] = end
         result = self._post_json("/select/logsql/field_names", params)
         return result.get("values", [])
+
+    def query_stream_field_names(
+        self,
+        query: str,
+        start: str | None = None,
+        end: str | None = None,
+    ) -> list[dict[str, Any]]:
+        params: dict[str, str] = {"query": query}
+        if start:
+            params["start"] = start
+        if end:
+            params["end"] = end
+        result = self._post_json("/select/logsql/stream_field_names", params)
+        return result.get("values", [])
@@ -1,4 +1,4 @@
-"""VictoriaMetrics API helpers shared by metrics and alerts modules."""
+"""VictoriaMetrics API helpers shared by the query and incident domains."""
 
 from __future__ import annotations
 
@@ -12,6 +12,7 @@ from hops.core.runner import tools_curl
 
 VMSINGLE_URL = "http://vmsingle-victoria-metrics-k8s-stack.observability:8428"
 VMALERT_URL = "http://vmalert-victoria-metrics-k8s-stack.observability:8080"
+VMAGENT_URL = "http://vmagent-victoria-metrics-k8s-stack.observability:8429"
 
 IGNORED_ALERTS = {"Watchdog", "InfoInhibitor"}
 IGNORED_ALERT_PREFIXES = ("Unifi",)
@@ -38,6 +39,11 @@ def query_vmalert(endpoint: str) -> dict[str, Any]:
     )
 
 
+def query_vmagent(endpoint: str) -> dict[str, Any]:
+    """Query the VMAgent API (scrape targets) and return parsed JSON."""
+    return _parse(tools_curl(f"{VMAGENT_URL}{endpoint}", service_name="VMAgent"))
+
+
 def _parse(raw: str) -> dict[str, Any]:
     """Parse an API response, failing loudly on a backend-reported error.
 
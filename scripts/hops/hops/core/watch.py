@@ -0,0 +1,241 @@
+"""Live tables fed by Kubernetes watch streams.
+
+Re-running a listing command in a loop re-lists every object on every
+refresh. A watch costs one list up front and then one event per change, so
+``watch_table`` prints the initial table once and afterwards only the rows
+that appear, change or clear.
+
+Each stream lists through the raw API so the list carries a real
+``resourceVersion`` (kubectl's own ``-o json`` list wrapper does not) and
+watches from exactly that version, so no change between list and watch is
+missed. When the server ends a watch, or the version has expired, the
+stream lists again and the table is reconciled against the fresh list.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import signal
+import subprocess
+import threading
+import time
+from collections.abc import Callable
+from urllib.parse import urlencode
+
+import click
+
+from hops.core.format import info, table
+from hops.core.runner import run
+
+# Returns the row to show for an object, or None when it should be hidden
+RowFn = Callable[[str, dict], list[str] | None]
+
+# Exit codes of a kubectl child that Ctrl-C (or our own stop) ended
+_INTERRUPTED = {-signal.SIGINT, -signal.SIGTERM, 130}
+
+_SYNC = "SYNC"
+
+
+def _first_line(result: subprocess.CompletedProcess[str]) -> str:
+    text = (result.stderr or result.stdout or "").strip()
+    return text.split("\n")[0] or f"exit status {result.returncode}"
+
+
+def _api_path(resource: str, namespace: str | None) -> str:
+    """Collection path for ``pods`` or ``<plural>.<group>``.
+
+    Group resources are served at the group's preferred version.
+    """
+    plural, _, group = resource.partition(".")
+    if group:
+        result = run(["kubectl", "get", "--raw", f"/apis/{group}"], check=False)
+        if result.returncode != 0:
+            raise RuntimeError(_first_line(result))
+        base = f"/apis/{json.loads(result.stdout)['preferredVersion']['groupVersion']}"
+    else:
+        base = "/api/v1"
+    scope = f"/namespaces/{namespace}" if namespace else ""
+    return f"{base}{scope}/{plural}"
+
+
+class _Stream(threading.Thread):
+    """List, then watch from the list's version; re-list when the watch ends."""
+
+    def __init__(
+        self,
+        label: str,
+        resource: str,
+        namespace: str | None,
+        params: dict[str, str],
+        events: queue.Queue,
+    ):
+        super().__init__(daemon=True)
+        self.label = label
+        self.resource = resource
+        self.namespace = namespace
+        self.params = params
+        self.events = events
+        self.error = ""
+        self.proc: subprocess.Popen[str] | None = None
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        try:
+            path = _api_path(self.resource, self.namespace)
+            while not self.stopped.is_set():
+                version = self._list(path)
+                if version is None or not self._watch(path, version):
+                    break
+        except (RuntimeError, SystemExit, ValueError, KeyError) as exc:
+            if not self.stopped.is_set():
+                self.error = str(exc) or "kubectl failed"
+        self.events.put(None)
+
+    def _list(self, path: str) -> str | None:
+        query = f"?{urlencode(self.params)}" if self.params else ""
+        result = run(["kubectl", "get", "--raw", path + query], timeout=60)
+        if result.returncode != 0:
+            if not self.stopped.is_set():
+                self.error = _first_line(result)
+            return None
+        data = json.loads(result.stdout)
+        self.events.put((self.label, _SYNC, data.get("items", [])))
+        return data.get("metadata", {}).get("resourceVersion", "")
+
+    def _watch(self, path: str, version: str) -> bool:
+        """Stream events until the server closes the watch; False on error."""
+        params = {
+            **self.params,
+            "watch": "1",
+            "resourceVersion": version,
+            "allowWatchBookmarks": "true",
+        }
+        try:
+            self.proc = subprocess.Popen(
+                ["kubectl", "get", "--raw", f"{path}?{urlencode(params)}"],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+            )
+        except FileNotFoundError:
+            self.error = "kubectl not found in PATH"
+            return False
+        for line in self.proc.stdout or ():
+            try:
+                event = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            kind = event.get("type", "")
+            if kind == "ERROR":
+                # Usually 410 Gone: the version expired, so list again
+                break
+            if kind != "BOOKMARK":
+                self.events.put((self.label, kind, event.get("object", {})))
+        self.proc.terminate()
+        stderr = self.proc.stderr.read() if self.proc.stderr else ""
+        code = self.proc.wait()
+        if code not in (0, *_INTERRUPTED) and not self.stopped.is_set():
+            self.error = stderr.strip().split("\n")[0] or f"exit status {code}"
+            return False
+        return True
+
+    def stop(self) -> None:
+        self.stopped.set()
+        if self.proc and self.proc.poll() is None:
+            self.proc.terminate()
+
+
+def watch_table(
+    resources: dict[str, str],
+    headers: list[str],
+    row: RowFn,
+    *,
+    namespace: str | None = None,
+    field_selector: str | None = None,
+    empty: str = "No rows.",
+) -> None:
+    """Print a table of ``row`` results, then stream changes until Ctrl-C.
+
+    ``resources`` maps a label (passed to ``row``) to the kubectl resource to
+    watch; each gets its own stream. The table is printed once every stream
+    has listed. Change lines carry a timestamp and a tag: ``new`` (row
+    appeared), ``changed`` or ``cleared`` (object deleted or ``row`` returned
+    None).
+    """
+    events: queue.Queue = queue.Queue()
+    params = {"fieldSelector": field_selector} if field_selector else {}
+    streams = [
+        _Stream(label, resource, namespace, params, events)
+        for label, resource in resources.items()
+    ]
+    for stream in streams:
+        stream.start()
+
+    state: dict[tuple[str, str, str], list[str]] = {}
+    pending = set(resources)
+    live = len(streams)
+
+    def emit(old: list[str] | None, new: list[str] | None) -> None:
+        if pending:
+            return
+        tag = "new" if old is None else "cleared" if new is None else "changed"
+        stamp = time.strftime("%H:%M:%S")
+        click.echo(f"{stamp}  {tag:<7}  " + "  ".join(new or old or []))
+
+    def apply(key: tuple[str, str, str], new: list[str] | None) -> None:
+        old = state.get(key)
+        if new == old:
+            return
+        if new is None:
+            del state[key]
+        else:
+            state[key] = new
+        emit(old, new)
+
+    try:
+        while live:
+            item = events.get()
+            if item is None:
+                live -= 1
+                if any(s.error for s in streams):
+                    break
+                continue
+            label, kind, payload = item
+            if kind == _SYNC:
+                # Reconcile the label's rows against a full list
+                seen = set()
+                for obj in payload:
+                    key = _key(label, obj)
+                    seen.add(key)
+                    apply(key, row(label, obj))
+                for key in [k for k in state if k[0] == label and k not in seen]:
+                    apply(key, None)
+                if label in pending:
+                    pending.discard(label)
+                    if not pending:
+                        if state:
+                            table(headers, sorted(state.values()))
+                        else:
+                            info(empty)
+                        info("(watching for changes, Ctrl-C to stop)")
+                continue
+            apply(
+                _key(label, payload), None if kind == "DELETED" else row(label, payload)
+            )
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for stream in streams:
+            stream.stop()
+
+    errors = [f"{s.label}: {s.error}" for s in streams if s.error]
+    for error in errors:
+        click.echo(f"error: kubectl watch failed: {error}", err=True)
+    if errors:
+        raise SystemExit(1)
+
+
+def _key(label: str, obj: dict) -> tuple[str, str, str]:
+    meta = obj.get("metadata", {})
+    return (label, meta.get("namespace", ""), meta.get("name", ""))
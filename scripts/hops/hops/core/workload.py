@@ -12,10 +12,22 @@ matching strategies, ordered by specificity:
 
 from __future__ import annotations
 
-from hops.core.runner import kubectl_json
+import json
+
+from hops.core.index import LabelIndex
+from hops.core.model import PodInfo, WorkloadInfo, project_pods
+from hops.core.runner import gather, kubectl_json, kubectl_rows
 
 WORKLOAD_KINDS = ("deployments", "statefulsets", "daemonsets", "cronjobs", "jobs")
 
+# Workload identity projection: what match_workloads reads, without specs
+_IDENTITY_COLUMNS = [
+    "{.kind}",
+    "{.metadata.namespace}",
+    "{.metadata.name}",
+    "{.spec.template.metadata.labels}{.spec.jobTemplate.spec.template.metadata.labels}",
+]
+
 
 def _segments_contain(name_norm: str, wl_name: str) -> bool:
     """Check if normalized input matches a contiguous run of segments.
@@ -49,88 +61,81 @@ KIND_LABELS = {
 }
 
 
-class Workload:
-    """Resolved workload with metadata needed by callers."""
-
-    __slots__ = ("kind", "name", "namespace", "raw")
-
-    def __init__(self, namespace: str, name: str, kind: str, raw: dict):
-        self.namespace = namespace
-        self.name = name
-        self.kind = kind
-        self.raw = raw
-
-    def pod_template(self) -> dict:
-        """Extract the pod template spec from the workload."""
-        spec = self.raw.get("spec", {})
-        if self.kind == "cronjobs":
-            spec = spec.get("jobTemplate", {}).get("spec", {})
-        return spec.get("template", {})
-
-    def pod_labels(self) -> dict:
-        """Labels from the pod template metadata."""
-        return self.pod_template().get("metadata", {}).get("labels", {})
-
-    def pod_spec(self) -> dict:
-        """The pod spec from the template."""
-        return self.pod_template().get("spec", {})
-
-    def app_label(self) -> str:
-        """The effective app name from pod labels."""
-        labels = self.pod_labels()
-        return labels.get("app.kubernetes.io/name", labels.get("app", ""))
-
-    def matches_pod(self, pod: dict) -> bool:
-        """Return whether a pod belongs to this workload."""
-        selector = self.raw.get("spec", {}).get("selector", {}).get("matchLabels", {})
-        labels = pod.get("metadata", {}).get("labels", {})
-
-        if selector:
-            return all(labels.get(key) == value for key, value in selector.items())
-
-        return pod.get("metadata", {}).get("name", "").startswith(self.name)
-
-
 def find_workloads(
     name: str,
     namespace: str | None = None,
-) -> list[Workload]:
+) -> list[WorkloadInfo]:
     """Find workloads matching name with cascading match strategies.
 
     Returns only the highest-priority tier that has matches (exact > label
     > suffix > prefix). Within a tier, results are sorted by namespace
     then name.
     """
-    exact: list[Workload] = []
-    by_label: list[Workload] = []
-    suffix: list[Workload] = []
-    prefix: list[Workload] = []
-    substring: list[Workload] = []
+    return match_workloads(name, list_workloads(namespace))
+
+
+def list_workloads(
+    namespace: str | None = None,
+    *extra_args: str,
+    kinds: tuple[str, ...] = WORKLOAD_KINDS,
+) -> list[WorkloadInfo]:
+    """Fetch and project every workload of ``kinds``."""
+    return [
+        WorkloadInfo(kind, item)
+        for kind in kinds
+        for item in kubectl_json(kind, *extra_args, namespace=namespace).get(
+            "items", []
+        )
+    ]
+
+
+def app_namespace(name: str) -> str | None:
+    """Namespace of the best workload match for ``name``, cluster-wide.
+
+    Projects only kind, name and pod template labels, so locating an app
+    does not pull every workload's full object.
+    """
+    workloads = []
+    for kind, namespace, wl_name, labels in kubectl_rows(
+        ",".join(WORKLOAD_KINDS), _IDENTITY_COLUMNS
+    ):
+        kind = f"{kind.lower()}s"
+        template = {"metadata": {"labels": json.loads(labels or "{}")}}
+        spec = {"template": template}
+        if kind == "cronjobs":
+            spec = {"jobTemplate": {"spec": spec}}
+        meta = {"name": wl_name, "namespace": namespace}
+        workloads.append(WorkloadInfo(kind, {"metadata": meta, "spec": spec}))
+    matched = match_workloads(name, workloads)
+    return matched[0].namespace if matched else None
+
+
+def match_workloads(name: str, workloads: list[WorkloadInfo]) -> list[WorkloadInfo]:
+    """Apply the cascading match strategies to an already fetched list."""
+    exact: list[WorkloadInfo] = []
+    by_label: list[WorkloadInfo] = []
+    suffix: list[WorkloadInfo] = []
+    prefix: list[WorkloadInfo] = []
+    substring: list[WorkloadInfo] = []
     name_norm = name.lower().replace("-", "")
 
-    for kind in WORKLOAD_KINDS:
-        data = kubectl_json(kind, namespace=namespace)
-        for item in data.get("items", []):
-            meta = item.get("metadata", {})
-            wl_name = meta.get("name", "")
-            wl_ns = meta.get("namespace", "")
-            wl = Workload(wl_ns, wl_name, kind, item)
-
-            if wl_name == name:
-                exact.append(wl)
-            else:
-                if wl.app_label() == name:
-                    by_label.append(wl)
-                if wl_name.endswith(f"-{name}"):
-                    suffix.append(wl)
-                if wl_name.startswith(f"{name}-"):
-                    prefix.append(wl)
-                if (
-                    wl not in prefix
-                    and wl not in suffix
-                    and _segments_contain(name_norm, wl_name)
-                ):
-                    substring.append(wl)
+    for wl in workloads:
+        wl_name = wl.name
+        if wl_name == name:
+            exact.append(wl)
+        else:
+            if wl.app == name:
+                by_label.append(wl)
+            if wl_name.endswith(f"-{name}"):
+                suffix.append(wl)
+            if wl_name.startswith(f"{name}-"):
+                prefix.append(wl)
+            if (
+                wl not in prefix
+                and wl not in suffix
+                and _segments_contain(name_norm, wl_name)
+            ):
+                substring.append(wl)
 
     result = exact or by_label or suffix or prefix or substring
     result.sort(key=lambda w: (w.namespace, w.name))
@@ -182,15 +187,52 @@ def suggest_near_matches(name: str, namespace: str | None = None) -> list[str]:
 def resolve_app(
     name: str,
     namespace: str | None = None,
-) -> Workload | None:
+) -> WorkloadInfo | None:
     """Resolve an app name to a single workload (first match)."""
     matches = find_workloads(name, namespace)
     return matches[0] if matches else None
 
 
+def list_pods(namespace: str | None = None, *extra_args: str) -> list[PodInfo]:
+    """Fetch pods once and project them, newest first."""
+    return project_pods(kubectl_json("pods", *extra_args, namespace=namespace))
+
+
+def pods_for_workloads(
+    workloads: list[WorkloadInfo], pods: list[PodInfo] | None = None
+) -> dict[WorkloadInfo, list[PodInfo]]:
+    """Pods for many workloads in one pass, newest first per workload.
+
+    Without ``pods``, each namespace involved is fetched once (concurrently).
+    Every pod list is indexed by label once and each workload selector is
+    then a set intersection; selector-less workloads (CronJobs) fall back to
+    the pod name prefix.
+    """
+    if pods is None:
+        namespaces = sorted({wl.namespace for wl in workloads})
+        fetched = gather(*(lambda ns=ns: list_pods(ns) for ns in namespaces))
+        by_ns = dict(zip(namespaces, fetched, strict=True))
+    else:
+        by_ns = {}
+        for pod in pods:
+            by_ns.setdefault(pod.namespace, []).append(pod)
+
+    indexes = {ns: LabelIndex(ns_pods) for ns, ns_pods in by_ns.items()}
+    result: dict[WorkloadInfo, list[PodInfo]] = {}
+    for wl in workloads:
+        index = indexes.get(wl.namespace)
+        if index is None:
+            result[wl] = []
+        elif wl.selector:
+            result[wl] = index.select(wl.selector)
+        else:
+            result[wl] = [p for p in index.pods if p.name.startswith(wl.name)]
+    return result
+
+
 def resolve_pods(
     name: str, namespace: str | None = None
-) -> tuple[str, list[dict]] | None:
+) -> tuple[str, list[PodInfo]] | None:
     """Resolve a name to pods, newest-first, across workload and orphan cases.
 
     Strategy (in order):
@@ -203,51 +245,38 @@ def resolve_pods(
     """
     wl = resolve_app(name, namespace)
     if wl:
-        data = kubectl_json("pods", namespace=wl.namespace)
-        pods = [p for p in data.get("items", []) if wl.matches_pod(p)]
-        pods.sort(
-            key=lambda p: p["metadata"].get("creationTimestamp", ""),
-            reverse=True,
-        )
+        pods = pods_for_workloads([wl])[wl]
         if pods:
             return wl.namespace, pods
 
-    data = kubectl_json("pods", namespace=namespace)
     orphans = [
         p
-        for p in data.get("items", [])
-        if p["metadata"]["name"] == name or p["metadata"]["name"].startswith(f"{name}-")
+        for p in list_pods(namespace)
+        if p.name == name or p.name.startswith(f"{name}-")
     ]
     if not orphans:
         return None
-    orphans.sort(
-        key=lambda p: p["metadata"].get("creationTimestamp", ""),
-        reverse=True,
-    )
-    return orphans[0]["metadata"]["namespace"], orphans
+    return orphans[0].namespace, orphans
 
 
-def select_pods_for_logs(pods: list[dict]) -> list[dict]:
+def select_pods_for_logs(pods: list[PodInfo]) -> list[PodInfo]:
     """Select every running replica, or the best terminated pod.
 
     Input must be newest-first. Reading every running replica avoids blind
     spots in load-balanced workloads without mixing in stale ReplicaSet pods.
     """
-    running = [pod for pod in pods if pod.get("status", {}).get("phase") == "Running"]
+    running = [pod for pod in pods if pod.phase == "Running"]
     if running:
         return running
 
     phase_priority = {"Running": 0, "Succeeded": 1, "Failed": 2}
-    chosen = min(
-        pods, key=lambda p: phase_priority.get(p.get("status", {}).get("phase", ""), 3)
-    )
+    chosen = min(pods, key=lambda p: phase_priority.get(p.phase, 3))
     return [chosen]
 
 
-def find_running_pod(wl: Workload) -> str | None:
+def find_running_pod(wl: WorkloadInfo) -> str | None:
     """Find a Running pod name for a workload. Returns None if not found."""
-    data = kubectl_json("pods", namespace=wl.namespace)
-    for p in data.get("items", []):
-        if wl.matches_pod(p) and p.get("status", {}).get("phase") == "Running":
-            return p["metadata"]["name"]
+    for p in pods_for_workloads([wl])[wl]:
+        if p.phase == "Running":
+            return p.name
     return None
@@ -0,0 +1,282 @@
+"""In-process YAML path queries over a line-span index.
+
+hops only depends on click, so YAML is never fully parsed. Instead one pass
+over the text records, for every mapping key and sequence item, the span of
+lines holding it and its value. Paths are dotted keys with optional indexes
+(`controller.extraArgs[0]`, `spec.groups[1].rules`). Lookups slice the
+original text, which keeps the source's comments and formatting in the
+output.
+
+Keys containing dots are indexed in double quotes so paths stay unambiguous
+(`metadata.annotations."kubernetes.io/ingress.class"`).
+
+The index is not a YAML parser. It cannot index into flow collections
+(`command: [a, b]` is one value), resolve anchors, aliases or `<<` merge
+keys, or follow keys that span lines. ``lookup`` hands those cases, and any
+path the index misses, to yq when it is installed.
+
+The index covers a single document; use split_documents for multi-document
+files.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shutil
+import subprocess
+from collections.abc import Iterator
+
+_KEY = re.compile(
+    r"""^(?P<key>"(?:[^"\\]|\\.)*"|'[^']*'|[^\s#'"-][^:#]*?|-[^\s:#][^:#]*?)\s*:(?:\s+(?P<value>.*))?$"""
+)
+_BLOCK_SCALAR = re.compile(r"^[|>][-+0-9]*\s*(?:#.*)?$")
+_DOCUMENT = re.compile(r"^(---|\.\.\.)(\s.*)?$")
+# Anchors and tags ahead of a value (`&probes`, `!!str`)
+_PROPERTIES = re.compile(r"^(?:[&!]\S*(?:\s+|$))+")
+# Aliases and merge keys in a value mean the text alone does not hold it
+_UNRESOLVED = re.compile(r"(?:^|[\s\[{,])\*[^\s,\]}]+|^\s*(?:- )?<<\s*:", re.MULTILINE)
+# Path segments: quoted keys, [n] indexes and plain keys
+_SEGMENT = re.compile(r'"(?:[^"\\]|\\.)*"|\[\d+\]|[^.\[\]"]+')
+
+KeyIndex = dict[str, tuple[int, int]]
+
+
+def _unquote(key: str) -> str:
+    if len(key) >= 2 and key[0] == key[-1] and key[0] in "\"'":
+        return key[1:-1]
+    return key
+
+
+def _scalar(value: str) -> str:
+    """Inline value without its anchor or tag and any trailing comment."""
+    value = _PROPERTIES.sub("", value.strip())
+    if value.startswith("#"):
+        return ""
+    if value[:1] not in ("'", '"'):
+        value = value.split(" #", 1)[0].rstrip()
+    return value
+
+
+def split_documents(text: str) -> list[str]:
+    """Split multi-document YAML on '---' markers, dropping empty documents."""
+    docs: list[list[str]] = [[]]
+    for line in text.split("\n"):
+        if _DOCUMENT.match(line):
+            docs.append([])
+        else:
+            docs[-1].append(line)
+    return [
+        "\n".join(doc)
+        for doc in docs
+        if any(ln.strip() and not ln.lstrip().startswith("#") for ln in doc)
+    ]
+
+
+def build_index(text: str) -> KeyIndex:
+    """Map every key and item path to the (start, end) line span it covers."""
+    spans: KeyIndex = {}
+    # (indent, path, first line, is sequence item)
+    stack: list[tuple[int, str, int, bool]] = []
+    counts: dict[str, int] = {}
+    last = 0
+    block_indent: int | None = None
+
+    def close_to(indent: int, is_item: bool):
+        while stack:
+            top_indent, top_path, top_start, top_item = stack[-1]
+            if top_indent < indent:
+                break
+            # A sequence may sit at the same indent as the key that owns it
+            if top_indent == indent and is_item and not top_item:
+                break
+            stack.pop()
+            spans[top_path] = (top_start, last + 1)
+
+    for n, line in enumerate(text.split("\n")):
+        stripped = line.lstrip(" ")
+        indent = len(line) - len(stripped)
+        if block_indent is not None and stripped:
+            # Block scalar content, "#" lines included, until dedent
+            if indent > block_indent:
+                last = n
+                continue
+            block_indent = None
+        if not stripped or stripped.startswith("#") or _DOCUMENT.match(line):
+            continue
+
+        is_item = _is_item(stripped)
+        close_to(indent, is_item)
+        last = n
+
+        body = stripped
+        if is_item:
+            while True:
+                parent = stack[-1][1] if stack else ""
+                position = counts.get(parent, 0)
+                counts[parent] = position + 1
+                stack.append((indent, f"{parent}[{position}]", n, True))
+                body = stripped[1:].lstrip(" ")
+                if not _is_item(body):
+                    break
+                # "- - a": a nested sequence opens at the second dash's column
+                indent += len(stripped) - len(body)
+                stripped = body
+            if _BLOCK_SCALAR.match(body):
+                block_indent = indent
+                continue
+            # The item's mapping opens at the column after "- "
+            indent += len(stripped) - len(body)
+
+        match = _KEY.match(body)
+        if not match:
+            continue
+        if _BLOCK_SCALAR.match(match.group("value") or ""):
+            block_indent = indent
+        parent = stack[-1][1] if stack else ""
+        key = _unquote(match.group("key"))
+        if "." in key:
+            key = json.dumps(key)
+        stack.append((indent, f"{parent}.{key}" if parent else key, n, False))
+
+    while stack:
+        _, path, start, _ = stack.pop()
+        spans[path] = (start, last + 1)
+    return spans
+
+
+def _is_item(text: str) -> bool:
+    return text == "-" or text.startswith("- ")
+
+
+def _items_opening(index: KeyIndex, path: str, line: int) -> int:
+    """How many sequence items, innermost ``path`` outwards, open on ``line``."""
+    count = 0
+    while path.endswith("]") and index.get(path, (None,))[0] == line:
+        count += 1
+        path = path[: path.rindex("[")]
+    return count
+
+
+def extract(text: str, index: KeyIndex, path: str) -> str | None:
+    """Return the value at a path as dedented YAML, or None if absent."""
+    span = index.get(path)
+    if span is None:
+        return None
+    lines = text.split("\n")[span[0] : span[1]]
+    first = lines[0]
+    stripped = first.lstrip(" ")
+
+    if path.endswith("]"):
+        # Sequence item: drop its dash, and those of enclosing items opened
+        # on the same line, keeping the body at its own column
+        body = stripped
+        for _ in range(_items_opening(index, path, span[0])):
+            body = body[1:].lstrip(" ")
+        if len(lines) == 1 and not _KEY.match(body):
+            return _scalar(body)
+        if _BLOCK_SCALAR.match(body):
+            lines = lines[1:]
+        else:
+            lines = [" " * (len(first) - len(body)) + body, *lines[1:]]
+    else:
+        while _is_item(stripped):
+            stripped = stripped[1:].lstrip(" ")
+        match = _KEY.match(stripped)
+        inline = _scalar(match.group("value") or "") if match else ""
+        lines = lines[1:]
+        if not any(ln.strip() for ln in lines) or not _opens_block(inline):
+            return inline
+
+    indent = min(len(ln) - len(ln.lstrip(" ")) for ln in lines if ln.strip())
+    return "\n".join(ln[indent:] for ln in lines).rstrip("\n")
+
+
+def indexed(text: str, index: KeyIndex, path: str) -> str | None:
+    """The index's answer for a path, or None where a parser is needed.
+
+    That is when the path is missing or its value holds aliases or merge
+    keys, which the text alone does not resolve.
+    """
+    value = extract(text, index, path)
+    if value is None or _UNRESOLVED.search(value):
+        return None
+    return value
+
+
+def lookup(text: str, path: str, index: KeyIndex | None = None) -> str | None:
+    """Value at a path, asking yq where the line index cannot answer.
+
+    Without yq the index's raw answer (possibly None) stands.
+    """
+    if index is None:
+        index = build_index(text)
+    value = indexed(text, index, path)
+    if value is not None:
+        return value
+    parsed = _yq(text, path)
+    return extract(text, index, path) if parsed is None else parsed or None
+
+
+def _yq(text: str, path: str) -> str | None:
+    """Value at a path via yq: '' when absent, None when yq is unavailable."""
+    if not shutil.which("yq"):
+        return None
+    expr = "".join(
+        seg if seg[0] == "[" else f".{seg}" if seg[0] == '"' else f".{json.dumps(seg)}"
+        for seg in _SEGMENT.findall(path)
+    )
+    try:
+        proc = subprocess.run(
+            ["yq", expr or "."],
+            input=text,
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    output = proc.stdout.strip()
+    if proc.returncode != 0:
+        return None
+    return "" if output == "null" else output
+
+
+def _opens_block(inline: str) -> bool:
+    """Whether a key's inline value leaves its content to the lines below."""
+    return not inline or bool(_BLOCK_SCALAR.match(inline))
+
+
+def enclosing_path(index: KeyIndex, line: int) -> str | None:
+    """Deepest indexed path whose span contains a zero-based line number."""
+    best: str | None = None
+    best_size = 0
+    for path, (start, end) in index.items():
+        if start <= line < end and (best is None or end - start < best_size):
+            best, best_size = path, end - start
+    return best
+
+
+def search_blocks(
+    lines: list[str], term: str, context: int = 2
+) -> Iterator[tuple[int, int, int]]:
+    """Stream (start, end, first hit) blocks of lines around matches of term.
+
+    Overlapping context windows are merged as the scan goes, so blocks are
+    produced in order without collecting every match first.
+    """
+    term = term.lower()
+    block: list[int] | None = None
+    for n, line in enumerate(lines):
+        if term not in line.lower():
+            continue
+        start, end = max(0, n - context), min(len(lines), n + context + 1)
+        if block and start <= block[1]:
+            block[1] = end
+            continue
+        if block:
+            yield block[0], block[1], block[2]
+        block = [start, end, n]
+    if block:
+        yield block[0], block[1], block[2]
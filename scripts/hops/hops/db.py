@@ -7,11 +7,14 @@ audit database health, replica placement, and backup status.
 
 from __future__ import annotations
 
+import json
+
 import click
 
 from hops._click import HelpfulGroup
 from hops.core.format import age_str, info, kv, section, table
-from hops.core.runner import kubectl_json, run
+from hops.core.index import group_by_owner
+from hops.core.runner import gather, kubectl_json, run
 
 
 @click.group("db", cls=HelpfulGroup, no_args_is_help=True)
@@ -19,136 +22,186 @@ def cli():
     """CloudNativePG database operations."""
 
 
-@cli.command("status")
-def status_cmd():
-    """Overview of all CNPG clusters: replicas, nodes, PDBs, backups, resources."""
-    clusters_data = kubectl_json("cluster.postgresql.cnpg.io")
-    clusters = clusters_data.get("items", [])
-    if not clusters:
-        info("No CNPG clusters found.")
-        return
+_CLUSTER_LABEL = "cnpg.io/cluster"
 
-    # Fetch all CNPG-labeled pods, PVCs, and PDBs in one pass each
-    pods_data = kubectl_json("pods", "-l", "cnpg.io/cluster")
-    pvcs_data = kubectl_json("pvc", "-l", "cnpg.io/cluster")
-    pdbs_data = kubectl_json("pdb", "-l", "cnpg.io/cluster")
 
-    # Fetch actual memory usage via kubectl top
-    top_result = run(
-        ["kubectl", "top", "pods", "-A", "-l", "cnpg.io/cluster", "--no-headers"],
+def _top_memory() -> dict[str, str]:
+    """Actual memory per CNPG pod (``ns/pod``) from kubectl top."""
+    result = run(
+        ["kubectl", "top", "pods", "-A", "-l", _CLUSTER_LABEL, "--no-headers"],
         timeout=15,
         check=False,
     )
     # Parse top output: NS NAME CPU MEM
     mem_actual: dict[str, str] = {}
-    if top_result.returncode == 0 and top_result.stdout:
-        for line in top_result.stdout.strip().splitlines():
+    if result.returncode == 0 and result.stdout:
+        for line in result.stdout.strip().splitlines():
             parts = line.split()
             if len(parts) >= 4:
                 mem_actual[f"{parts[0]}/{parts[1]}"] = parts[3]
-
-    # Index pods by cluster
-    pods_by_cluster: dict[str, list[dict]] = {}
-    for pod in pods_data.get("items", []):
-        cluster = pod["metadata"].get("labels", {}).get("cnpg.io/cluster", "")
-        ns = pod["metadata"]["namespace"]
-        key = f"{ns}/{cluster}"
-        pods_by_cluster.setdefault(key, []).append(pod)
-
-    # Index PVCs by cluster
-    pvcs_by_cluster: dict[str, list[dict]] = {}
-    for pvc in pvcs_data.get("items", []):
-        cluster = pvc["metadata"].get("labels", {}).get("cnpg.io/cluster", "")
-        ns = pvc["metadata"]["namespace"]
-        key = f"{ns}/{cluster}"
-        pvcs_by_cluster.setdefault(key, []).append(pvc)
-
-    # Index PDBs by cluster
-    pdbs_by_cluster: dict[str, dict] = {}
-    for pdb in pdbs_data.get("items", []):
-        cluster = pdb["metadata"].get("labels", {}).get("cnpg.io/cluster", "")
-        ns = pdb["metadata"]["namespace"]
-        key = f"{ns}/{cluster}"
-        pdbs_by_cluster[key] = pdb
-
+    return mem_actual
+
+
+def _pod_row(pod: dict, mem_actual: dict[str, str]) -> dict:
+    meta = pod["metadata"]
+    # Memory: request, limit, actual
+    containers = pod.get("spec", {}).get("containers", [])
+    res = containers[0].get("resources", {}) if containers else {}
+    return {
+        "name": meta["name"],
+        "role": meta.get("labels", {}).get("cnpg.io/instanceRole", "?"),
+        "node": pod.get("spec", {}).get("nodeName", "?"),
+        "phase": pod.get("status", {}).get("phase", "?"),
+        "memory": {
+            "request": res.get("requests", {}).get("memory", "?"),
+            "actual": mem_actual.get(f"{meta['namespace']}/{meta['name']}", "?"),
+            "limit": res.get("limits", {}).get("memory", "?"),
+        },
+    }
+
+
+def _pvc_row(pvc: dict) -> dict:
+    spec = pvc.get("spec", {})
+    return {
+        "name": pvc["metadata"]["name"],
+        "size": spec.get("resources", {}).get("requests", {}).get("storage", "?"),
+        "storageClass": spec.get("storageClassName", "?"),
+        "phase": pvc.get("status", {}).get("phase", "?"),
+    }
+
+
+def _correlate(
+    clusters: list[dict],
+    pods: list[dict],
+    pvcs: list[dict],
+    pdbs: list[dict],
+    mem_actual: dict[str, str],
+) -> list[dict]:
+    """Join pods, PVCs, PDBs and live memory onto each CNPG cluster."""
+    pods_by_cluster = group_by_owner(pods, _CLUSTER_LABEL)
+    pvcs_by_cluster = group_by_owner(pvcs, _CLUSTER_LABEL)
+    pdbs_by_cluster = group_by_owner(pdbs, _CLUSTER_LABEL)
+
+    correlated = []
     for cluster in sorted(clusters, key=lambda c: c["metadata"]["name"]):
         meta = cluster["metadata"]
         spec = cluster.get("spec", {})
         cluster_status = cluster.get("status", {})
-        cname = meta["name"]
-        ns = meta["namespace"]
-        key = f"{ns}/{cname}"
+        key = f"{meta['namespace']}/{meta['name']}"
+        pdb = next(iter(pdbs_by_cluster.get(key, [])), None)
+        correlated.append(
+            {
+                "name": meta["name"],
+                "namespace": meta["namespace"],
+                "instances": spec.get("instances", 1),
+                "readyInstances": cluster_status.get("readyInstances", 0),
+                "phase": cluster_status.get("phase", "?"),
+                "image": spec.get("imageName", "?"),
+                "storage": spec.get("storage", {}).get("size", "?"),
+                "backup": "backup" in spec,
+                "lastSuccessfulBackup": cluster_status.get("lastSuccessfulBackup"),
+                "pdb": (
+                    {
+                        "disruptionsAllowed": pdb.get("status", {}).get(
+                            "disruptionsAllowed", 0
+                        )
+                    }
+                    if pdb
+                    else None
+                ),
+                "pods": [
+                    _pod_row(pod, mem_actual)
+                    for pod in sorted(
+                        pods_by_cluster.get(key, []),
+                        key=lambda p: p["metadata"]["name"],
+                    )
+                ],
+                "pvcs": [
+                    _pvc_row(pvc)
+                    for pvc in sorted(
+                        pvcs_by_cluster.get(key, []),
+                        key=lambda p: p["metadata"]["name"],
+                    )
+                ],
+            }
+        )
+    return correlated
 
-        section(f"{cname} ({ns})")
 
-        # Basic info
-        instances = spec.get("instances", 1)
-        ready = cluster_status.get("readyInstances", 0)
-        phase = cluster_status.get("phase", "?")
-        has_backup = "backup" in spec or "barmanObjectStore" in spec.get("backup", {})
+@cli.command("status")
+@click.option(
+    "--json", "json_mode", is_flag=True, help="Output correlated clusters as JSON"
+)
+def status_cmd(json_mode: bool):
+    """Overview of all CNPG clusters: replicas, nodes, PDBs, backups, resources."""
+    # The five cluster-wide reads are independent; issue them together so the
+    # command costs its slowest call instead of their sum.
+    clusters_data, pods_data, pvcs_data, pdbs_data, mem_actual = gather(
+        lambda: kubectl_json("cluster.postgresql.cnpg.io"),
+        lambda: kubectl_json("pods", "-l", _CLUSTER_LABEL),
+        lambda: kubectl_json("pvc", "-l", _CLUSTER_LABEL),
+        lambda: kubectl_json("pdb", "-l", _CLUSTER_LABEL),
+        _top_memory,
+    )
+    correlated = _correlate(
+        clusters_data.get("items", []),
+        pods_data.get("items", []),
+        pvcs_data.get("items", []),
+        pdbs_data.get("items", []),
+        mem_actual,
+    )
+
+    if json_mode:
+        click.echo(json.dumps(correlated, indent=2))
+        return
+
+    if not correlated:
+        info("No CNPG clusters found.")
+        return
+
+    for cluster in correlated:
+        section(f"{cluster['name']} ({cluster['namespace']})")
 
         pairs = [
-            ("instances", f"{ready}/{instances} ready"),
-            ("phase", phase),
-            ("image", spec.get("imageName", "?")),
-            ("storage", spec.get("storage", {}).get("size", "?")),
-            ("backup", "yes" if has_backup else "no"),
+            ("instances", f"{cluster['readyInstances']}/{cluster['instances']} ready"),
+            ("phase", cluster["phase"]),
+            ("image", cluster["image"]),
+            ("storage", cluster["storage"]),
+            ("backup", "yes" if cluster["backup"] else "no"),
         ]
-
-        # PDB status
-        pdb = pdbs_by_cluster.get(key)
-        if pdb:
-            allowed = pdb.get("status", {}).get("disruptionsAllowed", 0)
+        if cluster["pdb"]:
+            allowed = cluster["pdb"]["disruptionsAllowed"]
             pairs.append(("pdb", f"disruptionsAllowed={allowed}"))
-
         kv(pairs)
 
         # Pod placement and resource usage
-        pods = pods_by_cluster.get(key, [])
-        if pods:
-            rows = []
-            for pod in sorted(pods, key=lambda p: p["metadata"]["name"]):
-                pname = pod["metadata"]["name"]
-                node = pod.get("spec", {}).get("nodeName", "?")
-                role = (
-                    pod["metadata"].get("labels", {}).get("cnpg.io/instanceRole", "?")
-                )
-                pod_phase = pod.get("status", {}).get("phase", "?")
-
-                # Memory: request, limit, actual
-                containers = pod.get("spec", {}).get("containers", [])
-                req_mem = "?"
-                lim_mem = "?"
-                if containers:
-                    res = containers[0].get("resources", {})
-                    req_mem = res.get("requests", {}).get("memory", "?")
-                    lim_mem = res.get("limits", {}).get("memory", "?")
-                actual = mem_actual.get(f"{ns}/{pname}", "?")
-
-                rows.append([pname, role, node, pod_phase, req_mem, actual, lim_mem])
+        if cluster["pods"]:
             table(
                 ["POD", "ROLE", "NODE", "STATUS", "REQ", "ACTUAL", "LIMIT"],
-                rows,
+                [
+                    [
+                        pod["name"],
+                        pod["role"],
+                        pod["node"],
+                        pod["phase"],
+                        pod["memory"]["request"],
+                        pod["memory"]["actual"],
+                        pod["memory"]["limit"],
+                    ]
+                    for pod in cluster["pods"]
+                ],
             )
 
         # PVC details
-        pvcs = pvcs_by_cluster.get(key, [])
-        if pvcs:
-            pvc_rows = []
-            for pvc in sorted(pvcs, key=lambda p: p["metadata"]["name"]):
-                pvc_name = pvc["metadata"]["name"]
-                size = (
-                    pvc.get("spec", {})
-                    .get("resources", {})
-                    .get("requests", {})
-                    .get("storage", "?")
-                )
-                pvc_phase = pvc.get("status", {}).get("phase", "?")
-                sc = pvc.get("spec", {}).get("storageClassName", "?")
-                pvc_rows.append([pvc_name, size, sc, pvc_phase])
-            table(["PVC", "SIZE", "CLASS", "STATUS"], pvc_rows)
+        if cluster["pvcs"]:
+            table(
+                ["PVC", "SIZE", "CLASS", "STATUS"],
+                [
+                    [pvc["name"], pvc["size"], pvc["storageClass"], pvc["phase"]]
+                    for pvc in cluster["pvcs"]
+                ],
+            )
 
         # Last backup time
-        last_backup = cluster_status.get("lastSuccessfulBackup")
-        if last_backup:
-            info(f"last backup: {age_str(last_backup)} ago")
+        if cluster["lastSuccessfulBackup"]:
+            info(f"last backup: {age_str(cluster['lastSuccessfulBackup'])} ago")
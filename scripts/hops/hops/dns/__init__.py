@@ -6,7 +6,18 @@ import click
 
 from hops._click import AutoGroup
 
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with hops._click.manifest_for after adding commands.
+_COMMANDS = {
+    "blocked": "hops.dns.commands:blocked",
+    "logs": "hops.dns.commands:logs",
+    "search": "hops.dns.commands:search",
+    "test": "hops.dns.commands:test_blocking",
+    "top-blocked": "hops.dns.commands:top_blocked",
+    "top-domains": "hops.dns.commands:top_domains",
+}
 
-@click.group(cls=AutoGroup, package="hops.dns")
+
+@click.group(cls=AutoGroup, package="hops.dns", commands=_COMMANDS)
 def cli():
     """Blocky DNS query log analysis."""
@@ -6,7 +6,19 @@ import click
 
 from hops._click import AutoGroup
 
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with hops._click.manifest_for after adding commands.
+_COMMANDS = {
+    "defaults": "hops.flux.status:defaults",
+    "hr": "hops.flux.status:helmrelease",
+    "ks": "hops.flux.status:kustomization",
+    "resume": "hops.flux.toggle:resume",
+    "status": "hops.flux.status:flux_status",
+    "suspend": "hops.flux.toggle:suspend",
+    "values": "hops.flux.status:values",
+}
 
-@click.group(cls=AutoGroup, package="hops.flux")
+
+@click.group(cls=AutoGroup, package="hops.flux", commands=_COMMANDS)
 def cli():
     """Flux GitOps status and diagnostics."""
@@ -4,48 +4,54 @@ from __future__ import annotations
 
 import click
 
+from hops.core.flux import (
+    HELMRELEASE,
+    KUSTOMIZATION,
+    RESOURCES,
+    inventory,
+    ready_condition,
+)
 from hops.core.format import info, kv, table, truncate
 from hops.core.helm import (
-    helm_chart_args,
+    chart_values,
     print_search_results,
     print_yaml_key,
     resolve_hr,
 )
-from hops.core.runner import run, run_json
+from hops.core.runner import run
+from hops.core.watch import watch_table
 from hops.flux import cli
 from hops.flux.release import chart_pairs
 
 
 @cli.command("status")
 @click.argument("names", nargs=-1)
-def flux_status(names: tuple[str, ...]):
+@click.option(
+    "--watch", is_flag=True, help="Keep running and print rows as they change"
+)
+def flux_status(names: tuple[str, ...], watch: bool):
     """Flux resource status. NAMES filters by exact or substring match.
 
     Without NAMES: problems only (unhealthy Kustomizations and HelmReleases).
     With one or more NAMES: show matching resources regardless of health state.
+    --watch follows Kustomization and HelmRelease watch streams and prints
+    only rows that change.
     """
-    all_resources: list[dict] = []
-    totals = {}
-
-    for kind, label in [
-        ("kustomizations", "Kustomization"),
-        ("helmreleases", "HelmRelease"),
-    ]:
-        data = run_json(
-            ["kubectl", "get", kind, "--all-namespaces", "-o", "json"],
-            timeout=30,
-        )
-        items = data.get("items", [])
-        totals[label] = len(items)
-        for item in items:
-            item["_kind_label"] = label
-        all_resources.extend(items)
+    if watch:
+        _watch_status(names)
+        return
+    inv = inventory()
+    all_resources = list(inv.resources())
 
     if names:
-        matches: list[dict] = []
+        matches: list[tuple[str, dict]] = []
         missing: list[str] = []
         for name in names:
-            found = _find_items(all_resources, name)
+            found = [
+                (kind, item)
+                for kind in (KUSTOMIZATION, HELMRELEASE)
+                for item in inv.find(kind, name)
+            ]
             if found:
                 matches.extend(found)
             else:
@@ -53,30 +59,26 @@ def flux_status(names: tuple[str, ...]):
 
         # Deduplicate (same resource matched by multiple names)
         seen: set[tuple[str, str, str]] = set()
-        unique: list[dict] = []
-        for item in matches:
-            key = (
-                item["_kind_label"],
-                item["metadata"]["namespace"],
-                item["metadata"]["name"],
-            )
+        unique: list[tuple[str, dict]] = []
+        for kind, item in matches:
+            key = (kind, item["metadata"]["namespace"], item["metadata"]["name"])
             if key not in seen:
                 seen.add(key)
-                unique.append(item)
+                unique.append((kind, item))
 
         if unique:
             rows = []
-            for item in sorted(
+            for kind, item in sorted(
                 unique,
-                key=lambda i: (
-                    i["metadata"]["namespace"],
-                    i["metadata"]["name"],
+                key=lambda ki: (
+                    ki[1]["metadata"]["namespace"],
+                    ki[1]["metadata"]["name"],
                 ),
             ):
                 meta = item["metadata"]
                 rows.append(
                     [
-                        item["_kind_label"],
+                        kind,
                         meta["namespace"],
                         meta["name"],
                         _ready_status(item),
@@ -91,23 +93,16 @@ def flux_status(names: tuple[str, ...]):
         return
 
     problems = []
-    for item in all_resources:
+    for kind, item in all_resources:
         meta = item["metadata"]
-        conditions = item.get("status", {}).get("conditions", [])
-        ready = None
-        for cond in conditions:
-            if cond.get("type") == "Ready":
-                ready = cond
-                break
+        ready = ready_condition(item)
         if ready and ready.get("status") != "True":
             msg = truncate(ready.get("message", ""), 100)
-            problems.append(
-                [item["_kind_label"], meta["namespace"], meta["name"], "Not Ready", msg]
-            )
+            problems.append([kind, meta["namespace"], meta["name"], "Not Ready", msg])
         elif not ready:
             problems.append(
                 [
-                    item["_kind_label"],
+                    kind,
                     meta["namespace"],
                     meta["name"],
                     "Unknown",
@@ -116,8 +111,8 @@ def flux_status(names: tuple[str, ...]):
             )
 
     if not problems:
-        ks = totals.get("Kustomization", 0)
-        hr = totals.get("HelmRelease", 0)
+        ks = inv.total(KUSTOMIZATION)
+        hr = inv.total(HELMRELEASE)
         info(f"All {ks} Kustomizations and {hr} HelmReleases are Ready.")
         return
 
@@ -127,33 +122,38 @@ def flux_status(names: tuple[str, ...]):
     )
 
 
-def _ready_status(item: dict) -> str:
-    """Extract compact Ready status from a Flux resource."""
-    for cond in item.get("status", {}).get("conditions", []):
-        if cond.get("type") == "Ready":
-            if cond.get("status") == "True":
-                return "Ready"
-            return truncate(cond.get("message", "Not Ready"), 80)
-    return "Unknown"
-
-
-def _fetch_all(kind: str) -> list[dict]:
-    """Fetch all items of a Flux resource kind across namespaces."""
-    data = run_json(
-        ["kubectl", "get", kind, "--all-namespaces", "-o", "json"],
-        timeout=15,
+def _watch_status(names: tuple[str, ...]) -> None:
+    def row(kind: str, item: dict) -> list[str] | None:
+        meta = item["metadata"]
+        if names:
+            if not any(n in meta["name"] for n in names):
+                return None
+            return [kind, meta["namespace"], meta["name"], _ready_status(item)]
+        ready = ready_condition(item)
+        if ready is None:
+            return [kind, meta["namespace"], meta["name"], "Unknown", ""]
+        if ready.get("status") == "True":
+            return None
+        msg = truncate(ready.get("message", ""), 100)
+        return [kind, meta["namespace"], meta["name"], "Not Ready", msg]
+
+    headers = ["TYPE", "NAMESPACE", "NAME", "STATUS"]
+    watch_table(
+        RESOURCES,
+        headers if names else [*headers, "MESSAGE"],
+        row,
+        empty="No matching resources." if names else "All Flux resources are Ready.",
     )
-    return data.get("items", [])
 
 
-def _find_items(items: list[dict], name: str | None) -> list[dict]:
-    """Filter items: exact match first, then substring, then all."""
-    if not name:
-        return items
-    exact = [i for i in items if i["metadata"]["name"] == name]
-    if exact:
-        return exact
-    return [i for i in items if name in i["metadata"]["name"]]
+def _ready_status(item: dict) -> str:
+    """Extract compact Ready status from a Flux resource."""
+    cond = ready_condition(item)
+    if cond is None:
+        return "Unknown"
+    if cond.get("status") == "True":
+        return "Ready"
+    return truncate(cond.get("message", "Not Ready"), 80)
 
 
 @cli.command("hr")
@@ -163,11 +163,7 @@ def _find_items(items: list[dict], name: str | None) -> list[dict]:
 )
 def helmrelease(name: str | None, namespace: str | None):
     """HelmRelease status. Omit NAME to list all; partial names search."""
-    all_items = _fetch_all("helmreleases")
-    if namespace:
-        all_items = [i for i in all_items if i["metadata"]["namespace"] == namespace]
-
-    matches = _find_items(all_items, name)
+    matches = inventory().find(HELMRELEASE, name, namespace)
 
     if not matches:
         info(f"error: HelmRelease {name!r} not found")
@@ -246,18 +242,28 @@ def values(name: str, namespace: str | None):
     "-n", "--namespace", default=None, help="Namespace (searches all if omitted)"
 )
 @click.option(
-    "--key", default=None, help="YAML key path to extract (e.g., config.envoyGateway)"
+    "--key",
+    default=None,
+    help="YAML key path to extract (e.g., config.envoyGateway, args[0])",
 )
 @click.option(
     "--search", "search_term", default=None, help="Search defaults for a keyword"
 )
+@click.option(
+    "--refresh", is_flag=True, help="Pull the chart again instead of using the cache"
+)
 def defaults(
-    name: str, namespace: str | None, key: str | None, search_term: str | None
+    name: str,
+    namespace: str | None,
+    key: str | None,
+    search_term: str | None,
+    refresh: bool,
 ):
     """Chart default values for a HelmRelease (scoped).
 
     Requires --key or --search to avoid dumping thousands of lines.
     Use --key to extract a subtree, --search to find matching lines.
+    Values are cached per chart version under $XDG_CACHE_HOME/hops.
     """
     if not key and not search_term:
         info("error: specify --key <path> or --search <term> to scope output")
@@ -266,27 +272,15 @@ def defaults(
         raise SystemExit(1)
 
     hr = resolve_hr(name, namespace)
-    chart_args = helm_chart_args(hr)
-
-    result = run(
-        ["helm", "show", "values", *chart_args],
-        timeout=30,
-        check=False,
-    )
-    if result.returncode != 0:
-        msg = (result.stderr or "").strip().split("\n")[0]
-        info(f"error: {msg}")
-        raise SystemExit(1)
-
-    output = (result.stdout or "").strip()
+    output, index = chart_values(hr, refresh=refresh)
     if not output:
         info("(no default values)")
         return
 
     if key:
-        print_yaml_key(output, key)
+        print_yaml_key(output, key, index)
     elif search_term:
-        print_search_results(output, search_term)
+        print_search_results(output, search_term, index)
 
 
 @cli.command("ks")
@@ -296,11 +290,7 @@ def defaults(
 )
 def kustomization(name: str | None, namespace: str | None):
     """Kustomization status. Omit NAME to list all; partial names search."""
-    all_items = _fetch_all("kustomizations")
-    if namespace:
-        all_items = [i for i in all_items if i["metadata"]["namespace"] == namespace]
-
-    matches = _find_items(all_items, name)
+    matches = inventory().find(KUSTOMIZATION, name, namespace)
 
     if not matches:
         info(f"error: Kustomization {name!r} not found")
@@ -12,35 +12,32 @@ from __future__ import annotations
 
 import click
 
+from hops.core.flux import HELMRELEASE, KUSTOMIZATION, inventory
 from hops.core.format import info
-from hops.core.runner import run, run_json
+from hops.core.runner import run
 from hops.flux import cli
 
 
+def _lookup(kind: str, name: str, namespace: str | None) -> dict | None:
+    """A Flux object from the inventory, or None when missing or unlistable.
+
+    A failed listing is treated as not found so the caller's own message is
+    the one reported.
+    """
+    try:
+        return inventory(quiet=True).get(kind, name, namespace)
+    except SystemExit:
+        return None
+
+
 def _find_flux_resource(
     kind: str, name: str, namespace: str | None
 ) -> tuple[str, str] | None:
     """Find a Flux resource by name, returning (namespace, name) or None."""
-    if namespace:
-        result = run(
-            ["kubectl", "get", kind, name, "-n", namespace, "-o", "name"],
-            timeout=10,
-            check=False,
-        )
-        if result.returncode == 0:
-            return namespace, name
+    item = _lookup(kind, name, namespace)
+    if item is None:
         return None
-
-    # Search all namespaces
-    all_data = run_json(
-        ["kubectl", "get", kind, "--all-namespaces", "-o", "json"],
-        timeout=15,
-        quiet=True,
-    )
-    for item in all_data.get("items", []):
-        if item["metadata"]["name"] == name:
-            return item["metadata"]["namespace"], name
-    return None
+    return item["metadata"]["namespace"], name
 
 
 def _flux_toggle(name: str, namespace: str | None, action: str):
@@ -51,9 +48,7 @@ def _flux_toggle(name: str, namespace: str | None, action: str):
     """
     acted = []
 
-    ks = _find_flux_resource(
-        "kustomization.kustomize.toolkit.fluxcd.io", name, namespace
-    )
+    ks = _find_flux_resource(KUSTOMIZATION, name, namespace)
     if ks:
         ks_ns, ks_name = ks
         result = run(
@@ -70,25 +65,12 @@ def _flux_toggle(name: str, namespace: str | None, action: str):
     # HelmRelease may be in a different namespace (targetNamespace)
     hr_ns = namespace
     if ks and not hr_ns:
-        ks_data = run_json(
-            [
-                "kubectl",
-                "get",
-                "kustomization.kustomize.toolkit.fluxcd.io",
-                ks[1],
-                "-n",
-                ks[0],
-                "-o",
-                "json",
-            ],
-            timeout=10,
-            quiet=True,
-        )
+        ks_data = _lookup(KUSTOMIZATION, ks[1], ks[0]) or {}
         target = ks_data.get("spec", {}).get("targetNamespace")
         if target:
             hr_ns = target
 
-    hr = _find_flux_resource("helmrelease.helm.toolkit.fluxcd.io", name, hr_ns)
+    hr = _find_flux_resource(HELMRELEASE, name, hr_ns)
     if hr:
         hr_real_ns, hr_name = hr
         result = run(
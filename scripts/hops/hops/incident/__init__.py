@@ -0,0 +1,143 @@
+"""Incident domain: one cross-source timeline for an app around a time.
+
+Triage used to take a command per source: alerts, restarts, usage, error
+logs, events and Flux status, each with its own time flags. ``hops
+incident`` resolves the app once, queries every source concurrently for
+the same window and merges the results into one chronological timeline
+with repeats folded.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from datetime import datetime
+from functools import partial
+
+import click
+
+from hops.core.format import info, kv
+from hops.core.resolve import resolve
+from hops.core.runner import gather
+from hops.core.time import TimeRange, time_options
+from hops.incident import sources
+from hops.incident.timeline import Entry, fold, render
+
+# Source name -> collector taking a Scope
+_SOURCES = {
+    "alerts": sources.alerts,
+    "restarts": sources.restarts,
+    "cpu": partial(sources.usage, resource="cpu"),
+    "memory": partial(sources.usage, resource="memory"),
+    "logs": sources.error_logs,
+    "events": sources.events,
+}
+
+# Kubernetes garbage-collects events after about this long
+_EVENT_TTL = 3600
+
+
+def _collect(collector, scope: sources.Scope) -> list[Entry] | None:
+    """Entries from one source, or None when its backend failed.
+
+    The backend's error line is already on stderr; the other sources
+    still make a useful timeline.
+    """
+    try:
+        return collector(scope)
+    except SystemExit:
+        return None
+
+
+@click.command("incident")
+@click.argument("app")
+@click.option("-n", "--namespace", help="Namespace (default: search all)")
+@time_options(default_from="1h", support_at=True)
+@click.option("--json", "json_mode", is_flag=True, help="Output entries as JSON")
+def cli(
+    app: str,
+    namespace: str | None,
+    time_from: str | None,
+    time_to: str | None,
+    time_at: str | None,
+    window: str,
+    json_mode: bool,
+):
+    """Timeline of alerts, restarts, usage, error logs and events for an app.
+
+    Center the window on a time with --at (sized by --window), or give
+    --from/--to. All sources are queried concurrently.
+    """
+    try:
+        time_range = TimeRange.from_options(time_from, time_to, time_at, window)
+        start, end = time_range.bounds()
+    except ValueError as e:
+        info(f"error: {e}")
+        raise SystemExit(1) from None
+
+    target = resolve(app, namespace)
+    prefix = target.workload.name if target.workload else target.name
+    scope = sources.Scope(
+        app,
+        target.namespace,
+        prefix,
+        target.workload,
+        target.pods,
+        start,
+        end,
+        time_range.auto_step(),
+    )
+    results = dict(
+        zip(
+            _SOURCES,
+            gather(*(partial(_collect, fn, scope) for fn in _SOURCES.values())),
+        )
+    )
+    entries = fold([e for found in results.values() for e in found or []])
+
+    if json_mode:
+        report = {
+            "app": prefix,
+            "namespace": target.namespace,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+            "sources": {
+                name: None if found is None else sum(e.count for e in found)
+                for name, found in results.items()
+            },
+            "entries": [e.to_dict() for e in entries],
+        }
+        click.echo(json.dumps(report, indent=2))
+        return
+
+    kv(
+        [
+            ("App", f"{prefix} ({target.kind}) in {target.namespace}"),
+            ("Window", _window(start, end)),
+            ("Sources", _source_summary(results, start.timestamp())),
+        ]
+    )
+    click.echo()
+    render(entries, dated=start.astimezone().date() != end.astimezone().date())
+
+
+def _window(start: datetime, end: datetime) -> str:
+    """The window in local time, matching the timeline's clock."""
+    start, end = start.astimezone(), end.astimezone()
+    fmt = "%H:%M" if start.date() == end.date() else "%Y-%m-%d %H:%M"
+    return f"{start:%Y-%m-%d %H:%M} to {end.strftime(fmt)}"
+
+
+def _source_summary(results: dict[str, list[Entry] | None], start: float) -> str:
+    parts = []
+    for name, found in results.items():
+        if found is None:
+            parts.append(f"{name} unavailable")
+            continue
+        part = f"{name} {sum(e.count for e in found)}"
+        if name == "logs" and len(found) >= sources.LOG_LIMIT:
+            part += " (capped, newest kept)"
+        if name == "events" and not found and start < time.time() - _EVENT_TTL:
+            part += " (cluster keeps ~1h)"
+        parts.append(part)
+    return ", ".join(parts)
@@ -0,0 +1,236 @@
+"""Incident sources: alerts, restarts, usage, error logs and events.
+
+Each collector takes the same ``Scope`` and returns timeline entries, so
+the command can run them all concurrently and costs its slowest backend.
+Metric collectors push aggregation to VictoriaMetrics (one series per pod
+or alert), the log collector asks VictoriaLogs for error levels only, and
+Kubernetes and Flux events share one events fetch for the namespace.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from hops.core.events import EventIndex, fetch_events
+from hops.core.format import age, human_bytes
+from hops.core.logsql import plan_query, stream_fields
+from hops.core.model import PodInfo, WorkloadInfo, epoch
+from hops.core.time import duration_seconds
+from hops.core.timeline import runs
+from hops.core.vlogs import VictoriaLogsClient
+from hops.core.vm import is_ignored_alert, query_vm
+from hops.incident.timeline import Entry
+
+# Error lines fetched per incident; the newest are kept when capped
+LOG_LIMIT = 500
+
+FLUX_KINDS = {
+    "HelmRelease",
+    "Kustomization",
+    "HelmChart",
+    "HelmRepository",
+    "OCIRepository",
+    "GitRepository",
+}
+
+# Normal events that mark a change worth seeing next to errors
+_NORMAL_REASONS = {"Killing", "ScalingReplicaSet", "Scheduled", "Preempted"}
+
+# Alert labels naming a specific object; alerts with none are namespace-wide
+_OBJECT_LABELS = (
+    "pod",
+    "container",
+    "deployment",
+    "statefulset",
+    "daemonset",
+    "cronjob",
+    "job_name",
+    "service",
+    "persistentvolumeclaim",
+)
+
+
+@dataclass
+class Scope:
+    """What an incident covers: one app, one namespace, one window."""
+
+    app: str
+    namespace: str
+    # Pod name prefix: the workload name, or the app name without one
+    prefix: str
+    workload: WorkloadInfo | None
+    pods: list[PodInfo]
+    start: datetime
+    end: datetime
+    step: str
+
+    def range_params(self, query: str) -> dict[str, str]:
+        return {
+            "query": query,
+            "start": str(int(self.start.timestamp())),
+            "end": str(int(self.end.timestamp())),
+            "step": self.step,
+        }
+
+    def contains(self, ts: float) -> bool:
+        return self.start.timestamp() <= ts <= self.end.timestamp()
+
+    @property
+    def selector(self) -> str:
+        return f'namespace="{self.namespace}",pod=~"{self.prefix}-.*"'
+
+
+def _matrix(scope: Scope, query: str) -> list[dict]:
+    data = query_vm("/api/v1/query_range", scope.range_params(query))
+    return data.get("data", {}).get("result", [])
+
+
+def alerts(scope: Scope) -> list[Entry]:
+    """Firing and resolved transitions of alerts concerning the app."""
+    results = _matrix(
+        scope, f'ALERTS{{alertstate="firing",namespace="{scope.namespace}"}}'
+    )
+    step = float(duration_seconds(scope.step))
+    window_end = scope.end.timestamp()
+    entries = []
+    for result in results:
+        metric = result.get("metric", {})
+        name = metric.get("alertname", "") or "?"
+        if is_ignored_alert(name) or not _concerns(metric, scope):
+            continue
+        objects = [metric[k] for k in _OBJECT_LABELS if metric.get(k)]
+        on = f" on {objects[0]}" if objects else ""
+        severity = metric.get("severity", "none")
+        stamps = [float(ts) for ts, _ in result.get("values", [])]
+        for start, end in runs(stamps, step):
+            entries.append(Entry(start, "alert", name, f"firing ({severity}){on}"))
+            if end < window_end:
+                detail = f"resolved after {age(end - start)}{on}"
+                entries.append(Entry(end, "alert", name, detail))
+    return entries
+
+
+def _concerns(metric: dict[str, str], scope: Scope) -> bool:
+    values = [metric[k] for k in _OBJECT_LABELS if metric.get(k)]
+    if not values:
+        return True
+    return any(v.startswith(scope.prefix) or scope.app in v for v in values)
+
+
+def restarts(scope: Scope) -> list[Entry]:
+    """Container restarts per step, plus the last termination of each pod.
+
+    The restart counter says when; the pods' ``lastState`` says why, for
+    the most recent termination, at no extra cost.
+    """
+    results = _matrix(
+        scope,
+        "sum by (pod, container) (increase("
+        f"kube_pod_container_status_restarts_total{{{scope.selector}}}"
+        f"[{scope.step}])) > 0",
+    )
+    step = float(duration_seconds(scope.step))
+    entries = []
+    for result in results:
+        metric = result.get("metric", {})
+        subject = f"{metric.get('pod', '?')}/{metric.get('container', '?')}"
+        for ts, value in result.get("values", []):
+            count = max(1, round(float(value)))
+            # Each sample covers the step before it
+            entries.append(
+                Entry(float(ts) - step, "restart", subject, "restarted", count)
+            )
+    for pod in scope.pods:
+        for container in pod.containers:
+            last = container.last_terminated
+            finished = epoch(last.get("finishedAt"))
+            if not finished or not scope.contains(finished):
+                continue
+            reason = last.get("reason") or "terminated"
+            detail = f"terminated: {reason} (exit {last.get('exitCode', '?')})"
+            entries.append(
+                Entry(finished, "restart", f"{pod.name}/{container.name}", detail)
+            )
+    return entries
+
+
+# Resource -> (per-pod PromQL over a selector, value format)
+USAGE = {
+    "cpu": (
+        "sum by (pod) (rate(container_cpu_usage_seconds_total{{{}}}[5m]))",
+        lambda v: f"{v:.2f} cores",
+    ),
+    "memory": (
+        "sum by (pod) (container_memory_working_set_bytes{{{}}})",
+        human_bytes,
+    ),
+}
+
+
+def usage(scope: Scope, resource: str) -> list[Entry]:
+    """Peak usage of one ``USAGE`` resource per pod, placed at the peak."""
+    query, fmt = USAGE[resource]
+    entries = []
+    for result in _matrix(scope, query.format(f'{scope.selector},container!=""')):
+        samples = [(float(v), float(ts)) for ts, v in result.get("values", [])]
+        if not samples:
+            continue
+        peak, at = max(samples)
+        avg = sum(v for v, _ in samples) / len(samples)
+        detail = f"{resource} peak {fmt(peak)} (avg {fmt(avg)})"
+        pod = result.get("metric", {}).get("pod", "?")
+        entries.append(Entry(at, "usage", pod, detail))
+    return entries
+
+
+def error_logs(scope: Scope) -> list[Entry]:
+    """Error and critical log lines from the app's pods."""
+    client = VictoriaLogsClient()
+    query = plan_query(
+        {"kubernetes.pod_namespace": scope.namespace},
+        f'kubernetes.pod_name:~"^{scope.prefix}-" AND level:in(error,critical)',
+        stream_fields(client),
+    )
+    logs = client.query_logs(
+        query,
+        start=scope.start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        end=scope.end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        limit=LOG_LIMIT,
+    )
+    entries = []
+    for log in logs:
+        message = log.get("message", log.get("_msg", log.get("msg", "")))
+        subject = log.get("kubernetes.container_name") or log.get(
+            "kubernetes.pod_name", "?"
+        )
+        entries.append(Entry(epoch(log.get("_time")), "log", subject, message))
+    return entries
+
+
+def events(scope: Scope) -> list[Entry]:
+    """Kubernetes events on the app's objects and Flux reconcile events.
+
+    Flux reports successful reconciles as Normal events, so those are kept
+    for Flux objects; other Normal events only for lifecycle changes.
+    """
+    index = EventIndex(fetch_events(scope.namespace, warnings_only=False))
+    workloads = [scope.workload] if scope.workload else []
+    entries = []
+    for event in index.for_app(scope.app, scope.namespace, workloads, scope.pods):
+        if not scope.contains(event.last):
+            continue
+        flux = event.kind in FLUX_KINDS
+        if not flux and event.type == "Normal" and event.reason not in _NORMAL_REASONS:
+            continue
+        message = event.message.split("\n", 1)[0]
+        entries.append(
+            Entry(
+                event.last,
+                "flux" if flux else "event",
+                event.object,
+                f"{event.reason or '?'}: {message}",
+                event.count,
+            )
+        )
+    return entries
@@ -0,0 +1,78 @@
+"""Incident timeline entries: folding repeats and rendering.
+
+Every source reduces to ``Entry`` rows on one clock. Sources repeat
+themselves during an incident (the same error line every few seconds, a
+restart on every step), so ``fold`` collapses identical entries that recur
+within a short gap into one row with a count and the time of the last
+occurrence, keeping distinct bursts separate.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from hops.core.format import info, table, truncate
+
+# Identical entries closer together than this fold into one row
+FOLD_GAP = 600
+
+# Digits and hex runs vary between otherwise identical log lines
+_VOLATILE = re.compile(r"0x[0-9a-f]+|[0-9a-f]{8,}|\d+", re.IGNORECASE)
+
+
+@dataclass
+class Entry:
+    ts: float
+    source: str
+    subject: str
+    detail: str
+    count: int = 1
+    # Time of the last folded repeat (0 when never folded)
+    until: float = 0.0
+
+    def key(self) -> tuple[str, str, str]:
+        return (self.source, self.subject, _VOLATILE.sub("#", self.detail))
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def fold(entries: list[Entry], gap: float = FOLD_GAP) -> list[Entry]:
+    """Chronological entries with repeats inside ``gap`` seconds folded."""
+    open_rows: dict[tuple[str, str, str], Entry] = {}
+    result: list[Entry] = []
+    for entry in sorted(entries, key=lambda e: e.ts):
+        key = entry.key()
+        row = open_rows.get(key)
+        if row and entry.ts - (row.until or row.ts) <= gap:
+            row.count += entry.count
+            row.until = entry.ts
+            continue
+        row = Entry(entry.ts, entry.source, entry.subject, entry.detail, entry.count)
+        open_rows[key] = row
+        result.append(row)
+    return result
+
+
+def render(entries: list[Entry], dated: bool = False) -> None:
+    """One row per folded entry, oldest first, in local time.
+
+    ``dated`` adds the day for windows that cross midnight.
+    """
+    if not entries:
+        info("No alerts, restarts, errors or events in the window")
+        return
+    fmt = "%m-%d %H:%M:%S" if dated else "%H:%M:%S"
+
+    def clock(ts: float) -> str:
+        return datetime.fromtimestamp(ts).astimezone().strftime(fmt)
+
+    rows = []
+    for e in entries:
+        repeat = f"x{e.count}" if e.count > 1 else ""
+        if e.until:
+            repeat += f" to {clock(e.until)}"
+        rows.append([clock(e.ts), e.source, e.subject, repeat, truncate(e.detail, 120)])
+    table(["TIME", "SOURCE", "SUBJECT", "#", "DETAIL"], rows)
@@ -6,8 +6,10 @@ import click
 
 from hops._click import HelpfulGroup
 from hops.query.alerts import cli as alerts_cli
+from hops.query.cardinality import cardinality
 from hops.query.logs import cli as logs_cli
 from hops.query.metrics import cli as metrics_cli
+from hops.query.rules import rules
 from hops.query.scrape_pools import scrape_pools
 
 # The query group exposes all metrics commands directly (no `metrics`
@@ -29,5 +31,7 @@ for name, cmd in list(metrics_cli.commands.items()):
 for name, cmd in list(alerts_cli.commands.items()):
     cli.add_command(cmd, name)
 
+cli.add_command(cardinality)
+cli.add_command(rules)
 cli.add_command(scrape_pools)
 cli.add_command(logs_cli, "logs")
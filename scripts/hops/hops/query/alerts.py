@@ -1,4 +1,4 @@
-"""VictoriaMetrics alert commands: current, historical, rules."""
+"""VictoriaMetrics alert commands: current, historical and stats."""
 
 from __future__ import annotations
 
@@ -9,10 +9,17 @@ import sys
 import click
 
 from hops._click import HelpfulGroup
-from hops.core.format import format_labels_list, format_timestamp, info, kv, table
-from hops.core.time import TimeRange, time_options
-from hops.query import rules_render
-from hops.query._vm import is_ignored_alert, query_vm, query_vmalert
+from hops.core.format import (
+    age,
+    format_labels_list,
+    format_timestamp,
+    info,
+    kv,
+    table,
+)
+from hops.core.time import TimeRange, duration_seconds, time_options
+from hops.core.timeline import Timeline, fleet_timelines, merge, runs
+from hops.core.vm import is_ignored_alert, query_vm, query_vmalert
 
 
 @click.group(cls=HelpfulGroup)
@@ -20,21 +27,6 @@ def cli():
     """Alert monitoring and investigation."""
 
 
-def _extract_firing_periods(values: list[list]) -> list[tuple[float, float]]:
-    periods = []
-    start_ts = None
-    for ts, val in values:
-        is_firing = float(val) == 1
-        if is_firing and start_ts is None:
-            start_ts = float(ts)
-        elif not is_firing and start_ts is not None:
-            periods.append((start_ts, float(ts)))
-            start_ts = None
-    if start_ts is not None and values:
-        periods.append((start_ts, float(values[-1][0])))
-    return periods
-
-
 @cli.command("alerts")
 @click.option(
     "-s",
@@ -285,16 +277,22 @@ def _alert_historical(name: str, time_range: TimeRange, json_mode: bool) -> None
         info(f"No firing instances of {name} in last {duration}")
         return
 
+    step = float(duration_seconds(params["step"]))
+    periods = [
+        runs([float(ts) for ts, _ in r.get("values", [])], step) for r in results
+    ]
+    overall = Timeline(name, "", merge(*periods))
     info(f"Alert: {name} (historical, last {duration})")
     info(f"Instances: {len(results)}")
+    info(
+        f"Firing (any instance): {age(overall.firing)} in {overall.flaps} "
+        f"periods, mean {age(overall.mttr)}, longest {age(overall.longest)}"
+    )
 
-    for i, r in enumerate(results):
+    for i, (r, firing_periods) in enumerate(zip(results, periods, strict=True)):
         labels = r.get("metric", {})
-        values = r.get("values", [])
-        if not values:
+        if not firing_periods:
             continue
-
-        firing_periods = _extract_firing_periods(values)
         click.echo(f"\nInstance {i + 1}:")
         severity = labels.get("severity", "none")
         click.echo(f"  Severity: {severity}")
@@ -311,23 +309,50 @@ def _alert_historical(name: str, time_range: TimeRange, json_mode: bool) -> None
                 )
 
 
-@cli.command("rules")
-@click.option("-g", "--group", help="Filter to groups matching this substring")
-@click.option("--all", "show_all", is_flag=True, help="Include healthy inactive rules")
-@click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
-def rules(group: str | None, show_all: bool, json_mode: bool):
-    """Rule health: evaluation errors, firing/pending rules, slow evaluations."""
-    data = query_vmalert("/api/v1/rules")
-    groups = data.get("data", {}).get("groups", [])
+@cli.command("alert-stats")
+@click.option("--json", "json_mode", is_flag=True, help="Output stats as JSON")
+@time_options(default_from="7d")
+def alert_stats(json_mode: bool, time_from: str, time_to: str | None, **_):
+    """Per-alert firing time, flaps and mean time to resolve over a window."""
+    time_range = TimeRange.from_options(time_from, time_to)
+    timelines, window = fleet_timelines(time_range)
+    timelines = [t for t in timelines if t.intervals]
+    timelines.sort(key=lambda t: (-t.firing, t.alertname))
 
     if json_mode:
-        click.echo(json.dumps(groups, indent=2))
+        stats = [
+            {
+                "alertname": t.alertname,
+                "severity": t.severity,
+                "firing_seconds": t.firing,
+                "flaps": t.flaps,
+                "mttr_seconds": t.mttr,
+                "longest_seconds": t.longest,
+                "intervals": t.intervals,
+            }
+            for t in timelines
+        ]
+        click.echo(json.dumps(stats, indent=2))
+        return
+
+    if not timelines:
+        info(f"No alerts fired in {time_range.describe()}")
         return
 
-    all_rules = rules_render.flatten(groups)
-    if group:
-        all_rules = [r for r in all_rules if group.lower() in r["group"].lower()]
-        if not all_rules:
-            info(f"error: no rule group matching {group!r}")
-            sys.exit(1)
-    rules_render.render(all_rules, show_all)
+    info(f"Alert firing in {time_range.describe()} (instances merged):")
+    table(
+        ["ALERT", "SEV", "FIRING", "%", "FLAPS", "MTTR", "LONGEST", "LAST FIRED"],
+        [
+            [
+                t.alertname,
+                t.severity,
+                age(t.firing),
+                f"{t.firing / window:.1%}" if window else "?",
+                str(t.flaps),
+                age(t.mttr),
+                age(t.longest),
+                format_timestamp(t.last_end),
+            ]
+            for t in timelines
+        ],
+    )
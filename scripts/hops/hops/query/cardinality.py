@@ -0,0 +1,205 @@
+"""Cardinality report from VictoriaMetrics TSDB status.
+
+Label explosions show up as VMSingle memory pressure long before anyone
+writes the PromQL to find them. ``hops query cardinality`` reads
+``/api/v1/status/tsdb`` once, diffs it against a saved baseline to show
+growth, and traces the top metrics back to the scrape resource that
+produces them: metric -> ``job`` label -> vmagent scrape pool -> VM*Scrape
+and its owner, reusing the scrape-pools correlation.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import time
+from typing import Any
+
+import click
+
+from hops.core import cache
+from hops.core.format import age, info, kv, section, table, truncate
+from hops.core.runner import gather
+from hops.core.vm import VMSINGLE_URL, query_vm, query_vmagent
+from hops.query.scrape_pools import (
+    correlate_pool,
+    index_scrape_resources,
+    resource_label,
+)
+
+_BUCKET = "cardinality"
+
+# tsdb status field -> report section title
+_SECTIONS = {
+    "seriesCountByMetricName": "TOP METRICS",
+    "seriesCountByLabelValuePair": "TOP LABEL PAIRS",
+    "seriesCountByLabelName": "SERIES PER LABEL",
+    "labelValueCountByLabelName": "VALUES PER LABEL",
+}
+
+
+@click.command("cardinality")
+@click.option("--top", default=10, show_default=True, help="Entries per section")
+@click.option("-m", "--match", default=None, help="Only series matching this selector")
+@click.option(
+    "--save", is_flag=True, help="Store this report as the new growth baseline"
+)
+@click.option("--json", "json_mode", is_flag=True, help="Output the report as JSON")
+def cardinality(top: int, match: str | None, save: bool, json_mode: bool) -> None:
+    """Series cardinality: top offenders, growth and their scrape sources.
+
+    Growth is measured against a baseline snapshot kept in the hops cache.
+    The first run stores one; --save replaces it.
+    """
+    params = {"topN": str(top)}
+    if match:
+        params["match[]"] = match
+    tsdb, targets, resources = gather(
+        lambda: query_vm("/api/v1/status/tsdb", params).get("data", {}),
+        lambda: query_vmagent("/api/v1/targets"),
+        index_scrape_resources,
+    )
+    metrics = [e["name"] for e in tsdb.get("seriesCountByMetricName") or []]
+    sources = _metric_sources(metrics, _job_pools(targets), resources)
+
+    key = cache.content_key(VMSINGLE_URL, match or "")
+    baseline = cache.load(_BUCKET, key)
+    snapshot = {"taken": time.time(), **_counts(tsdb)}
+    if baseline is None or save:
+        cache.store(_BUCKET, key, snapshot)
+
+    if json_mode:
+        report = {"tsdb": tsdb, "sources": sources, "baseline": baseline}
+        click.echo(json.dumps(report, indent=2))
+        return
+    _print(tsdb, sources, baseline, saved=baseline is None or save)
+
+
+def _counts(tsdb: dict[str, Any]) -> dict[str, Any]:
+    """Flatten a tsdb status response into comparable counts."""
+    counts: dict[str, Any] = {
+        "totalSeries": tsdb.get("totalSeries", 0),
+        "totalLabelValuePairs": tsdb.get("totalLabelValuePairs", 0),
+    }
+    for field in _SECTIONS:
+        counts[field] = {e["name"]: e["value"] for e in tsdb.get(field) or []}
+    return counts
+
+
+def _job_pools(targets: dict[str, Any]) -> dict[str, set[str]]:
+    """Map each ``job`` label to the vmagent scrape pools that emit it."""
+    pools: dict[str, set[str]] = {}
+    for target in targets.get("data", {}).get("activeTargets", []):
+        job = target.get("labels", {}).get("job")
+        if job and target.get("scrapePool"):
+            pools.setdefault(job, set()).add(target["scrapePool"])
+    return pools
+
+
+def _metric_sources(
+    metrics: list[str],
+    job_pools: dict[str, set[str]],
+    resources: dict[tuple[str, str, str], dict[str, Any]],
+) -> dict[str, list[dict[str, Any]]]:
+    """Scrape resources behind each metric, largest job first.
+
+    One ``count by (__name__, job)`` query covers every listed metric.
+    """
+    if not metrics:
+        return {}
+    names = "|".join(re.escape(m) for m in metrics)
+    data = query_vm(
+        "/api/v1/query",
+        {"query": f'count by (__name__, job) ({{__name__=~"{names}"}})'},
+    )
+    by_metric: dict[str, list[tuple[float, str]]] = {}
+    for result in data.get("data", {}).get("result", []):
+        metric = result.get("metric", {})
+        if "__name__" in metric:
+            count = float(result.get("value", [0, "0"])[1])
+            by_metric.setdefault(metric["__name__"], []).append(
+                (count, metric.get("job", ""))
+            )
+
+    sources: dict[str, list[dict[str, Any]]] = {}
+    for name, jobs in by_metric.items():
+        entries = []
+        for count, job in sorted(jobs, reverse=True):
+            for pool in sorted(job_pools.get(job, ())) or [""]:
+                found = correlate_pool(pool, resources) if pool else {}
+                entries.append(
+                    {
+                        "job": job or "-",
+                        "series": int(count),
+                        "pool": pool or "-",
+                        "resource": resource_label(found.get("resource")),
+                        "owner": found.get("owner", "-"),
+                    }
+                )
+        sources[name] = entries
+    return sources
+
+
+def _delta(now: int, before: int | None) -> str:
+    if before is None:
+        return "new"
+    diff = now - before
+    if not diff:
+        return ""
+    pct = f" ({diff / before:+.0%})" if before else ""
+    return f"{diff:+,d}{pct}"
+
+
+def _print(
+    tsdb: dict[str, Any],
+    sources: dict[str, list[dict[str, Any]]],
+    baseline: dict[str, Any] | None,
+    saved: bool,
+) -> None:
+    base = baseline or {}
+    total = tsdb.get("totalSeries", 0)
+    series = f"{total:,}"
+    if baseline:
+        series = f"{series} {_delta(total, base['totalSeries'])}".strip()
+        note = f"{age(time.time() - base['taken'])} ago"
+        if saved:
+            note += ", replaced by this report"
+    else:
+        note = "saved now (growth shows on the next run)"
+    pairs = [
+        ("Series", series),
+        ("Label-value pairs", f"{tsdb.get('totalLabelValuePairs', 0):,}"),
+        ("Baseline", note),
+    ]
+    kv(pairs)
+
+    for field, title in _SECTIONS.items():
+        entries = tsdb.get(field) or []
+        if not entries:
+            continue
+        before = base.get(field, {})
+        section(title)
+        rows = []
+        for entry in entries:
+            name, value = entry["name"], entry["value"]
+            row = [truncate(name, 70), f"{value:,}"]
+            if baseline:
+                row.append(_delta(value, before.get(name)))
+            if field == "seriesCountByMetricName":
+                row.extend(_source_columns(sources.get(name, [])))
+            rows.append(row)
+        headers = ["NAME", "COUNT"] + (["GROWTH"] if baseline else [])
+        if field == "seriesCountByMetricName":
+            headers += ["JOB", "SCRAPE RESOURCE", "OWNER"]
+        table(headers, rows)
+
+    if not tsdb.get("seriesCountByMetricName"):
+        info("No series matched.")
+
+
+def _source_columns(entries: list[dict[str, Any]]) -> list[str]:
+    if not entries:
+        return ["-", "-", "-"]
+    first = entries[0]
+    more = f" (+{len(entries) - 1})" if len(entries) > 1 else ""
+    return [first["job"] + more, first["resource"], first["owner"]]
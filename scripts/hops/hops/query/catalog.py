@@ -0,0 +1,144 @@
+"""Cached metric-name and label-value catalog with search.
+
+The name list behind ``hops query metrics`` is every series name in the
+TSDB, which runs to several MB on a busy cluster, and it barely changes
+between invocations. The catalog keeps each label-value list in the hops
+cache and refreshes it incrementally: after ``_TTL`` only names seen since
+the last fetch are requested (``start``), and a full fetch after
+``_FULL_TTL`` drops names that left retention. Per-metric series counts
+from ``/api/v1/status/tsdb`` ride along for ranking.
+"""
+
+from __future__ import annotations
+
+import time
+from bisect import bisect_left
+
+from hops.core import cache
+from hops.core.runner import gather
+from hops.core.vm import VMSINGLE_URL, query_vm
+
+_BUCKET = "metric-catalog"
+_TTL = 10 * 60
+_FULL_TTL = 24 * 3600
+# Incremental fetches start a little before the previous one
+_OVERLAP = 5 * 60
+# Largest per-metric breakdown /api/v1/status/tsdb returns
+_TSDB_TOP = 1000
+# Minimum share of the pattern's trigrams a fuzzy match must contain
+_FUZZY_MIN = 0.5
+
+
+def _key() -> str:
+    return cache.content_key(_BUCKET, VMSINGLE_URL)
+
+
+class Catalog:
+    """Cached label values plus series counts per metric name."""
+
+    def __init__(self, refresh: bool = False):
+        data = None if refresh else cache.load(_BUCKET, _key())
+        self._data: dict = data or {"values": {}, "series": {}, "series_at": 0}
+        self._dirty = False
+
+    def values(self, label: str | None, match: str | None = None) -> list[str]:
+        """Values of ``label`` (label names when None), optionally scoped to
+        series matching the ``match`` selector, sorted."""
+        slot = f"{label or ''}\0{match or ''}"
+        entry = self._data["values"].get(slot)
+        now = time.time()
+        if entry and now - entry["fetched"] < _TTL:
+            return entry["values"]
+
+        endpoint = f"/api/v1/label/{label}/values" if label else "/api/v1/labels"
+        params = {"match[]": match} if match else {}
+        incremental = entry and now - entry["full"] < _FULL_TTL
+        if incremental:
+            params["start"] = str(int(entry["fetched"] - _OVERLAP))
+        fetched = query_vm(endpoint, params).get("data") or []
+        if incremental:
+            fetched = sorted(set(entry["values"]).union(fetched))
+        else:
+            fetched = sorted(fetched)
+        self._data["values"][slot] = {
+            "fetched": now,
+            "full": entry["full"] if incremental else now,
+            "values": fetched,
+        }
+        self._dirty = True
+        return fetched
+
+    def metric_names(self) -> list[str]:
+        """Metric names, refreshing series counts alongside them."""
+        if time.time() - self._data["series_at"] < _TTL:
+            return self.values("__name__")
+        names, tsdb = gather(
+            lambda: self.values("__name__"),
+            lambda: query_vm("/api/v1/status/tsdb", {"topN": str(_TSDB_TOP)}),
+        )
+        top = tsdb.get("data", {}).get("seriesCountByMetricName") or []
+        self._data["series"] = {e["name"]: e["value"] for e in top}
+        self._data["series_at"] = time.time()
+        self._dirty = True
+        return names
+
+    def series(self, name: str) -> int | None:
+        """Series count for a metric, None when outside the TSDB top list."""
+        return self._data["series"].get(name)
+
+    def save(self) -> None:
+        if self._dirty:
+            cache.store(_BUCKET, _key(), self._data)
+            self._dirty = False
+
+
+def search(values: list[str], pattern: str) -> tuple[list[str], bool]:
+    """Case-insensitive search of sorted ``values``.
+
+    A leading ``^`` anchors a prefix, answered by bisecting a lowercased
+    copy. Otherwise a substring match; when nothing matches, names sharing
+    most of the pattern's trigrams are returned instead, best first, and
+    the second element is True to mark the result as fuzzy.
+    """
+    p = pattern.lower()
+    lowered = [v.lower() for v in values]
+    if p.startswith("^"):
+        return _prefix(values, lowered, p[1:]), False
+    hits = [v for v, low in zip(values, lowered, strict=True) if p in low]
+    if hits or len(p) < 3:
+        return hits, False
+    return _fuzzy(values, lowered, p), True
+
+
+def _prefix(values: list[str], lowered: list[str], prefix: str) -> list[str]:
+    order = sorted(range(len(values)), key=lowered.__getitem__)
+    keys = [lowered[i] for i in order]
+    hits = []
+    for pos in range(bisect_left(keys, prefix), len(keys)):
+        if not keys[pos].startswith(prefix):
+            break
+        hits.append(values[order[pos]])
+    return hits
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def _fuzzy(values: list[str], lowered: list[str], pattern: str) -> list[str]:
+    # Inverted trigram index: only names sharing a trigram are scored
+    wanted = _trigrams(pattern)
+    index: dict[str, list[int]] = {}
+    for i, low in enumerate(lowered):
+        for gram in _trigrams(low) & wanted:
+            index.setdefault(gram, []).append(i)
+    shared: dict[int, int] = {}
+    for gram in wanted:
+        for i in index.get(gram, ()):
+            shared[i] = shared.get(i, 0) + 1
+    need = len(wanted) * _FUZZY_MIN
+    ranked = sorted(
+        (i for i, n in shared.items() if n >= need),
+        key=lambda i: (-shared[i], len(values[i]), values[i]),
+    )
+    return [values[i] for i in ranked]
@@ -6,19 +6,31 @@ Queries VictoriaLogs using LogSQL syntax via kubectl exec.
 from __future__ import annotations
 
 import json
+from functools import partial
 
 import click
 
 from hops._click import HelpfulGroup
-from hops.core.format import info
+from hops.core.format import info, table, truncate
+from hops.core.logsql import (
+    DEFAULT_WINDOW,
+    bounded,
+    plan_query,
+    quote_field,
+    stream_fields,
+)
+from hops.core.runner import gather
+from hops.core.time import duration_seconds
+from hops.core.vlogs import VictoriaLogsClient
 from hops.core.workload import resolve_app
-from hops.query._client import VictoriaLogsClient
 from hops.query.logs_render import (
+    _print_hits_sparklines,
     _print_hits_table,
     _print_matrix_table,
     _print_vector,
     format_log_entry,
 )
+from hops.query.logs_sample import MAX_SLICES, cardinality, sample
 
 
 def build_query_from_filters(
@@ -28,37 +40,24 @@ def build_query_from_filters(
     container: str | None = None,
     level: str | None = None,
     search: str | None = None,
+    stream: frozenset[str] = frozenset(),
 ) -> str:
-    filters = []
-    if app:
-        filters.append(f'app="{app}"')
-    if namespace:
-        filters.append(f'kubernetes.pod_namespace="{namespace}"')
-    if pod:
-        filters.append(f'kubernetes.pod_name="{pod}"')
-    if container:
-        filters.append(f'kubernetes.container_name="{container}"')
-    if level:
-        filters.append(f'level="{level}"')
-    query = "{" + ",".join(filters) + "}" if filters else "*"
-    if search:
-        query = f"{query} AND {search}"
-    return query
+    """LogSQL for the basic filters; only ``stream`` fields go in ``{...}``."""
+    values = {
+        "app": app,
+        "kubernetes.pod_namespace": namespace,
+        "kubernetes.pod_name": pod,
+        "kubernetes.container_name": container,
+        "level": level,
+    }
+    filters = {k: v for k, v in values.items() if v}
+    return plan_query(filters, search, stream)
 
 
 _VECTOR_OPT_IN_LABEL = "observability.home-ops/logs"
 _VECTOR_SIDECAR_NAME = "vector"
 
 
-def _has_vector_sidecar(pod_spec: dict) -> bool:
-    """Check if the pod spec includes a Vector sidecar container."""
-    for container_list in ("containers", "initContainers"):
-        for c in pod_spec.get(container_list, []):
-            if c.get("name") == _VECTOR_SIDECAR_NAME:
-                return True
-    return False
-
-
 def _require_vector_collection(app: str) -> None:
     """Verify the app exists and Vector is collecting its logs."""
     wl = resolve_app(app)
@@ -66,14 +65,11 @@ def _require_vector_collection(app: str) -> None:
         info(f"error: no workload matching {app!r} found in cluster")
         raise SystemExit(1)
 
-    labels = wl.pod_labels()
-    pod_spec = wl.pod_spec()
-
     # Path 1: daemonset collection via opt-in label
-    if labels.get(_VECTOR_OPT_IN_LABEL) == "true":
+    if wl.labels.get(_VECTOR_OPT_IN_LABEL) == "true":
         return
     # Path 2: Vector sidecar container
-    if _has_vector_sidecar(pod_spec):
+    if _VECTOR_SIDECAR_NAME in wl.containers:
         return
 
     info(
@@ -88,6 +84,8 @@ def _require_vector_collection(app: str) -> None:
 
 # --- Click commands ---
 
+_FROM_HELP = f"Start time (e.g., 5m, 1h, ISO timestamp; default {DEFAULT_WINDOW})"
+
 
 @click.group(cls=HelpfulGroup)
 def cli():
@@ -107,7 +105,13 @@ def cli():
 )
 @click.option("--search", help="Additional search term")
 @click.option("-n", "--limit", type=int, help="Max results")
-@click.option("--from", "time_from", help="Start time (e.g., 5m, 1h, ISO timestamp)")
+@click.option(
+    "--sample",
+    "sample_size",
+    type=click.IntRange(min=1),
+    help=f"N entries spread over up to {MAX_SLICES} slices of the window",
+)
+@click.option("--from", "time_from", help=_FROM_HELP)
 @click.option("--to", "time_to", help="End time")
 @click.option("--detail", is_flag=True, help="Show all VRL-processed fields")
 @click.option("--all-fields", is_flag=True, help="Show raw JSON per entry")
@@ -121,22 +125,37 @@ def query_cmd(
     level: str | None,
     search: str | None,
     limit: int | None,
+    sample_size: int | None,
     time_from: str | None,
     time_to: str | None,
     detail: bool,
     all_fields: bool,
     json_mode: bool,
 ):
-    """Query logs. Use filters (--app, --level) or raw LogSQL."""
+    """Query logs. Use filters (--app, --level) or raw LogSQL.
+
+    Results are the newest entries; --sample spreads them over the window.
+    """
     has_filters = any([app, namespace, pod, container, level, search])
     if has_filters and logsql:
         info("error: cannot mix basic filters with LogSQL query")
         raise SystemExit(1)
+    if sample_size and limit:
+        info("error: --sample and --limit are mutually exclusive")
+        raise SystemExit(1)
 
     if has_filters:
         if app:
             _require_vector_collection(app)
-        query = build_query_from_filters(app, namespace, pod, container, level, search)
+        query = build_query_from_filters(
+            app,
+            namespace,
+            pod,
+            container,
+            level,
+            search,
+            stream_fields(VictoriaLogsClient()),
+        )
     elif logsql:
         query = logsql
     else:
@@ -144,7 +163,12 @@ def query_cmd(
         raise SystemExit(1)
 
     client = VictoriaLogsClient()
-    logs = client.query_logs(query, start=time_from, end=time_to, limit=limit)
+    start, defaulted = bounded(time_from, time_to)
+    slice_count = 0
+    if sample_size:
+        logs, slice_count = sample(client, query, start, time_to, sample_size)
+    else:
+        logs = client.query_logs(query, start=start, end=time_to, limit=limit)
 
     if json_mode:
         for log in logs:
@@ -155,18 +179,25 @@ def query_cmd(
                 click.echo()
             click.echo(format_log_entry(log, detail=detail, all_fields=all_fields))
 
-    info(f"\nTotal: {len(logs)} log entries")
+    window = ""
+    if defaulted:
+        span = f"{DEFAULT_WINDOW} before --to" if time_to else f"last {start}"
+        window = f" ({span}; widen with --from)"
+    sampled = f" sampled from {slice_count} slices" if slice_count else ""
+    info(f"\nTotal: {len(logs)} log entries{sampled}{window}")
 
 
 @cli.command()
 @click.argument("query")
-@click.option("--from", "time_from", help="Start time (e.g., 5m, 1h, ISO timestamp)")
+@click.option("--from", "time_from", help=_FROM_HELP)
 @click.option("--to", "time_to", help="End time")
 @click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
 def stats(query: str, time_from: str | None, time_to: str | None, json_mode: bool):
     """Query log statistics (requires stats pipe in query)."""
     client = VictoriaLogsClient()
-    result = client.query_stats(query, start=time_from, end=time_to)
+    result = client.query_stats(
+        query, start=bounded(time_from, time_to)[0], end=time_to
+    )
     if json_mode:
         click.echo(json.dumps(result, indent=2))
         return
@@ -176,7 +207,7 @@ def stats(query: str, time_from: str | None, time_to: str | None, json_mode: boo
 
 @cli.command("stats-range")
 @click.argument("query")
-@click.option("--from", "time_from", help="Start time")
+@click.option("--from", "time_from", help=_FROM_HELP)
 @click.option("--to", "time_to", help="End time")
 @click.option("--step", default="1h", help="Aggregation interval")
 @click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
@@ -185,7 +216,9 @@ def stats_range(
 ):
     """Query log statistics over a time range."""
     client = VictoriaLogsClient()
-    result = client.query_stats_range(query, start=time_from, end=time_to, step=step)
+    result = client.query_stats_range(
+        query, start=bounded(time_from, time_to)[0], end=time_to, step=step
+    )
     if json_mode:
         click.echo(json.dumps(result, indent=2))
         return
@@ -195,10 +228,16 @@ def stats_range(
 
 @cli.command()
 @click.argument("query")
-@click.option("--from", "time_from", help="Start time")
+@click.option("--from", "time_from", help=_FROM_HELP)
 @click.option("--to", "time_to", help="End time")
 @click.option("--step", default="1h", help="Time bucket size")
 @click.option("--field", multiple=True, help="Group by field (repeatable)")
+@click.option(
+    "--top",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Sparklines for the N most frequent values of one --field",
+)
 @click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
 def hits(
     query: str,
@@ -206,13 +245,40 @@ def hits(
     time_to: str | None,
     step: str,
     field: tuple[str, ...],
+    top: int | None,
     json_mode: bool,
 ):
-    """Query hit statistics over time."""
+    """Query hit statistics over time.
+
+    With --top, a stats query ranks the values of --field first and hit
+    buckets are fetched only for the top N, concurrently.
+    """
     client = VictoriaLogsClient()
+    start = bounded(time_from, time_to)[0]
+    if top:
+        if len(field) != 1:
+            info("error: --top needs exactly one --field")
+            raise SystemExit(1)
+        try:
+            seconds = duration_seconds(step)
+        except ValueError as e:
+            info(f"error: --step: {e}")
+            raise SystemExit(1) from None
+        counts, responses = _top_hits(
+            client, query, field[0], top, start, time_to, step
+        )
+        if json_mode:
+            result = [
+                {"value": value, "total": total, "hits": data.get("hits", [])}
+                for (value, total), data in zip(counts, responses)
+            ]
+            click.echo(json.dumps(result, indent=2))
+            return
+        _print_hits_sparklines(field[0], counts, responses, seconds)
+        return
     result = client.query_hits(
         query,
-        start=time_from,
+        start=start,
         end=time_to,
         step=step,
         field=list(field) if field else None,
@@ -223,13 +289,80 @@ def hits(
     _print_hits_table(result)
 
 
+def _top_hits(
+    client: VictoriaLogsClient,
+    query: str,
+    field: str,
+    top: int,
+    start: str,
+    end: str | None,
+    step: str,
+) -> tuple[list[tuple[str, int]], list[dict]]:
+    """The ``top`` values of ``field`` by count, and a hits series for each."""
+    stats = client.query_stats(
+        f"{query} | stats by ({quote_field(field)}) count() hits", start, end
+    )
+    counts = sorted(
+        (
+            (r.get("metric", {}).get(field, ""), int(float(r["value"][1])))
+            for r in stats.get("data", {}).get("result", [])
+        ),
+        key=lambda c: (-c[1], c[0]),
+    )[:top]
+    stream = stream_fields(client)
+    responses = gather(
+        *(
+            partial(
+                client.query_hits,
+                f"({query}) AND {plan_query({field: value}, None, stream)}",
+                start=start,
+                end=end,
+                step=step,
+            )
+            for value, _ in counts
+        )
+    )
+    return counts, responses
+
+
 @cli.command()
 @click.argument("query")
-@click.option("--from", "time_from", help="Start time")
+@click.option("--from", "time_from", help=_FROM_HELP)
 @click.option("--to", "time_to", help="End time")
-def fields(query: str, time_from: str | None, time_to: str | None):
-    """List field names from query results."""
+@click.option(
+    "--sample",
+    "sample_size",
+    type=click.IntRange(min=1),
+    help="Field cardinality from N entries spread over the window",
+)
+def fields(
+    query: str, time_from: str | None, time_to: str | None, sample_size: int | None
+):
+    """List field names from query results.
+
+    With --sample, also show how many distinct values each field has and
+    its most common value, from a spread sample instead of the full index.
+    """
     client = VictoriaLogsClient()
-    result = client.query_field_names(query, start=time_from, end=time_to)
+    start = bounded(time_from, time_to)[0]
+    if sample_size:
+        logs, slice_count = sample(client, query, start, time_to, sample_size)
+        if not logs:
+            info("No log entries in the window")
+            return
+        table(
+            ["FIELD", "SEEN", "DISTINCT", "TOP VALUE"],
+            [
+                [name, f"{seen / len(logs):.0%}", str(distinct), _top(top, count)]
+                for name, seen, distinct, top, count in cardinality(logs)
+            ],
+        )
+        info(f"\nFrom {len(logs)} entries sampled across {slice_count} slices")
+        return
+    result = client.query_field_names(query, start=start, end=time_to)
     for field in result:
         click.echo(f"{field['value']:30s} {field['hits']:>12,} hits")
+
+
+def _top(value: str, count: int) -> str:
+    return f"{truncate(value, 50)} (x{count})"
@@ -6,10 +6,15 @@ Pure formatting functions with no click dependency.
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import math
+from datetime import UTC, datetime
 
 from hops.core.format import info, table
 
+# Empty bucket, then eight rising levels (output stays ASCII)
+_SPARK = "_.:-=+*#@"
+_SPARK_WIDTH = 48
+
 
 def format_log_entry(log: dict, detail: bool = False, all_fields: bool = False) -> str:
     """Format a log entry for display."""
@@ -182,3 +187,68 @@ def _print_hits_table(data: dict) -> None:
             for ts, val in zip(timestamps, values):
                 rows.append([_format_ts(ts), str(val)])
             table(["TIME", "COUNT"], rows)
+
+
+def sparkline(values: list[int], width: int = _SPARK_WIDTH) -> str:
+    """One character per bucket, scaled to the series' own peak.
+
+    More than ``width`` buckets are folded into runs showing each run's
+    busiest bucket, so a short spike survives and a partial last run does
+    not read as a drop; any non-zero bucket gets at least the lowest level.
+    """
+    if len(values) > width:
+        k = math.ceil(len(values) / width)
+        values = [max(values[i : i + k]) for i in range(0, len(values), k)]
+    peak = max(values, default=0)
+    levels = len(_SPARK) - 1
+    return "".join(
+        _SPARK[math.ceil(v / peak * levels) if peak and v > 0 else 0] for v in values
+    )
+
+
+def _epoch(ts: str | float) -> float:
+    if isinstance(ts, str):
+        return datetime.fromisoformat(ts).timestamp()
+    return float(ts)
+
+
+def _clock(ts: float, dated: bool) -> str:
+    """Epoch as UTC HH:MM, like the hits table; ``dated`` prefixes MM-DD."""
+    return datetime.fromtimestamp(ts, UTC).strftime("%m-%d %H:%M" if dated else "%H:%M")
+
+
+def _print_hits_sparklines(
+    field: str, counts: list[tuple[str, int]], responses: list[dict], step: int
+) -> None:
+    """One sparkline row per top value over a shared, gap-filled time axis.
+
+    The hits endpoint omits empty buckets, so buckets are placed by their
+    offset from the earliest timestamp in ``step`` seconds. Times are UTC
+    and carry the date when the span crosses a day.
+    """
+    stamps = [
+        _epoch(ts)
+        for data in responses
+        for hit in data.get("hits", [])
+        for ts in hit.get("timestamps", [])
+    ]
+    if not stamps:
+        info("No hits")
+        return
+    first = min(stamps)
+    size = round((max(stamps) - first) / step) + 1
+    last = first + (size - 1) * step
+    days = {datetime.fromtimestamp(ts, UTC).date() for ts in (first, last)}
+    dated = len(days) > 1
+    rows = []
+    for (value, total), data in zip(counts, responses):
+        buckets = [0] * size
+        for hit in data.get("hits", []):
+            for ts, n in zip(hit.get("timestamps", []), hit.get("values", [])):
+                buckets[round((_epoch(ts) - first) / step)] += n
+        peak = max(buckets)
+        at = _clock(first + buckets.index(peak) * step, dated) if peak else "-"
+        rows.append([value or "(empty)", str(total), str(peak), at, sparkline(buckets)])
+    sep = " to " if dated else "-"
+    span = f"HITS {_clock(first, dated)}{sep}{_clock(last, dated)} UTC"
+    table([field.upper(), "TOTAL", "PEAK", "PEAK AT", span], rows)
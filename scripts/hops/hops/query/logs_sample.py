@@ -0,0 +1,117 @@
+"""Representative log samples spread over a time window.
+
+A plain query with ``limit`` returns the newest entries only, so a noisy
+minute at the end of the window hides everything before it. ``sample``
+splits the window into evenly spaced slices and fetches a few entries
+from each concurrently; ``cardinality`` summarizes which fields those
+entries carry and how many distinct values each has.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+from functools import partial
+from itertools import pairwise
+from typing import Any
+
+from hops.core.model import epoch
+from hops.core.runner import gather
+from hops.core.time import TimeRange
+from hops.core.vlogs import VictoriaLogsClient
+
+# Upper bound on slices (and concurrent requests) per sample
+MAX_SLICES = 12
+
+_FMT = "%Y-%m-%dT%H:%M:%S.%fZ"
+
+
+def slices(start: str, end: str | None, count: int) -> list[tuple[datetime, datetime]]:
+    """Up to ``count`` equal, adjacent [start, end) bounds over the window.
+
+    Each slice ends where the next begins. The count is capped at the
+    window's length in seconds, so a short window never yields slices
+    narrower than a second.
+    """
+    first, last = TimeRange(start, end).bounds()
+    count = max(1, min(count, int((last - first).total_seconds())))
+    width = (last - first) / count
+    edges = [first + width * i for i in range(count)] + [last]
+    return list(pairwise(edges))
+
+
+def sample(
+    client: VictoriaLogsClient, query: str, start: str, end: str | None, size: int
+) -> tuple[list[dict[str, Any]], int]:
+    """About ``size`` entries spread across the window, oldest first.
+
+    Each slice is limited to its share of ``size``, so a busy slice cannot
+    crowd out a quiet one. Returns the entries and the number of slices.
+    """
+    bounds = slices(start, end, min(size, MAX_SLICES))
+    share, extra = divmod(size, len(bounds))
+    results = gather(
+        *(
+            partial(
+                _slice,
+                client,
+                query,
+                lo,
+                hi,
+                share + (i < extra),
+                exclusive=i < len(bounds) - 1,
+            )
+            for i, (lo, hi) in enumerate(bounds)
+        )
+    )
+    logs = [log for batch in results for log in batch]
+    logs.sort(key=lambda log: log.get("_time", ""))
+    return logs, len(bounds)
+
+
+def _slice(
+    client: VictoriaLogsClient,
+    query: str,
+    lo: datetime,
+    hi: datetime,
+    limit: int,
+    exclusive: bool,
+) -> list[dict[str, Any]]:
+    """Newest ``limit`` entries in [lo, hi), or [lo, hi] for the last slice.
+
+    The API's end bound is inclusive, so an entry exactly on an inner edge
+    would also belong to the next slice; one extra entry is fetched to make
+    up for dropping it here.
+    """
+    if not limit:
+        return []
+    logs = client.query_logs(
+        query,
+        start=lo.strftime(_FMT),
+        end=hi.strftime(_FMT),
+        limit=limit + exclusive,
+    )
+    if exclusive:
+        edge = hi.timestamp()
+        logs = [log for log in logs if epoch(log.get("_time")) < edge]
+    logs.sort(key=lambda log: log.get("_time", ""))
+    return logs[-limit:]
+
+
+def cardinality(
+    logs: list[dict[str, Any]],
+) -> list[tuple[str, int, int, str, int]]:
+    """Per field: (name, entries carrying it, distinct values, top value, top count).
+
+    Sorted by how many entries carry the field, then name.
+    """
+    values: dict[str, Counter[str]] = {}
+    for log in logs:
+        for key, value in log.items():
+            values.setdefault(key, Counter())[str(value)] += 1
+    rows = []
+    for name, counter in values.items():
+        top, top_count = counter.most_common(1)[0]
+        rows.append((name, counter.total(), len(counter), top, top_count))
+    rows.sort(key=lambda r: (-r[1], r[0]))
+    return rows
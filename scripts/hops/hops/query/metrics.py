@@ -7,15 +7,24 @@ import json
 import click
 
 from hops._click import HelpfulGroup
-from hops.core.format import human_bytes, info, kv
+from hops.core.format import human_bytes, info, kv, table
 from hops.core.time import TimeRange, time_options
-from hops.query._vm import query_vm
+from hops.core.vm import query_vm
+from hops.query.catalog import Catalog, search
 from hops.query.metrics_render import (
     _print_matrix,
     compact_labels,
     format_cpu,
     format_value,
+    print_summary,
 )
+from hops.query.series import Matrix
+
+# Series shown by `query`: the value grid is wide, a summary is one line each
+_MAX_SERIES = 20
+_MAX_SUMMARY_SERIES = 100
+
+_FILTER_HELP = "Filter pattern (case-insensitive; ^ anchors a prefix)"
 
 # --- Container stats helper ---
 
@@ -140,12 +149,18 @@ def memory(
     "--step", default="auto", help="Step interval for range queries (default: auto)"
 )
 @click.option("--hide-zero", is_flag=True, help="Hide all-zero series")
+@click.option(
+    "--summary",
+    is_flag=True,
+    help="Per-series min/max/avg/last instead of the value grid (range queries)",
+)
 @click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
 @time_options(support_at=True)
 def raw_query(
     promql: str,
     step: str,
     hide_zero: bool,
+    summary: bool,
     json_mode: bool,
     time_from: str | None,
     time_to: str | None,
@@ -172,76 +187,117 @@ def raw_query(
         info("No results")
         return
 
+    if result_type != "matrix":
+        info(f"{result_type}, {len(results)} series")
+        click.echo()
+        for r in results[:_MAX_SERIES]:
+            metric = r.get("metric", {})
+            labels = compact_labels(metric)
+            value = r.get("value", [None, "N/A"])
+            click.echo(f"{{{labels}}} => {format_value(value[1])}")
+        if len(results) > _MAX_SERIES:
+            info(f"... {len(results) - _MAX_SERIES} more series")
+        return
+
+    matrix = Matrix.decode(results)
     suffix = ""
-    if hide_zero and result_type == "matrix":
-        original_count = len(results)
-        results = [
-            r for r in results if any(float(val) != 0 for _, val in r.get("values", []))
-        ]
-        hidden = original_count - len(results)
+    if hide_zero:
+        original_count = len(matrix)
+        matrix = matrix.nonzero()
+        hidden = original_count - len(matrix)
         suffix = f" ({hidden} all-zero hidden)" if hidden else ""
-        if not results:
+        if not len(matrix):
             info(f"No results (all {original_count} series were zero)")
             return
 
-    info(f"{result_type}, {len(results)} series{suffix}")
+    info(f"{result_type}, {len(matrix)} series{suffix}")
     click.echo()
 
-    max_series = 20
-    if result_type == "matrix":
-        _print_matrix(results[:max_series])
+    max_series = _MAX_SUMMARY_SERIES if summary else _MAX_SERIES
+    if summary:
+        print_summary(matrix.head(max_series))
     else:
-        for r in results[:max_series]:
-            metric = r.get("metric", {})
-            labels = compact_labels(metric)
-            value = r.get("value", [None, "N/A"])
-            click.echo(f"{{{labels}}} => {format_value(value[1])}")
-
-    if len(results) > max_series:
-        info(f"... {len(results) - max_series} more series")
+        _print_matrix(matrix.head(max_series))
+    if len(matrix) > max_series:
+        info(f"... {len(matrix) - max_series} more series")
 
 
 @cli.command()
 @click.argument("name", required=False)
+@click.option("-f", "--filter", "pattern", default=None, help=_FILTER_HELP)
+@click.option("-m", "--match", default=None, help="Only series matching this selector")
+@click.option("--refresh", is_flag=True, help="Ignore the cached catalog")
 @click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
-def labels(name: str | None, json_mode: bool):
+def labels(
+    name: str | None,
+    pattern: str | None,
+    match: str | None,
+    refresh: bool,
+    json_mode: bool,
+):
     """List label names or values for a specific label."""
-    if name:
-        data = query_vm(f"/api/v1/label/{name}/values")
-        title = f"Values for '{name}'"
-    else:
-        data = query_vm("/api/v1/labels")
-        title = "All labels"
-
-    values = data.get("data", [])
+    catalog = Catalog(refresh)
+    values = catalog.values(name, match)
+    catalog.save()
+    title = f"Values for '{name}'" if name else "All labels"
+    fuzzy = False
+    if pattern:
+        values, fuzzy = search(values, pattern)
+        title += f" matching '{pattern}'"
 
     if json_mode:
         click.echo(json.dumps(values, indent=2))
         return
 
-    info(f"{title} ({len(values)} total)")
+    _print_matches(title, pattern, values, fuzzy)
     for v in values:
         click.echo(v)
 
 
 @cli.command("metrics")
+@click.option("-f", "--filter", "pattern", default=None, help=_FILTER_HELP)
 @click.option(
-    "-f", "--filter", "pattern", default=None, help="Filter pattern (case-insensitive)"
+    "--by-series",
+    is_flag=True,
+    help="Rank by series count (cardinality) and show the counts",
 )
+@click.option("--refresh", is_flag=True, help="Ignore the cached catalog")
 @click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
-def list_metrics(pattern: str | None, json_mode: bool):
-    """List metric names with optional filter."""
-    data = query_vm("/api/v1/label/__name__/values")
-    values = data.get("data", [])
+def list_metrics(pattern: str | None, by_series: bool, refresh: bool, json_mode: bool):
+    """List metric names with optional filter.
+
+    Names and series counts come from a local catalog that is refreshed
+    incrementally every few minutes; --refresh forces a full fetch.
+    """
+    catalog = Catalog(refresh)
+    values = catalog.metric_names()
+    catalog.save()
+    fuzzy = False
     if pattern:
-        p = pattern.lower()
-        values = [v for v in values if p in v.lower()]
+        values, fuzzy = search(values, pattern)
+    if by_series:
+        values = sorted(values, key=lambda v: -(catalog.series(v) or -1))
 
     if json_mode:
         click.echo(json.dumps(values, indent=2))
         return
 
     title = f"Metrics matching '{pattern}'" if pattern else "All metrics"
-    info(f"{title} ({len(values)} total)")
+    _print_matches(title, pattern, values, fuzzy)
+    if by_series:
+        table(
+            ["METRIC", "SERIES"],
+            [[v, str(catalog.series(v) or "-")] for v in values],
+        )
+        return
     for v in values:
         click.echo(v)
+
+
+def _print_matches(
+    title: str, pattern: str | None, values: list[str], fuzzy: bool
+) -> None:
+    if fuzzy:
+        info(f"No exact match for '{pattern}'; closest ({len(values)}):")
+    else:
+        info(f"{title} ({len(values)} total)")
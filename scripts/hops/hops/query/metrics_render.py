@@ -7,6 +7,9 @@ from datetime import datetime, timezone
 
 import click
 
+from hops.core.format import table
+from hops.query.series import Matrix
+
 # Labels that are always noise in investigation output
 _NOISE_LABELS = frozenset(
     {
@@ -40,10 +43,17 @@ def format_value(val: str) -> str:
         f = float(val)
     except (ValueError, TypeError):
         return val
-    if math.isnan(f):
-        return "NaN"
     if abs(f) == float("inf"):
         return val
+    return format_number(f)
+
+
+def format_number(f: float) -> str:
+    """Format a decoded sample; see format_value for the string form."""
+    if math.isnan(f):
+        return "NaN"
+    if math.isinf(f):
+        return "+Inf" if f > 0 else "-Inf"
     if f == int(f) and abs(f) < 1e15:
         return str(int(f))
     abs_f = abs(f)
@@ -64,18 +74,12 @@ def format_cpu(value: float) -> str:
     return f"{value:.2f}"
 
 
-def _print_matrix(results: list[dict]) -> None:
-    if not results:
+def _print_matrix(matrix: Matrix) -> None:
+    if not len(matrix) or not len(matrix.timestamps):
         return
 
     max_points = 50
-    all_values = results[0].get("values", [])
-    if not all_values:
-        return
-
-    timestamps = [float(ts) for ts, _ in all_values[:max_points]]
-    if not timestamps:
-        return
+    timestamps, rows, stride = matrix.downsample(max_points)
 
     prev_date = ""
     time_headers: list[str] = []
@@ -89,12 +93,11 @@ def _print_matrix(results: list[dict]) -> None:
             prev_date = date_str
         time_headers.append(time_str)
 
-    series_labels = [compact_labels(r.get("metric", {})) for r in results]
-    col_width = 8
-    for r in results:
-        for _, val in r.get("values", [])[:max_points]:
-            col_width = max(col_width, len(format_value(val)))
-    col_width += 1
+    series_labels = [compact_labels(m) for m in matrix.labels]
+    # Format every cell once; gaps (NaN) render blank
+    cells = [["" if math.isnan(v) else format_number(v) for v in row] for row in rows]
+    col_width = max((len(c) for row in cells for c in row), default=0)
+    col_width = max(col_width, 8) + 1
 
     label_width = max((len(lb) for lb in series_labels), default=5)
     label_width = max(label_width, 5)
@@ -105,15 +108,22 @@ def _print_matrix(results: list[dict]) -> None:
     click.echo(header)
     click.echo("-" * len(header))
 
-    for i, r in enumerate(results):
-        values = r.get("values", [])
-        val_map = {float(ts): val for ts, val in values[:max_points]}
-        row = series_labels[i].ljust(label_width) + " | "
-        row += " ".join(
-            format_value(val_map.get(ts, "")).rjust(col_width) for ts in timestamps
+    for label, row in zip(series_labels, cells, strict=True):
+        click.echo(
+            label.ljust(label_width) + " | " + " ".join(c.rjust(col_width) for c in row)
         )
-        click.echo(row)
 
-    total_points = len(results[0].get("values", []))
-    if total_points > max_points:
-        click.echo(f"... ({total_points} total points, showing first {max_points})")
+    if stride > 1:
+        click.echo(
+            f"... ({len(matrix.timestamps)} total points, showing 1 in {stride})"
+        )
+
+
+def print_summary(matrix: Matrix) -> None:
+    """One row of min/max/avg/last per series instead of the raw grid."""
+    rows = []
+    for i, metric in enumerate(matrix.labels):
+        stats = matrix.stats(i)
+        values = ["-"] * 4 if stats is None else [format_number(v) for v in stats]
+        rows.append([compact_labels(metric), *values, str(matrix.present[i])])
+    table(["SERIES", "MIN", "MAX", "AVG", "LAST", "POINTS"], rows)
@@ -0,0 +1,72 @@
+"""vmalert rule health and evaluation cost."""
+
+from __future__ import annotations
+
+import json
+import sys
+from dataclasses import asdict
+
+import click
+
+from hops.core.format import info
+from hops.core.time import TimeRange, time_options
+from hops.core.vm import query_vmalert
+from hops.query import rules_cost, rules_render
+
+
+@click.command("rules")
+@click.option("-g", "--group", help="Filter to groups matching this substring")
+@click.option("--all", "show_all", is_flag=True, help="Include healthy inactive rules")
+@click.option(
+    "--cost",
+    is_flag=True,
+    help="Rank groups and rules by evaluation time over --from (default 6h)",
+)
+@click.option("--top", default=15, show_default=True, help="Rows per --cost table")
+@click.option("--json", "json_mode", is_flag=True, help="Output raw JSON")
+@time_options()
+def rules(
+    group: str | None,
+    show_all: bool,
+    cost: bool,
+    top: int,
+    json_mode: bool,
+    time_from: str | None,
+    time_to: str | None,
+    **_,
+):
+    """Rule health: evaluation errors, firing/pending rules, slow evaluations.
+
+    With --cost, profile evaluation cost from vmalert's own metrics instead:
+    total iteration time per group, how close each group runs to its
+    interval, and the rules that account for it. Group totals are measured;
+    per-rule totals are extrapolated from each rule's last evaluation time
+    times its group's iterations over the window.
+    """
+    if (time_from or time_to) and not cost:
+        info("error: --from/--to only apply with --cost")
+        sys.exit(1)
+    data = query_vmalert("/api/v1/rules")
+    groups = data.get("data", {}).get("groups", [])
+
+    if json_mode and not cost:
+        click.echo(json.dumps(groups, indent=2))
+        return
+
+    all_rules = rules_render.flatten(groups)
+    if group:
+        all_rules = [r for r in all_rules if group.lower() in r["group"].lower()]
+        if not all_rules:
+            info(f"error: no rule group matching {group!r}")
+            sys.exit(1)
+    if not cost:
+        rules_render.render(all_rules, show_all)
+        return
+
+    time_range = TimeRange.from_options(time_from or "6h", time_to)
+    window = time_range.to_duration()
+    costs = rules_cost.profile(all_rules, window, time_range.to_instant_params())
+    if json_mode:
+        click.echo(json.dumps([asdict(g) for g in costs], indent=2))
+        return
+    rules_cost.render(costs, time_range.describe(), top)
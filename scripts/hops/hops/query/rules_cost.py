@@ -0,0 +1,230 @@
+"""Rule evaluation cost profile from vmalert's own metrics.
+
+The ``/api/v1/rules`` snapshot holds one evaluation per rule, so a rule
+that is slow once looks like a rule that is slow always. vmalert exports
+per-group iteration durations and per-rule sample and series counts, which
+VictoriaMetrics already scrapes; summing those over a window shows where
+evaluation time actually goes and which groups are close to overrunning
+their interval.
+
+Group totals are measured. vmalert keeps no per-rule duration history, so a
+rule's total is an extrapolation: its last evaluation time multiplied by the
+group's iteration count over the window.
+
+Groups are keyed by (file, name), since two rule files may each define a
+group with the same name and vmalert evaluates them independently.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Any
+
+import click
+
+from hops.core.format import info, kv, table
+from hops.core.runner import gather
+from hops.core.vm import query_vm
+
+# Mean iteration time over interval at which a group is flagged
+_NEAR_INTERVAL = 0.8
+
+_RULE_METRIC = "vmalert_{kind}_rules_last_evaluation_{what}"
+
+
+@dataclass
+class GroupCost:
+    name: str
+    file: str
+    interval: float
+    seconds: float = 0.0
+    iterations: float = 0.0
+    rules: list[RuleCost] = field(default_factory=list)
+
+    @property
+    def mean(self) -> float:
+        return self.seconds / self.iterations if self.iterations else 0.0
+
+    @property
+    def budget(self) -> float:
+        """Mean iteration time as a share of the group interval."""
+        return self.mean / self.interval if self.interval else 0.0
+
+
+@dataclass
+class RuleCost:
+    name: str
+    group: str
+    type: str
+    eval_time: float
+    samples: float = 0.0
+    series: float = 0.0
+    # Extrapolated seconds over the window: last evaluation time x iterations
+    seconds: float = 0.0
+
+
+def profile(
+    rules: list[dict[str, Any]], window: str, at: dict[str, str] | None = None
+) -> list[GroupCost]:
+    """Group and rule costs over ``window``, most expensive group first.
+
+    ``at`` pins every instant query to the end of the window (see
+    ``TimeRange.to_instant_params``); without it the window ends now.
+    """
+    at = at or {}
+    group_seconds, group_iterations, samples, series = gather(
+        lambda: _by(
+            "sum by (file, group) "
+            f"(increase(vmalert_iteration_duration_seconds_sum[{window}]))",
+            at,
+        ),
+        lambda: _by(
+            "sum by (file, group) "
+            f"(increase(vmalert_iteration_duration_seconds_count[{window}]))",
+            at,
+        ),
+        lambda: _rule_max("samples", window, at),
+        lambda: _rule_max("series_fetched", window, at),
+    )
+
+    groups: dict[tuple[str, str], GroupCost] = {}
+    for rule in rules:
+        name, group = rule.get("name", "?"), rule.get("group", "?")
+        key = (rule.get("file", ""), group)
+        cost = groups.get(key)
+        if cost is None:
+            cost = groups[key] = GroupCost(
+                group, key[0], float(rule.get("interval") or 0)
+            )
+            cost.seconds = _get(group_seconds, key)
+            cost.iterations = _get(group_iterations, key)
+        cost.rules.append(
+            RuleCost(
+                name,
+                group,
+                rule.get("type", "?"),
+                float(rule.get("evaluationTime") or 0),
+                _get(samples, (*key, name)),
+                _get(series, (*key, name)),
+            )
+        )
+    for cost in groups.values():
+        for rule in cost.rules:
+            rule.seconds = rule.eval_time * cost.iterations
+    return sorted(groups.values(), key=lambda g: -g.seconds)
+
+
+def _get(values: dict[tuple[str, ...], float], key: tuple[str, ...]) -> float:
+    """Look up a (file, group, ...) key, falling back to series without a file
+    label (vmalert releases that predate it)."""
+    if key in values:
+        return values[key]
+    return values.get(("", *key[1:]), 0.0)
+
+
+def _by(query: str, at: dict[str, str]) -> dict[tuple[str, ...], float]:
+    data = query_vm("/api/v1/query", {"query": query, **at})
+    return {
+        (r["metric"].get("file", ""), r["metric"].get("group", "")): float(
+            r["value"][1]
+        )
+        for r in data.get("data", {}).get("result", [])
+    }
+
+
+def _rule_max(
+    what: str, window: str, at: dict[str, str]
+) -> dict[tuple[str, str], float]:
+    """Peak per-rule count over the window, keyed by (file, group, rule name)."""
+    names = "|".join(
+        _RULE_METRIC.format(kind=kind, what=what) for kind in ("recording", "alerting")
+    )
+    data = query_vm(
+        "/api/v1/query",
+        {
+            "query": (
+                "max by (file, group, recording, alertname) "
+                f'(max_over_time({{__name__=~"{names}"}}[{window}]))'
+            ),
+            **at,
+        },
+    )
+    result = {}
+    for r in data.get("data", {}).get("result", []):
+        metric = r.get("metric", {})
+        rule = metric.get("recording") or metric.get("alertname") or ""
+        result[(metric.get("file", ""), metric.get("group", ""), rule)] = float(
+            r["value"][1]
+        )
+    return result
+
+
+def render(groups: list[GroupCost], window: str, top: int) -> None:
+    """Print group budgets and the costliest rules."""
+    total = sum(g.seconds for g in groups)
+    hot = [g for g in groups if g.budget >= _NEAR_INTERVAL]
+    kv(
+        [
+            ("Window", window),
+            ("Evaluation time", f"{total:.1f}s across {len(groups)} groups"),
+            ("Near interval", f"{len(hot)} groups >= {_NEAR_INTERVAL:.0%}"),
+        ]
+    )
+    if not total:
+        info("No vmalert iteration metrics in the window (is vmalert scraped?)")
+
+    labels = _labels(groups)
+    click.echo("\nGroups by evaluation time:")
+    table(
+        ["GROUP", "TOTAL", "SHARE", "ITERATIONS", "MEAN", "INTERVAL", "BUDGET"],
+        [
+            [
+                labels[id(g)],
+                f"{g.seconds:.1f}s",
+                f"{g.seconds / total:.0%}" if total else "-",
+                f"{g.iterations:.0f}",
+                f"{g.mean:.3f}s",
+                f"{g.interval:g}s" if g.interval else "?",
+                f"{g.budget:.0%}" + (" (!)" if g.budget >= _NEAR_INTERVAL else ""),
+            ]
+            for g in groups[:top]
+        ],
+    )
+
+    rules = sorted(
+        ((r, labels[id(g)]) for g in groups for r in g.rules),
+        key=lambda pair: (-pair[0].seconds, -pair[0].series, pair[0].name),
+    )
+    click.echo(
+        "\nRules by estimated evaluation time"
+        " (EST TOTAL = last evaluation x group iterations, not measured):"
+    )
+    table(
+        ["RULE", "GROUP", "TYPE", "LAST EVAL", "EST TOTAL", "SERIES", "SAMPLES"],
+        [
+            [
+                r.name,
+                label,
+                r.type,
+                f"{r.eval_time:.3f}s",
+                f"{r.seconds:.1f}s",
+                f"{r.series:.0f}",
+                f"{r.samples:.0f}",
+            ]
+            for r, label in rules[:top]
+        ],
+    )
+
+
+def _labels(groups: list[GroupCost]) -> dict[int, str]:
+    """Group names for display, with the rule file appended where two files
+    define a group of the same name."""
+    names = Counter(g.name for g in groups)
+    return {
+        id(g): f"{g.name} ({PurePosixPath(g.file).name})"
+        if names[g.name] > 1 and g.file
+        else g.name
+        for g in groups
+    }
@@ -7,7 +7,7 @@ from typing import Any
 import click
 
 from hops.core.format import age_str, info, kv, table, truncate
-from hops.query._vm import is_ignored_alert
+from hops.core.vm import is_ignored_alert
 
 SLOW_EVAL_SECONDS = 1.0
 
@@ -15,7 +15,12 @@ SLOW_EVAL_SECONDS = 1.0
 def flatten(groups: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Flatten the group/rule nesting, carrying group context onto each rule."""
     return [
-        {**rule, "group": group.get("name", "?"), "interval": group.get("interval")}
+        {
+            **rule,
+            "group": group.get("name", "?"),
+            "file": group.get("file", ""),
+            "interval": group.get("interval"),
+        }
         for group in groups
         for rule in group.get("rules", [])
     ]
@@ -1,4 +1,4 @@
-"""Correlate zero-target vmagent pools with live scrape resources."""
+"""Correlate zero-target vmagent pools with live scrape resources and causes."""
 
 from __future__ import annotations
 
@@ -8,8 +8,9 @@ from typing import Any
 import click
 
 from hops.core.format import info, table
-from hops.core.runner import kubectl_json
-from hops.query._vm import query_vm
+from hops.core.runner import gather, kubectl_json
+from hops.core.vm import query_vm
+from hops.query.scrape_targets import TargetIndex, no_target_reason
 
 _SCRAPE_RESOURCES = (
     "vmservicescrapes,vmpodscrapes,vmnodescrapes,vmprobes,vmstaticscrapes"
@@ -35,13 +36,59 @@ def _pool_key(pool: str) -> tuple[str, str, str] | None:
     return _POOL_KINDS[parts[0]], parts[1], parts[2]
 
 
+# Flux labels naming the object that applied a resource
+_FLUX_OWNER_LABELS = (
+    ("helm.toolkit.fluxcd.io", "HelmRelease"),
+    ("kustomize.toolkit.fluxcd.io", "Kustomization"),
+)
+
+
 def _owner(resource: dict[str, Any]) -> str:
-    owners = resource.get("metadata", {}).get("ownerReferences", [])
-    if not owners:
+    """Controller owners, else the Flux object that applied the resource."""
+    metadata = resource.get("metadata", {})
+    owners = metadata.get("ownerReferences", [])
+    if owners:
+        return ",".join(
+            f"{owner.get('kind', '?')}/{owner.get('name', '?')}" for owner in owners
+        )
+    labels = metadata.get("labels") or {}
+    for prefix, kind in _FLUX_OWNER_LABELS:
+        name = labels.get(f"{prefix}/name")
+        if name:
+            namespace = labels.get(f"{prefix}/namespace", "")
+            return f"{kind}/{namespace}/{name}" if namespace else f"{kind}/{name}"
+    return "-"
+
+
+def index_scrape_resources() -> dict[tuple[str, str, str], dict[str, Any]]:
+    """Live scrape resources keyed by (kind, namespace, name)."""
+    resources = kubectl_json(_SCRAPE_RESOURCES).get("items", [])
+    return {_resource_key(item): item for item in resources}
+
+
+def correlate_pool(
+    pool: str, resource_index: dict[tuple[str, str, str], dict[str, Any]]
+) -> dict[str, Any]:
+    """Match a scrape pool to its live resource and owner.
+
+    State is STALE when no resource backs the pool, ORPHAN when the resource
+    has no owner, and OWNED otherwise.
+    """
+    key = _pool_key(pool)
+    resource = resource_index.get(key) if key else None
+    if not resource:
+        return {"pool": pool, "resource": None, "state": "STALE"}
+    owner = _owner(resource)
+    state = "ORPHAN" if owner == "-" else "OWNED"
+    return {"pool": pool, "resource": resource, "owner": owner, "state": state}
+
+
+def resource_label(resource: dict[str, Any] | None) -> str:
+    """Display a scrape resource as kind/namespace/name."""
+    if not resource:
         return "-"
-    return ",".join(
-        f"{owner.get('kind', '?')}/{owner.get('name', '?')}" for owner in owners
-    )
+    kind, namespace, name = _resource_key(resource)
+    return f"{kind}/{namespace}/{name}"
 
 
 @click.command("scrape-pools")
@@ -50,10 +97,19 @@ def _owner(resource: dict[str, Any]) -> str:
     "--json", "as_json", is_flag=True, help="Output correlated findings as JSON"
 )
 def scrape_pools(namespace: str | None, as_json: bool) -> None:
-    """Show zero-target pools with their live scrape resources and owners."""
-    data = query_vm(
-        "/api/v1/query",
-        {"query": ("sum by (scrape_job) (vm_promscrape_scrape_pool_targets) == 0")},
+    """Show zero-target pools, their live scrape resources, owners and why.
+
+    The pool query and every scrape CRD are fetched concurrently; Services,
+    Endpoints and Pods are then fetched once, from the namespaces the
+    findings select from, and each pool's selector is evaluated against
+    them in memory.
+    """
+    data, resource_index = gather(
+        lambda: query_vm(
+            "/api/v1/query",
+            {"query": "sum by (scrape_job) (vm_promscrape_scrape_pool_targets) == 0"},
+        ),
+        index_scrape_resources,
     )
     pools = sorted(
         {
@@ -62,26 +118,16 @@ def scrape_pools(namespace: str | None, as_json: bool) -> None:
             if result.get("metric", {}).get("scrape_job")
         }
     )
-    resources = kubectl_json(_SCRAPE_RESOURCES).get("items", [])
-    resource_index = {_resource_key(item): item for item in resources}
-
     findings = []
     for pool in pools:
         key = _pool_key(pool)
         if namespace and (not key or key[1] != namespace):
             continue
-        if not key:
-            findings.append({"pool": pool, "resource": None, "state": "STALE"})
-            continue
-        resource = resource_index.get(key)
-        if not resource:
-            findings.append({"pool": pool, "resource": None, "state": "STALE"})
-            continue
-        owner = _owner(resource)
-        state = "ORPHAN" if owner == "-" else "OWNED"
-        findings.append(
-            {"pool": pool, "resource": resource, "owner": owner, "state": state}
-        )
+        findings.append(correlate_pool(pool, resource_index))
+
+    targets = TargetIndex.fetch([f["resource"] for f in findings if f["resource"]])
+    for finding in findings:
+        finding["reason"] = no_target_reason(finding["resource"], targets)
 
     if as_json:
         click.echo(json.dumps(findings, indent=2))
@@ -92,21 +138,16 @@ def scrape_pools(namespace: str | None, as_json: bool) -> None:
         info(f"No zero-target scrape pools{suffix}")
         return
 
-    rows = []
-    for finding in findings:
-        resource = finding["resource"]
-        live_resource = "-"
-        if resource:
-            kind, resource_namespace, name = _resource_key(resource)
-            live_resource = f"{kind}/{resource_namespace}/{name}"
-        rows.append(
-            [
-                finding["pool"],
-                live_resource,
-                finding.get("owner", "-"),
-                finding["state"],
-            ]
-        )
+    rows = [
+        [
+            finding["pool"],
+            resource_label(finding["resource"]),
+            finding.get("owner", "-"),
+            finding["state"],
+            finding["reason"],
+        ]
+        for finding in findings
+    ]
 
     info(f"Zero-target scrape pools: {len(findings)}")
-    table(["POOL", "LIVE RESOURCE", "OWNER", "STATE"], rows)
+    table(["POOL", "LIVE RESOURCE", "OWNER", "STATE", "REASON"], rows)
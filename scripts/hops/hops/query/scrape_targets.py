@@ -0,0 +1,248 @@
+"""Explain why a scrape resource discovers no targets.
+
+VMServiceScrape and VMPodScrape select Services or Pods by label, in their
+own namespace unless ``namespaceSelector`` widens it, and pick a named
+port. ``TargetIndex`` fetches Services, Endpoints and Pods once for the
+whole audit, only from the namespaces the audited resources select from
+(all of them only for ``namespaceSelector.any``) and projected to labels,
+port names, phase and address counts. ``no_target_reason`` walks the
+selector chain against it in memory, so auditing every zero-target pool
+costs a constant number of API calls instead of several per pool.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any
+
+from hops.core.runner import gather, kubectl_rows
+
+_SERVICE_COLUMNS = [
+    "{.metadata.namespace}",
+    "{.metadata.name}",
+    "{.metadata.labels}",
+    '{range .spec.ports[*]}{.name}{","}{end}',
+]
+# One "r" per ready and one "n" per not-ready address
+_ENDPOINT_COLUMNS = [
+    "{.metadata.namespace}",
+    "{.metadata.name}",
+    (
+        "{range .subsets[*]}"
+        '{range .addresses[*]}{"r"}{end}'
+        '{range .notReadyAddresses[*]}{"n"}{end}'
+        "{end}"
+    ),
+]
+_POD_COLUMNS = [
+    "{.metadata.namespace}",
+    "{.metadata.name}",
+    "{.metadata.labels}",
+    '{range .spec.containers[*]}{range .ports[*]}{.name}{","}{end}{end}',
+    "{.status.phase}",
+]
+
+
+@dataclass
+class Target:
+    """A Service or Pod as far as scrape discovery looks at it."""
+
+    namespace: str
+    name: str
+    labels: dict[str, str]
+    # Named service ports, or named container ports of a pod
+    ports: set[str] = field(default_factory=set)
+    phase: str = ""
+
+    @classmethod
+    def from_row(cls, row: list[str]) -> Target:
+        namespace, name, labels, ports, *phase = row
+        return cls(
+            namespace,
+            name,
+            json.loads(labels or "{}"),
+            {p for p in ports.split(",") if p},
+            phase[0] if phase else "",
+        )
+
+
+def selector_matches(selector: dict[str, Any], labels: dict[str, str]) -> bool:
+    """Evaluate a Kubernetes label selector (matchLabels + matchExpressions)."""
+    for key, value in (selector.get("matchLabels") or {}).items():
+        if labels.get(key) != value:
+            return False
+    for expr in selector.get("matchExpressions") or []:
+        key, op = expr.get("key", ""), expr.get("operator", "")
+        values = expr.get("values") or []
+        if op == "In" and labels.get(key) not in values:
+            return False
+        if op == "NotIn" and labels.get(key) in values:
+            return False
+        if op == "Exists" and key not in labels:
+            return False
+        if op == "DoesNotExist" and key in labels:
+            return False
+    return True
+
+
+def _describe(selector: dict[str, Any]) -> str:
+    terms = [f"{k}={v}" for k, v in (selector.get("matchLabels") or {}).items()]
+    for expr in selector.get("matchExpressions") or []:
+        values = ",".join(expr.get("values") or [])
+        terms.append(f"{expr.get('key')} {expr.get('operator')} ({values})".strip())
+    return ", ".join(terms) or "(empty)"
+
+
+def _by_namespace(targets: list[Target]) -> dict[str, list[Target]]:
+    grouped: dict[str, list[Target]] = {}
+    for target in targets:
+        grouped.setdefault(target.namespace, []).append(target)
+    return grouped
+
+
+def _selected_namespaces(resource: dict[str, Any]) -> list[str] | None:
+    """Namespaces a scrape resource selects from; None means all."""
+    ns_selector = resource.get("spec", {}).get("namespaceSelector") or {}
+    if ns_selector.get("any"):
+        return None
+    own = resource["metadata"].get("namespace", "")
+    return ns_selector.get("matchNames") or [own]
+
+
+class TargetIndex:
+    """Services, Endpoints and Pods grouped by namespace, fetched once."""
+
+    def __init__(
+        self,
+        services: list[Target],
+        endpoints: dict[tuple[str, str], tuple[int, int]],
+        pods: list[Target],
+    ):
+        self.services = _by_namespace(services)
+        self.pods = _by_namespace(pods)
+        # (namespace, name) -> (ready, not ready) address counts
+        self.endpoints = endpoints
+
+    @classmethod
+    def fetch(cls, resources: list[dict[str, Any]]) -> TargetIndex:
+        """Fetch what the given scrape resources can select, concurrently."""
+        scopes: dict[str, set[str] | None] = {}
+        for resource in resources:
+            kind = resource.get("kind", "")
+            if kind not in ("VMServiceScrape", "VMPodScrape"):
+                continue
+            selected = _selected_namespaces(resource)
+            if selected is None or (kind in scopes and scopes[kind] is None):
+                scopes[kind] = None
+            else:
+                scopes[kind] = scopes.get(kind, set()) | set(selected)
+
+        def rows(resource: str, columns: list[str], kind: str) -> list[list[str]]:
+            if kind not in scopes:
+                return []
+            namespaces = scopes[kind]
+            if namespaces is None:
+                return kubectl_rows(resource, columns)
+            fetched = gather(
+                *(
+                    lambda ns=ns: kubectl_rows(resource, columns, namespace=ns)
+                    for ns in sorted(namespaces)
+                )
+            )
+            return [row for found in fetched for row in found]
+
+        services, endpoints, pods = gather(
+            lambda: rows("services", _SERVICE_COLUMNS, "VMServiceScrape"),
+            lambda: rows("endpoints", _ENDPOINT_COLUMNS, "VMServiceScrape"),
+            lambda: rows("pods", _POD_COLUMNS, "VMPodScrape"),
+        )
+        return cls(
+            [Target.from_row(row) for row in services],
+            {
+                (ns, name): (addresses.count("r"), addresses.count("n"))
+                for ns, name, addresses in endpoints
+            },
+            [Target.from_row(row) for row in pods],
+        )
+
+    def namespaces(self, resource: dict[str, Any]) -> list[str]:
+        """Namespaces a scrape resource selects from."""
+        selected = _selected_namespaces(resource)
+        if selected is None:
+            return sorted(set(self.services) | set(self.pods))
+        return selected
+
+
+def no_target_reason(resource: dict[str, Any] | None, index: TargetIndex) -> str:
+    """First broken link between a scrape resource and its targets."""
+    if not resource:
+        return "no live scrape resource (stale pool)"
+    kind = resource.get("kind", "")
+    if kind == "VMServiceScrape":
+        return _service_reason(resource, index)
+    if kind == "VMPodScrape":
+        return _pod_reason(resource, index)
+    return "-"
+
+
+def _service_reason(resource: dict[str, Any], index: TargetIndex) -> str:
+    spec = resource.get("spec", {})
+    selector = spec.get("selector") or {}
+    namespaces = index.namespaces(resource)
+    services = [
+        svc
+        for ns in namespaces
+        for svc in index.services.get(ns, [])
+        if selector_matches(selector, svc.labels)
+    ]
+    if not services:
+        where = ",".join(namespaces)
+        return f"no service matches {_describe(selector)} in {where}"
+
+    wanted = [ep["port"] for ep in spec.get("endpoints", []) if ep.get("port")]
+    if wanted:
+        named = {port for svc in services for port in svc.ports}
+        if not named.intersection(wanted):
+            have = ", ".join(sorted(named)) or "unnamed ports only"
+            return f"no service port named {wanted[0]} (have: {have})"
+
+    ready = not_ready = 0
+    for svc in services:
+        counts = index.endpoints.get((svc.namespace, svc.name), (0, 0))
+        ready += counts[0]
+        not_ready += counts[1]
+    if not ready:
+        if not_ready:
+            return f"no ready endpoints ({not_ready} not ready)"
+        return "no endpoints (selected pods missing or not running)"
+    return "targets exist; check relabeling and vmagent logs"
+
+
+def _pod_reason(resource: dict[str, Any], index: TargetIndex) -> str:
+    spec = resource.get("spec", {})
+    selector = spec.get("selector") or {}
+    namespaces = index.namespaces(resource)
+    pods = [
+        pod
+        for ns in namespaces
+        for pod in index.pods.get(ns, [])
+        if selector_matches(selector, pod.labels)
+    ]
+    if not pods:
+        where = ",".join(namespaces)
+        return f"no pod matches {_describe(selector)} in {where}"
+
+    wanted = [
+        ep["port"] for ep in spec.get("podMetricsEndpoints", []) if ep.get("port")
+    ]
+    if wanted:
+        named = {port for pod in pods for port in pod.ports}
+        if not named.intersection(wanted):
+            have = ", ".join(sorted(named)) or "unnamed ports only"
+            return f"no container port named {wanted[0]} (have: {have})"
+
+    running = [p for p in pods if p.phase == "Running"]
+    if not running:
+        return f"no running pods ({len(pods)} matched)"
+    return "targets exist; check relabeling and vmagent logs"
@@ -0,0 +1,114 @@
+"""Compact numeric form of range-query (matrix) results.
+
+The API returns every sample as a ``[timestamp, "string"]`` pair per series.
+``Matrix`` decodes that once into one shared timestamp axis and a float
+``array`` per series, NaN where a series has no sample, so filtering,
+summaries and display downsampling run over machine doubles with C-level
+builtins (``count``, ``min``, slicing) instead of re-parsing strings.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from itertools import filterfalse
+
+_NAN = math.nan
+
+
+class Matrix:
+    """Series labels plus aligned float rows over shared timestamps."""
+
+    __slots__ = ("labels", "present", "rows", "timestamps")
+
+    def __init__(
+        self,
+        timestamps: array,
+        labels: list[dict[str, str]],
+        rows: list[array],
+        present: list[int],
+    ):
+        self.timestamps = timestamps
+        self.labels = labels
+        self.rows = rows
+        # Samples each series actually returned (the rest are NaN gaps)
+        self.present = present
+
+    @classmethod
+    def decode(cls, results: list[dict]) -> Matrix:
+        """Decode ``data.result`` of a matrix response.
+
+        Range-query samples sit on ``start + k*step``, so when every series
+        has the first one's length and endpoints the axes are identical and
+        the union is skipped. Series covering the whole axis convert in one
+        pass; only series with gaps place samples individually.
+        """
+        series = [r.get("values", []) for r in results]
+        first = series[0] if series else []
+        if all(
+            len(v) == len(first) and v[0][0] == first[0][0] and v[-1][0] == first[-1][0]
+            for v in series
+            if v
+        ):
+            axis = [ts for ts, _ in first]
+        else:
+            axis = sorted({ts for values in series for ts, _ in values})
+        blank = array("d", [_NAN]) * len(axis)
+        slot: dict[float, int] = {}
+        rows, present = [], []
+        for values in series:
+            if len(values) == len(axis):
+                row = array("d", [float(val) for _, val in values])
+            else:
+                slot = slot or {ts: i for i, ts in enumerate(axis)}
+                row = array("d", blank)
+                for ts, val in values:
+                    row[slot[ts]] = float(val)
+            rows.append(row)
+            present.append(len(values))
+        labels = [r.get("metric", {}) for r in results]
+        return cls(array("d", axis), labels, rows, present)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def head(self, n: int) -> Matrix:
+        return Matrix(self.timestamps, self.labels[:n], self.rows[:n], self.present[:n])
+
+    def nonzero(self) -> Matrix:
+        """Drop series whose every sample is exactly zero.
+
+        Gaps are NaN, never 0.0, so a series is all-zero when its zero count
+        equals its sample count; ``array.count`` does the scan in C.
+        """
+        keep = [
+            i for i, row in enumerate(self.rows) if row.count(0.0) != self.present[i]
+        ]
+        return Matrix(
+            self.timestamps,
+            [self.labels[i] for i in keep],
+            [self.rows[i] for i in keep],
+            [self.present[i] for i in keep],
+        )
+
+    def stats(self, i: int) -> tuple[float, float, float, float] | None:
+        """(min, max, avg, last) of a series ignoring gaps; None when empty."""
+        row = self.rows[i]
+        if self.present[i] == len(row) and not any(map(math.isnan, row)):
+            finite = row
+        else:
+            finite = array("d", filterfalse(math.isnan, row))
+        if not finite:
+            return None
+        return min(finite), max(finite), math.fsum(finite) / len(finite), finite[-1]
+
+    def downsample(self, max_points: int) -> tuple[array, list[array], int]:
+        """Every k-th column so at most ``max_points`` remain; returns k too."""
+        stride = max(1, math.ceil(len(self.timestamps) / max_points))
+        if stride == 1:
+            return self.timestamps, self.rows, 1
+        return (
+            self.timestamps[::stride],
+            [row[::stride] for row in self.rows],
+            stride,
+        )
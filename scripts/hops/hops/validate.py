@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import hashlib
 import platform
 import sys
 import tarfile
@@ -11,14 +12,29 @@ from pathlib import Path
 import click
 
 from hops._click import HelpfulGroup
+from hops.core import cache
 from hops.core.format import info
-from hops.core.runner import run
+from hops.core.runner import gather, run
+from hops.core.yamlpath import lookup, split_documents
 
 # vmalert binary lives in the scripts directory
 _SCRIPTS_DIR = Path(__file__).parent.parent
 _VMALERT_BINARY = _SCRIPTS_DIR / "vmalert"
 _DEFAULT_VMRULES_DIR = "kubernetes/apps/observability/vmrules"
 
+# Concurrent vmalert processes when re-checking files one by one
+_MAX_DRY_RUNS = 8
+
+
+def _vmrule_specs(text: str) -> list[str]:
+    """The .spec subtree of every document in a VMRule file."""
+    specs = []
+    for doc in split_documents(text):
+        spec = lookup(doc, "spec")
+        if spec:
+            specs.append(spec)
+    return specs
+
 
 def _detect_platform() -> str:
     """Detect OS and architecture for download."""
@@ -104,7 +120,8 @@ def cli():
 def vmrules(path: str, clean: bool):
     """Validate VMRule YAML files using vmalert -dryRun.
 
-    Automatically downloads vmalert binary if not present.
+    Automatically downloads vmalert binary if not present. All changed files
+    are checked in one vmalert run; results for unchanged files are cached.
     """
     if clean:
         if _VMALERT_BINARY.exists():
@@ -133,53 +150,95 @@ def vmrules(path: str, clean: bool):
         info(f"No VMRule files found in {path}")
         return
 
-    info(f"Validating {len(rule_files)} VMRule files in {path}")
+    # Unchanged files (same content, same vmalert binary) reuse past results
+    with _VMALERT_BINARY.open("rb") as f:
+        binary_id = hashlib.file_digest(f, "sha256").hexdigest()
+    results: dict[Path, list[str] | None] = {}
+    pending: dict[Path, list[str]] = {}
+    keys: dict[Path, str] = {}
+    for rule_file in rule_files:
+        text = rule_file.read_text()
+        keys[rule_file] = cache.content_key(binary_id, text)
+        entry = cache.load("vmrules", keys[rule_file])
+        if entry is not None:
+            results[rule_file] = entry["errors"]
+            continue
+        specs = _vmrule_specs(text)
+        if specs:
+            pending[rule_file] = specs
+        else:
+            results[rule_file] = ["no spec found"]
+
+    cached = len(rule_files) - len(pending)
+    suffix = f" ({cached} unchanged)" if cached else ""
+    info(f"Validating {len(rule_files)} VMRule files in {path}{suffix}")
 
-    # Check for yq
-    yq_check = run(["yq", "--version"], timeout=5, check=False)
-    if yq_check.returncode != 0:
-        info("error: yq is required for VMRule extraction")
-        raise SystemExit(1)
+    if pending:
+        for rule_file, errors in _validate_specs(pending).items():
+            results[rule_file] = errors
+            cache.store("vmrules", keys[rule_file], {"errors": errors})
 
     failed = False
     for rule_file in rule_files:
-        # Extract spec from VMRule CRD
-        with tempfile.NamedTemporaryFile(suffix=".yaml", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            result = run(
-                ["yq", "eval", ".spec", str(rule_file)],
-                timeout=10,
-                check=False,
-            )
-            if result.returncode != 0:
-                info(f"  FAIL {rule_file.name}: yq extraction failed")
-                failed = True
-                continue
-
-            Path(tmp_path).write_text(result.stdout)
-
-            # Validate with vmalert
-            val_result = run(
-                [str(_VMALERT_BINARY), f"-rule={tmp_path}", "-dryRun"],
-                timeout=15,
-                check=False,
-            )
-            if val_result.returncode == 0:
-                info(f"  OK   {rule_file.name}")
-            else:
-                info(f"  FAIL {rule_file.name}")
-                # Show validation errors
-                for line in (val_result.stderr or val_result.stdout or "").split("\n"):
-                    if any(w in line.lower() for w in ("error", "fail", "invalid")):
-                        info(f"       {line.strip()}")
-                failed = True
-        finally:
-            Path(tmp_path).unlink(missing_ok=True)
+        errors = results[rule_file]
+        if not errors:
+            info(f"  OK   {rule_file.name}")
+            continue
+        failed = True
+        info(f"  FAIL {rule_file.name}")
+        for line in errors:
+            info(f"       {line}")
 
     if failed:
         info("\nVMRule validation failed")
         raise SystemExit(1)
     else:
         info("\nAll VMRules are valid")
+
+
+def _validate_specs(pending: dict[Path, list[str]]) -> dict[Path, list[str]]:
+    """Validate extracted specs, returning error lines per source file.
+
+    Every spec is written to one temp directory and checked by a single
+    vmalert run. Only when that run fails are the files re-checked one per
+    process, a few at a time, to attribute the errors.
+    """
+    with tempfile.TemporaryDirectory(prefix="hops-vmrules-") as tmp:
+        tmp_files: dict[Path, Path] = {}
+        for n, (rule_file, specs) in enumerate(pending.items()):
+            tmp_file = Path(tmp) / f"{n:03d}-{rule_file.stem}.yaml"
+            tmp_file.write_text("\n---\n".join(specs) + "\n")
+            tmp_files[rule_file] = tmp_file
+
+        batch = _vmalert_dry_run(f"{tmp}/*.yaml", timeout=60)
+        if batch.returncode == 0:
+            return {rule_file: [] for rule_file in pending}
+
+        rule_files = list(tmp_files)
+        runs = gather(
+            *(lambda t=tmp_files[f]: _vmalert_dry_run(str(t)) for f in rule_files),
+            limit=_MAX_DRY_RUNS,
+        )
+        results = {}
+        for rule_file, result in zip(rule_files, runs):
+            if result.returncode == 0:
+                results[rule_file] = []
+                continue
+            output = result.stderr or result.stdout or ""
+            tmp_name = str(tmp_files[rule_file])
+            errors = [
+                line.strip().replace(tmp_name, rule_file.name)
+                for line in output.split("\n")
+                if any(w in line.lower() for w in ("error", "fail", "invalid"))
+            ]
+            results[rule_file] = errors or [f"vmalert exited {result.returncode}"]
+        return results
+
+
+def _vmalert_dry_run(rule: str, timeout: int = 15):
+    """Run vmalert -dryRun against a rule file or glob."""
+    return run(
+        [str(_VMALERT_BINARY), f"-rule={rule}", "-dryRun"],
+        timeout=timeout,
+        check=False,
+    )
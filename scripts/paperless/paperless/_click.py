@@ -4,9 +4,12 @@ from __future__ import annotations
 
 import importlib
 import pkgutil
+import sys
 
 import click
 
+from ._profile import span
+
 
 class HelpfulGroup(click.Group):
     """Click group that appends the failing command's help to usage errors."""
@@ -27,20 +30,30 @@ class HelpfulGroup(click.Group):
 class AutoGroup(HelpfulGroup):
     """Click group that discovers its subcommands by importing sibling modules.
 
-    On first command lookup every non-private module of ``package`` is
-    imported. A module exposing its own ``cli`` command is registered under
-    the module name; modules that instead decorate this group with
-    ``@cli.command`` register themselves as a side effect of the import.
-    That side effect is why the imports live here rather than at the top of
-    each package's ``__init__``, where they would be unreferenced names.
+    ``commands`` is an optional manifest mapping command names to
+    ``"module:attr"``. Looking up a command listed there imports only that
+    module, which keeps single-command invocations from paying for every
+    sibling's imports.
+
+    Otherwise (a name missing from the manifest, or listing commands for
+    help) every non-private module of ``package`` is imported. A module
+    exposing its own ``cli`` command is registered under the module name;
+    modules that instead decorate this group with ``@cli.command`` register
+    themselves as a side effect of the import. That side effect is why the
+    imports live here rather than at the top of each package's
+    ``__init__``, where they would be unreferenced names.
 
     A module that fails to import (missing optional dependency) is skipped
-    so the rest of the CLI stays usable.
+    so the rest of the CLI stays usable. ``manifest_for`` regenerates a
+    manifest from what discovery finds.
     """
 
-    def __init__(self, *args, package: str, **kwargs):
+    def __init__(
+        self, *args, package: str, commands: dict[str, str] | None = None, **kwargs
+    ):
         super().__init__(*args, **kwargs)
         self.package = package
+        self.manifest = commands or {}
         self._loaded = False
 
     def _load_plugins(self) -> None:
@@ -51,18 +64,52 @@ class AutoGroup(HelpfulGroup):
         for info in pkgutil.iter_modules(pkg.__path__):
             if info.name.startswith("_"):
                 continue
+            name = f"{self.package}.{info.name}"
             try:
-                mod = importlib.import_module(f"{self.package}.{info.name}")
+                with span("import", name):
+                    mod = importlib.import_module(name)
             except ImportError:
                 continue
             cmd = getattr(mod, "cli", None)
             if isinstance(cmd, click.Command) and cmd is not self:
                 self.add_command(cmd, info.name)
 
+    def _load_manifest_entry(self, cmd_name: str) -> click.Command | None:
+        target = self.manifest.get(cmd_name)
+        if not target:
+            return None
+        module, _, attr = target.partition(":")
+        try:
+            with span("import", module):
+                cmd = getattr(importlib.import_module(module), attr, None)
+        except ImportError:
+            return None
+        if not isinstance(cmd, click.Command):
+            return None
+        self.add_command(cmd, cmd_name)
+        return cmd
+
     def list_commands(self, ctx):
         self._load_plugins()
         return super().list_commands(ctx)
 
     def get_command(self, ctx, cmd_name):
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        if not self._loaded:
+            cmd = self._load_manifest_entry(cmd_name)
+            if cmd is not None:
+                return cmd
         self._load_plugins()
         return super().get_command(ctx, cmd_name)
+
+
+def manifest_for(group: AutoGroup) -> dict[str, str]:
+    """Build a ``commands`` manifest for a group from full discovery."""
+    group._load_plugins()
+    manifest = {}
+    for name, cmd in sorted(group.commands.items()):
+        module = sys.modules[cmd.callback.__module__]
+        attr = next(k for k, v in vars(module).items() if v is cmd)
+        manifest[name] = f"{module.__name__}:{attr}"
+    return manifest
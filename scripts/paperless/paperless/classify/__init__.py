@@ -6,7 +6,15 @@ import click
 
 from paperless._click import AutoGroup
 
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with paperless._click.manifest_for after adding commands.
+_COMMANDS = {
+    "apply": "paperless.classify.commands:apply",
+    "brief": "paperless.classify.commands:brief",
+    "inbox": "paperless.classify.commands:inbox",
+}
 
-@click.group(cls=AutoGroup, package="paperless.classify")
+
+@click.group(cls=AutoGroup, package="paperless.classify", commands=_COMMANDS)
 def cli() -> None:
     """AI-assisted document classification workflow."""
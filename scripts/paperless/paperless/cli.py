@@ -5,15 +5,34 @@ from __future__ import annotations
 import click
 
 from paperless._click import AutoGroup
+from paperless._profile import profile_options
+
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with paperless._click.manifest_for after adding commands.
+_COMMANDS = {
+    "bulk": "paperless.bulk:cli",
+    "classify": "paperless.classify:cli",
+    "config": "paperless.config:cli",
+    "correspondent": "paperless.correspondent:cli",
+    "doc": "paperless.doc:cli",
+    "field": "paperless.field:cli",
+    "group": "paperless.group:cli",
+    "tag": "paperless.tag:cli",
+    "type": "paperless.type:cli",
+    "user": "paperless.user:cli",
+    "workflow": "paperless.workflow:cli",
+}
 
 
 @click.group(
     cls=AutoGroup,
     package="paperless",
+    commands=_COMMANDS,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 @click.version_option(
     version=__import__("paperless").__version__, prog_name="paperless"
 )
+@profile_options
 def cli():
     """LLM-optimized Paperless-ngx document management CLI."""
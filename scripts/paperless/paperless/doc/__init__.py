@@ -6,7 +6,20 @@ import click
 
 from paperless._click import AutoGroup
 
+# Command name -> module:attr, so one lookup imports one module.
+# Regenerate with paperless._click.manifest_for after adding commands.
+_COMMANDS = {
+    "download": "paperless.doc.commands:download",
+    "list": "paperless.doc.commands:list_cmd",
+    "search": "paperless.doc.commands:search",
+    "show": "paperless.doc.commands:show",
+    "suggest": "paperless.doc.commands:suggest",
+    "tasks": "paperless.doc.commands:tasks",
+    "update": "paperless.doc.commands:update",
+    "upload": "paperless.doc.commands:upload",
+}
 
-@click.group(cls=AutoGroup, package="paperless.doc")
+
+@click.group(cls=AutoGroup, package="paperless.doc", commands=_COMMANDS)
 def cli() -> None:
     """List, search, upload, update, and inspect documents."""
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Fail when a CLI's lazy command manifest drifts from module discovery.
+
+Every AutoGroup in hops, hass and paperless carries a ``_COMMANDS`` manifest
+so resolving one command imports one module. A command missing from the
+manifest still works, but only by importing every module, so drift is
+silent. This compares each manifest with ``manifest_for`` (full discovery).
+
+Discovery skips modules that fail to import, which would read as drift, so
+every module of the package is imported first and import failures are
+reported as such.
+
+Run inside the project's environment, e.g.:
+    uv run --project scripts/hass python scripts/pre-commit/cli-manifest-check.py hass
+"""
+
+import importlib
+import pkgutil
+import sys
+
+import click
+
+
+def unimportable(package: str) -> list[str]:
+    root = importlib.import_module(package)
+    failures = []
+    for module in pkgutil.walk_packages(root.__path__, f"{package}."):
+        try:
+            importlib.import_module(module.name)
+        except ImportError as exc:
+            failures.append(f"cannot import {module.name}: {exc}")
+    return failures
+
+
+def check(package: str) -> list[str]:
+    failures = unimportable(package)
+    if failures:
+        return failures
+    helpers = importlib.import_module(f"{package}._click")
+    root = importlib.import_module(f"{package}.cli").cli
+    problems = []
+    stack = [(package, root)]
+    while stack:
+        path, group = stack.pop()
+        if isinstance(group, helpers.AutoGroup):
+            expected = helpers.manifest_for(group)
+            for name in sorted(expected.keys() | group.manifest.keys()):
+                want, have = expected.get(name), group.manifest.get(name)
+                if want != have:
+                    problems.append(
+                        f"{path} {name}: manifest {have!r}, discovered {want!r}"
+                    )
+        for name, cmd in group.commands.items():
+            if isinstance(cmd, click.Group):
+                stack.append((f"{path} {name}", cmd))
+    return problems
+
+
+def main() -> int:
+    failed = False
+    for package in sys.argv[1:]:
+        problems = check(package)
+        for problem in problems:
+            print(f"{package}: {problem}", file=sys.stderr)
+        failed = failed or bool(problems)
+    if failed:
+        print(
+            "Run in the project environment; regenerate manifests with "
+            "<package>._click.manifest_for",
+            file=sys.stderr,
+        )
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
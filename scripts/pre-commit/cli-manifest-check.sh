@@ -0,0 +1,10 @@
+#!/usr/bin/env bash
+# Check every Click CLI's command manifest inside its own uv environment.
+set -euo pipefail
+root="$(git rev-parse --show-toplevel)"
+status=0
+for project in hops hass paperless; do
+  uv run --quiet --project "$root/scripts/$project" \
+    python "$root/scripts/pre-commit/cli-manifest-check.py" "$project" || status=1
+done
+exit $status
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Check hops' YAML line index against PyYAML.
+
+hops looks up YAML paths through a line-span index (hops.core.yamlpath) and
+only asks yq when the index cannot answer. An index answer that is wrong is
+never corrected, so every answer it gives must match a real parse. This
+runs a set of known-tricky cases, then every path in kubernetes/**/*.yaml,
+and fails on any path where the index answers with the wrong value.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "scripts" / "hops"))
+
+from hops.core.yamlpath import build_index, indexed, split_documents
+
+CASES = {
+    "nested sequences": "nested:\n- - a\n  - b\n- - c: 1\n    d: 2\n  - e\n- x\n",
+    "compact sequence": "spec:\n  args:\n  - --a\n  - --b\n",
+    "flow collections": "command: [sh, -c]\nenv: {A: 1}\n",
+    "anchors and aliases": "base: &b\n  port: 80\nsvc:\n  <<: *b\n  ref: *b\n",
+    "anchored block": "probe: &p\n  path: /health\nother: *p\n",
+    "dotted keys": 'labels:\n  app.kubernetes.io/name: x\n  "a.b": 2\n',
+    "block scalars": "script: |\n  echo a\n  # not a key: x\nafter: 1\n",
+    "comment after key": "gateway: # disabled\n  enabled: false\n",
+}
+
+
+def paths(node, prefix=""):
+    if isinstance(node, dict):
+        for key, value in node.items():
+            key = str(key)
+            segment = json.dumps(key) if "." in key else key
+            path = f"{prefix}.{segment}" if prefix else segment
+            yield path, value
+            yield from paths(value, path)
+    elif isinstance(node, list):
+        for n, value in enumerate(node):
+            path = f"{prefix}[{n}]"
+            yield path, value
+            yield from paths(value, path)
+
+
+def _strip(node):
+    """Block scalars lose their final newline in index answers."""
+    if isinstance(node, str):
+        return node.rstrip("\n")
+    if isinstance(node, dict):
+        return {k: _strip(v) for k, v in node.items()}
+    if isinstance(node, list):
+        return [_strip(v) for v in node]
+    return node
+
+
+def agrees(answer: str, expected) -> bool:
+    if isinstance(expected, str) and answer.rstrip("\n") == expected.rstrip("\n"):
+        return True
+    try:
+        parsed = yaml.safe_load(answer)
+    except yaml.YAMLError:
+        return False
+    return _strip(parsed) == _strip(expected)
+
+
+def check(label: str, text: str) -> list[str]:
+    problems = []
+    for doc in split_documents(text):
+        try:
+            data = yaml.safe_load(doc)
+        except yaml.YAMLError:
+            continue
+        if not isinstance(data, dict):
+            continue
+        index = build_index(doc)
+        for path, expected in paths(data):
+            answer = indexed(doc, index, path)
+            if answer is not None and not agrees(answer, expected):
+                problems.append(f"{label}: {path}: index gave {answer[:60]!r}")
+    return problems
+
+
+def main() -> int:
+    problems = []
+    for label, text in CASES.items():
+        problems.extend(check(label, text))
+    for path in sorted((ROOT / "kubernetes").rglob("*.yaml")):
+        problems.extend(check(str(path.relative_to(ROOT)), path.read_text()))
+    for problem in problems:
+        print(problem, file=sys.stderr)
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())